@@ -96,7 +96,12 @@ class Buffer(Service):
             headers={"sentry-propagate-traces": False},
         )
 
-    def process_pending(self) -> None:
+    def process_pending(self, partition: int | None = None, num_partitions: int = 1) -> None:
+        """
+        Drain pending buffered increments. If `partition` is given, only drain the pending keys
+        belonging to that partition (out of `num_partitions`), so that draining can be spread
+        across multiple workers.
+        """
         return
 
     def process(
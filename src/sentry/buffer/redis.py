@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import atexit
+import itertools
 import logging
 import pickle
+import threading
+from collections import defaultdict
 from collections.abc import Callable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from time import time
 from typing import Any, TypeVar
@@ -177,6 +181,33 @@ class RedisBufferRouter:
 redis_buffer_router = RedisBufferRouter()
 
 
+@dataclass
+class CombinedIncr:
+    """
+    Increments for a single `(model, filters)` buffer key which have been combined in-process and
+    not yet written to Redis.
+    """
+
+    model: type[models.Model]
+    filters: dict[str, BufferField]
+    columns: dict[str, int] = field(default_factory=dict)
+    extra: dict[str, Any] = field(default_factory=dict)
+    signal_only: bool | None = None
+    num_incrs: int = 0
+
+    def add(
+        self, columns: dict[str, int], extra: dict[str, Any] | None, signal_only: bool | None
+    ) -> None:
+        for column, amount in columns.items():
+            self.columns[column] = self.columns.get(column, 0) + amount
+        if extra:
+            # Same as in Redis: last write wins
+            self.extra.update(extra)
+        if signal_only is True:
+            self.signal_only = True
+        self.num_incrs += 1
+
+
 class PendingBuffer:
     def __init__(self, size: int):
         assert size > 0
@@ -208,13 +239,34 @@ class RedisBuffer(Buffer):
     key_expire = 60 * 60  # 1 hour
     pending_key = "b:p"
 
-    def __init__(self, incr_batch_size: int = 2, **options: object):
+    def __init__(
+        self,
+        incr_batch_size: int = 2,
+        combine_window_seconds: float = 0,
+        combine_max_incrs: int = 1000,
+        **options: object,
+    ):
+        """
+        `combine_window_seconds` - If greater than 0, calls to `incr` are combined in-process for
+        up to this many seconds before being written to Redis, so that repeated increments to the
+        same `(model, filters)` key cost a single write. Combined increments are also flushed once
+        `combine_max_incrs` calls have been combined, and when the process exits.
+        """
         self.is_redis_cluster, self.cluster, options = get_dynamic_cluster_from_options(
             "SENTRY_BUFFER_OPTIONS", options
         )
         self.incr_batch_size = incr_batch_size
         assert self.incr_batch_size > 0
 
+        self.combine_window_seconds = combine_window_seconds
+        self.combine_max_incrs = combine_max_incrs
+        self._combined_incrs: dict[str, CombinedIncr] = {}
+        self._combined_incrs_count = 0
+        self._combine_lock = threading.Lock()
+        self._combine_timer: threading.Timer | None = None
+        if self.combine_window_seconds > 0:
+            atexit.register(self.flush_combined_incrs)
+
     def validate(self) -> None:
         validate_dynamic_cluster(self.is_redis_cluster, self.cluster)
 
@@ -343,8 +395,13 @@ class RedisBuffer(Buffer):
             pipe.hget(key, f"i+{col}")
         results = pipe.execute()
 
+        # Include increments which have been combined locally but not yet written to Redis
+        combined_incr = self._combined_incrs.get(key)
+        combined_columns = combined_incr.columns if combined_incr else {}
+
         return {
-            col: (int(results[i]) if results[i] is not None else 0) for i, col in enumerate(columns)
+            col: (int(results[i]) if results[i] is not None else 0) + combined_columns.get(col, 0)
+            for i, col in enumerate(columns)
         }
 
     def get_redis_connection(self, key: str, transaction: bool = True) -> Pipeline:
@@ -374,11 +431,116 @@ class RedisBuffer(Buffer):
             - Perform a set (last write wins) on extra
             - Perform a set on signal_only (only if True)
         - Add hashmap key to pending flushes
+
+        If in-process combining is enabled (see `combine_window_seconds`), the above is deferred
+        and done once for all increments to the same key within the combining window.
         """
         key = make_key(model, filters)
-        # We can't use conn.map() due to wanting to support multiple pending
-        # keys (one per Redis partition)
-        pipe = self.get_redis_connection(key, transaction=(not self.is_redis_cluster))
+
+        if self.combine_window_seconds > 0:
+            self._combine_incr(key, model, columns, filters, extra, signal_only)
+        else:
+            # We can't use conn.map() due to wanting to support multiple pending
+            # keys (one per Redis partition)
+            pipe = self.get_redis_connection(key, transaction=(not self.is_redis_cluster))
+            self._queue_incr(pipe, key, model, columns, filters, extra, signal_only)
+            pipe.execute()
+
+        metrics.incr(
+            "buffer.incr",
+            skip_internal=True,
+            tags={"module": model.__module__, "model": model.__name__},
+        )
+
+    def _combine_incr(
+        self,
+        key: str,
+        model: type[models.Model],
+        columns: dict[str, int],
+        filters: dict[str, BufferField],
+        extra: dict[str, Any] | None,
+        signal_only: bool | None,
+    ) -> None:
+        with self._combine_lock:
+            combined_incr = self._combined_incrs.get(key)
+            if combined_incr is None:
+                combined_incr = self._combined_incrs[key] = CombinedIncr(model, filters)
+            combined_incr.add(columns, extra, signal_only)
+            self._combined_incrs_count += 1
+
+            should_flush = self._combined_incrs_count >= self.combine_max_incrs
+            if not should_flush and self._combine_timer is None:
+                self._combine_timer = threading.Timer(
+                    self.combine_window_seconds, self.flush_combined_incrs
+                )
+                self._combine_timer.daemon = True
+                self._combine_timer.start()
+
+        if should_flush:
+            self.flush_combined_incrs()
+
+    def flush_combined_incrs(self) -> None:
+        """
+        Write all increments which have been combined in-process to Redis.
+        """
+        with self._combine_lock:
+            combined_incrs = self._combined_incrs
+            num_incrs = self._combined_incrs_count
+            self._combined_incrs = {}
+            self._combined_incrs_count = 0
+            if self._combine_timer is not None:
+                self._combine_timer.cancel()
+                self._combine_timer = None
+
+        if not combined_incrs:
+            return
+
+        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+            # The cluster client splits a single pipeline up by node
+            pipe = self.cluster.pipeline(transaction=False)
+            for key, combined_incr in combined_incrs.items():
+                self._queue_combined_incr(pipe, key, combined_incr)
+            pipe.execute()
+        elif is_instance_rb_cluster(self.cluster, self.is_redis_cluster):
+            # Each key's pending entry has to live on the same host as the key, so rather than
+            # letting a routing client spread the commands out, send one pipeline per host
+            router = self.cluster.get_router()
+            keys_by_host: dict[int, list[str]] = defaultdict(list)
+            for key in combined_incrs:
+                keys_by_host[router.get_host_for_key(key)].append(key)
+
+            for host_id, keys in keys_by_host.items():
+                pipe = self.cluster.get_local_client(host_id).pipeline(transaction=True)
+                for key in keys:
+                    self._queue_combined_incr(pipe, key, combined_incrs[key])
+                pipe.execute()
+        else:
+            raise AssertionError("unreachable")
+
+        metrics.incr("buffer.incr.combined", amount=num_incrs, skip_internal=True)
+        metrics.incr("buffer.incr.combined_writes", amount=len(combined_incrs), skip_internal=True)
+
+    def _queue_combined_incr(self, pipe: Pipeline, key: str, combined_incr: CombinedIncr) -> None:
+        self._queue_incr(
+            pipe,
+            key,
+            combined_incr.model,
+            combined_incr.columns,
+            combined_incr.filters,
+            combined_incr.extra,
+            combined_incr.signal_only,
+        )
+
+    def _queue_incr(
+        self,
+        pipe: Pipeline,
+        key: str,
+        model: type[models.Model],
+        columns: dict[str, int],
+        filters: dict[str, BufferField],
+        extra: dict[str, Any] | None,
+        signal_only: bool | None,
+    ) -> None:
         pipe.hsetnx(key, "m", f"{model.__module__}.{model.__name__}")
         _validate_json_roundtrip(filters, model)
 
@@ -406,15 +568,15 @@ class RedisBuffer(Buffer):
 
         pipe.expire(key, self.key_expire)
         pipe.zadd(self.pending_key, {key: time()})
-        pipe.execute()
 
-        metrics.incr(
-            "buffer.incr",
-            skip_internal=True,
-            tags={"module": model.__module__, "model": model.__name__},
-        )
+    def process_pending(self, partition: int | None = None, num_partitions: int = 1) -> None:
+        # Make sure anything combined in this process is visible to the drain below
+        self.flush_combined_incrs()
+
+        if partition is not None:
+            self._process_pending_partition(partition, num_partitions)
+            return
 
-    def process_pending(self) -> None:
         client = get_cluster_routing_client(self.cluster, self.is_redis_cluster)
         lock_key = self._lock_key(client, self.pending_key, ex=60)
         if not lock_key:
@@ -431,14 +593,7 @@ class RedisBuffer(Buffer):
                 keycount += len(keys)
 
                 for key in keys:
-                    model_key = self._extract_model_from_key(key=key)
-                    pending_buffer = pending_buffers_router.get_pending_buffer(model_key=model_key)
-                    pending_buffer.append(item=key)
-                    if pending_buffer.full():
-                        process_incr.apply_async(
-                            kwargs={"batch_keys": pending_buffer.flush()},
-                            headers={"sentry-propagate-traces": False},
-                        )
+                    self._add_to_pending_buffer(pending_buffers_router, key)
 
                 if keys:
                     self.cluster.zrem(self.pending_key, *keys)
@@ -453,36 +608,102 @@ class RedisBuffer(Buffer):
                             continue
                         keycount += len(keysb)
                         for keyb in keysb:
-                            key = keyb.decode("utf-8")
-                            model_key = self._extract_model_from_key(key=key)
-                            pending_buffer = pending_buffers_router.get_pending_buffer(
-                                model_key=model_key
+                            self._add_to_pending_buffer(
+                                pending_buffers_router, keyb.decode("utf-8")
                             )
-                            pending_buffer.append(item=key)
-                            if pending_buffer.full():
-                                process_incr.apply_async(
-                                    kwargs={"batch_keys": pending_buffer.flush()},
-                                    headers={"sentry-propagate-traces": False},
-                                )
                         conn.target([host_id]).zrem(self.pending_key, *keysb)
             else:
                 raise AssertionError("unreachable")
 
             # process any non-empty pending buffers
-            for pending_buffer_value in pending_buffers_router.pending_buffers():
-                pending_buffer = pending_buffer_value.pending_buffer
-                model_key = pending_buffer_value.model_key
-
-                if not pending_buffer.empty():
-                    process_incr.apply_async(
-                        kwargs={"batch_keys": pending_buffer.flush()},
-                        headers={"sentry-propagate-traces": False},
-                    )
+            self._flush_pending_buffers(pending_buffers_router)
 
             metrics.distribution("buffer.pending-size", keycount)
         finally:
             client.delete(lock_key)
 
+    def _get_pending_partition(self, key: str, num_partitions: int) -> int:
+        return int(md5_text(key).hexdigest()[:8], 16) % num_partitions
+
+    def _process_pending_partition(self, partition: int, num_partitions: int) -> None:
+        """
+        Drain the pending keys which hash to `partition`. Each partition is owned by its own
+        worker, which `ZSCAN`s the pending set (on every host, for rb clusters) and dispatches
+        `process_incr` tasks for only its own keys, so multiple workers can drain in parallel.
+        """
+        assert 0 <= partition < num_partitions
+
+        client = get_cluster_routing_client(self.cluster, self.is_redis_cluster)
+        lock_key = self._lock_key(client, f"{self.pending_key}:{partition}", ex=60)
+        if not lock_key:
+            return
+
+        pending_buffers_router = redis_buffer_router.create_pending_buffers_router(
+            incr_batch_size=self.incr_batch_size
+        )
+        now = time()
+        max_lag_by_model: dict[str, float] = {}
+        keycount = 0
+
+        try:
+            if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+                pending_sets = [self.cluster]
+            elif is_instance_rb_cluster(self.cluster, self.is_redis_cluster):
+                pending_sets = [
+                    self.cluster.get_local_client(host_id) for host_id in self.cluster.hosts
+                ]
+            else:
+                raise AssertionError("unreachable")
+
+            for conn in pending_sets:
+                partition_keys = []
+                for member, score in conn.zscan_iter(self.pending_key, count=1000):
+                    key = force_str(member)
+                    if self._get_pending_partition(key, num_partitions) != partition:
+                        continue
+
+                    partition_keys.append(member)
+                    model_key = self._extract_model_from_key(key=key) or "unknown"
+                    max_lag_by_model[model_key] = max(
+                        max_lag_by_model.get(model_key, 0), now - score
+                    )
+                    self._add_to_pending_buffer(pending_buffers_router, key)
+
+                keycount += len(partition_keys)
+                for key_batch in itertools.batched(partition_keys, 1000):
+                    conn.zrem(self.pending_key, *key_batch)
+
+            self._flush_pending_buffers(pending_buffers_router)
+
+            for model_key, lag in max_lag_by_model.items():
+                metrics.distribution(
+                    "buffer.pending-lag", lag, unit="second", tags={"model": model_key}
+                )
+            metrics.distribution(
+                "buffer.pending-size", keycount, tags={"partition": str(partition)}
+            )
+        finally:
+            client.delete(lock_key)
+
+    def _add_to_pending_buffer(self, pending_buffers_router: PendingBufferRouter, key: str) -> None:
+        model_key = self._extract_model_from_key(key=key)
+        pending_buffer = pending_buffers_router.get_pending_buffer(model_key=model_key)
+        pending_buffer.append(item=key)
+        if pending_buffer.full():
+            process_incr.apply_async(
+                kwargs={"batch_keys": pending_buffer.flush()},
+                headers={"sentry-propagate-traces": False},
+            )
+
+    def _flush_pending_buffers(self, pending_buffers_router: PendingBufferRouter) -> None:
+        for pending_buffer_value in pending_buffers_router.pending_buffers():
+            pending_buffer = pending_buffer_value.pending_buffer
+            if not pending_buffer.empty():
+                process_incr.apply_async(
+                    kwargs={"batch_keys": pending_buffer.flush()},
+                    headers={"sentry-propagate-traces": False},
+                )
+
     def process(  # type: ignore[override]
         self, key: str | None = None, batch_keys: list[str] | None = None, **kwargs: Any
     ) -> None:
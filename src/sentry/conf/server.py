@@ -1701,6 +1701,9 @@ SENTRY_SNUBA_CACHE_TTL_SECONDS = 60
 # Node storage backend
 SENTRY_NODESTORE = "sentry.services.nodestore.django.DjangoNodeStorage"
 SENTRY_NODESTORE_OPTIONS: dict[str, Any] = {}
+# Directory containing zstd dictionaries for nodestore payloads, as written by
+# the `train_nodestore_dictionaries` management command.
+SENTRY_NODESTORE_ZSTD_DICTIONARY_DIR: str | None = None
 
 # Tag storage backend
 SENTRY_TAGSTORE = os.environ.get("SENTRY_TAGSTORE", "sentry.tagstore.snuba.SnubaTagStorage")
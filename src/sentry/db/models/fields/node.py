@@ -123,10 +123,34 @@ class NodeData(MutableMapping[str, Any]):
             See documentation of nodestore.
         """
 
+        subkeys = self._get_subkeys_to_write(subkeys)
+        if subkeys is None:
+            return
+
+        nodestore.backend.set_subkeys(self.id, subkeys)
+
+    @staticmethod
+    def save_many(nodes):
+        """
+        Write several nodes back to nodestore in one batch.
+
+        :param nodes: A sequence of ``(node_data, subkeys)`` pairs, where
+            ``subkeys`` has the same meaning as in ``save``.
+        """
+        items = {}
+        for node_data, subkeys in nodes:
+            subkeys = node_data._get_subkeys_to_write(subkeys)
+            if subkeys is not None:
+                items[node_data.id] = subkeys
+
+        if items:
+            nodestore.backend.set_subkeys_multi(items)
+
+    def _get_subkeys_to_write(self, subkeys):
         # We never loaded any data for reading or writing, so there
         # is nothing to save.
         if self._node_data is None:
-            return
+            return None
 
         # We can't put our wrappers into the nodestore, so we need to
         # ensure that the data is converted into a plain old dict
@@ -136,5 +160,4 @@ class NodeData(MutableMapping[str, Any]):
 
         subkeys = subkeys or {}
         subkeys[None] = to_write
-
-        nodestore.backend.set_subkeys(self.id, subkeys)
+        return subkeys
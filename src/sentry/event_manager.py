@@ -48,6 +48,7 @@ from sentry.constants import (
     InsightModules,
 )
 from sentry.culprit import generate_culprit
+from sentry.db.models import NodeData
 from sentry.dynamic_sampling import record_latest_release
 from sentry.event_manager_auto_tags import get_enabled_derivers
 from sentry.eventstream.base import GroupState
@@ -80,6 +81,7 @@ from sentry.grouping.ingest.utils import (
     is_non_error_type_group,
 )
 from sentry.grouping.variants import BaseVariant
+from sentry.ingest import hot_cache
 from sentry.ingest.inbound_filters import FilterStatKeys
 from sentry.ingest.transaction_clusterer.datasource.redis import (
     record_transaction_name as record_transaction_name_for_clustering,
@@ -94,6 +96,7 @@ from sentry.issues.producer import PayloadType, produce_occurrence_to_kafka
 from sentry.killswitches import killswitch_matches_context
 from sentry.lang.native.utils import STORE_CRASH_REPORTS_ALL, convert_crashreport_count
 from sentry.models.activity import Activity
+from sentry.models.distribution import Distribution
 from sentry.models.environment import Environment
 from sentry.models.event import EventDict
 from sentry.models.eventattachment import CRASH_REPORT_TYPES, EventAttachment, get_crashreport_key
@@ -282,7 +285,10 @@ def get_max_crashreports(
 
 
 def get_max_crashreports(model: Project | Organization, *, allow_none: bool = False) -> int | None:
-    value = model.get_option("sentry:store_crash_reports")
+    if isinstance(model, Project):
+        value = hot_cache.get_project_option(model, "sentry:store_crash_reports")
+    else:
+        value = model.get_option("sentry:store_crash_reports")
     return convert_crashreport_count(value, allow_none=allow_none)
 
 
@@ -342,9 +348,9 @@ Job = MutableMapping[str, Any]
 
 
 def resolve_project(project_id: int) -> Project:
-    project = Project.objects.get_from_cache(id=project_id)
+    project = hot_cache.get_project(project_id)
     project.set_cached_field_value(
-        "organization", Organization.objects.get_from_cache(id=project.organization_id)
+        "organization", hot_cache.get_organization(project.organization_id)
     )
     return project
 
@@ -516,6 +522,77 @@ class EventManager:
                     project, job, projects, metric_tags, attachments or [], raw, cache_key
                 )
 
+    @staticmethod
+    @sentry_sdk.tracing.trace
+    def save_many(
+        events: Sequence[tuple[EventManager, Project, float | None]],
+        assume_normalized: bool = False,
+        skip_send_first_transaction: bool = False,
+    ) -> list[Event | None]:
+        """
+        Save a batch of events, given as `(manager, project, start_time)`
+        tuples, running each stage of the save pipeline once for all
+        transaction and generic events instead of once per event.
+
+        Error events still go through `save()` one at a time since grouping is
+        inherently per event. Events whose hash was discarded come back as
+        `None`; the returned list is in the same order as `events`.
+        """
+        projects = {project.id: project for _, project, _ in events}
+        results: list[Event | None] = [None] * len(events)
+        batched: list[tuple[int, Job]] = []
+
+        for index, (manager, project, start_time) in enumerate(events):
+            if not manager._normalized:
+                if not assume_normalized:
+                    manager.normalize(project_id=project.id)
+                manager._normalized = True
+
+            if manager._data.get("type") not in ("transaction", "generic"):
+                try:
+                    results[index] = manager.save(
+                        project=project, assume_normalized=True, start_time=start_time
+                    )
+                except HashDiscarded:
+                    pass
+                continue
+
+            job: Job = {
+                "data": manager._data,
+                "project_id": project.id,
+                "raw": False,
+                "start_time": start_time,
+            }
+            batched.append((index, job))
+
+        if not batched:
+            return results
+
+        jobs = [job for _, job in batched]
+        with metrics.timer("event_manager.save_many.pull_out_data"):
+            _pull_out_data(jobs, projects)
+
+        transaction_jobs: list[Job] = []
+        generic_jobs: list[Job] = []
+        for index, job in batched:
+            _set_project_platform_if_needed(projects[job["project_id"]], job["event"])
+            job["data"]["project"] = job["project_id"]
+            if job["data"].get("type") == "transaction":
+                transaction_jobs.append(job)
+            else:
+                generic_jobs.append(job)
+            results[index] = job["event"]
+
+        metrics.distribution("event_manager.save_many.transactions", len(transaction_jobs))
+        metrics.distribution("event_manager.save_many.generic", len(generic_jobs))
+
+        if transaction_jobs:
+            save_transaction_events(transaction_jobs, projects, skip_send_first_transaction)
+        if generic_jobs:
+            save_generic_events(generic_jobs, projects)
+
+        return results
+
     @sentry_sdk.tracing.trace
     def save_error_events(
         self,
@@ -733,37 +810,50 @@ def _set_project_platform_if_needed(project: Project, event: Event) -> None:
 
 @sentry_sdk.tracing.trace
 def _get_or_create_release_many(jobs: Sequence[Job], projects: ProjectsMapping) -> None:
+    # Batches are usually dominated by a handful of releases, so only look up
+    # each (project, version) and (release, dist) pair once.
+    releases: dict[tuple[int, str], Release | None] = {}
+    dists: dict[tuple[int, str], Distribution] = {}
+
     for job in jobs:
         data = job["data"]
         if not data.get("release"):
-            return
+            continue
 
         project = projects[job["project_id"]]
         date = job["event"].datetime
 
-        try:
-            release = Release.get_or_create(
-                project=project,
-                version=data["release"],
-                date_added=date,
-            )
-        except ValidationError:
-            logger.exception(
-                "Failed creating Release due to ValidationError",
-                extra={"project": project, "version": data["release"]},
-            )
-            release = None
+        release_key = (project.id, data["release"])
+        if release_key in releases:
+            release = releases[release_key]
+        else:
+            try:
+                release = Release.get_or_create(
+                    project=project,
+                    version=data["release"],
+                    date_added=date,
+                )
+            except ValidationError:
+                logger.exception(
+                    "Failed creating Release due to ValidationError",
+                    extra={"project": project, "version": data["release"]},
+                )
+                release = None
+            releases[release_key] = release
 
         job["release"] = release
         if not release:
-            return
+            continue
 
         # Don't allow a conflicting 'release' tag
         pop_tag(data, "release")
         set_tag(data, "sentry:release", release.version)
 
         if data.get("dist"):
-            job["dist"] = release.add_dist(data["dist"], date)
+            dist_key = (release.id, data["dist"])
+            if dist_key not in dists:
+                dists[dist_key] = release.add_dist(data["dist"], date)
+            job["dist"] = dists[dist_key]
 
             # don't allow a conflicting 'dist' tag
             pop_tag(job["data"], "dist")
@@ -901,10 +991,14 @@ def _get_group_processing_kwargs(job: Job) -> dict[str, Any]:
 
 @sentry_sdk.tracing.trace
 def _get_or_create_environment_many(jobs: Sequence[Job], projects: ProjectsMapping) -> None:
+    environments: dict[tuple[int, str | None], Environment] = {}
     for job in jobs:
-        job["environment"] = Environment.get_or_create(
-            project=projects[job["project_id"]], name=job["environment"]
-        )
+        key = (job["project_id"], job["environment"])
+        if key not in environments:
+            environments[key] = Environment.get_or_create(
+                project=projects[job["project_id"]], name=job["environment"]
+            )
+        job["environment"] = environments[key]
 
 
 @sentry_sdk.tracing.trace
@@ -1079,6 +1173,7 @@ def _tsdb_record_all_metrics(jobs: Sequence[Job]) -> None:
 
 def _nodestore_save_many(jobs: Sequence[Job], app_feature: str) -> None:
     inserted_time = datetime.now(timezone.utc).timestamp()
+    nodes: list[tuple[NodeData, dict[str, Any]]] = []
     for job in jobs:
         # Write the event to Nodestore
         subkeys = {}
@@ -1105,7 +1200,13 @@ def _nodestore_save_many(jobs: Sequence[Job], app_feature: str) -> None:
                 usage_type=UsageUnit.BYTES,
             )
         job["event"].data["nodestore_insert"] = inserted_time
-        job["event"].data.save(subkeys=subkeys)
+        nodes.append((job["event"].data, subkeys))
+
+    if options.get("nodestore.save-many.enabled"):
+        NodeData.save_many(nodes)
+    else:
+        for node_data, subkeys in nodes:
+            node_data.save(subkeys=subkeys)
 
 
 def _eventstream_insert_many(jobs: Sequence[Job]) -> None:
@@ -2764,18 +2865,24 @@ def save_transaction_events(
 
     # NOTE: Keep this list synchronized with sentry/spans/consumers/process_segments/message.py
 
-    _get_or_create_release_many(jobs, projects)
+    with metrics.timer("save_transaction_events.get_or_create_release"):
+        _get_or_create_release_many(jobs, projects)
     _get_event_user_many(jobs, projects)
     _derive_tags_many(jobs, projects)
     _derive_interface_tags_many(jobs)
     _calculate_span_grouping(jobs, projects)
     _materialize_metadata_many(jobs)
-    _get_or_create_environment_many(jobs, projects)
-    _get_or_create_release_associated_models(jobs, projects)
-    _tsdb_record_all_metrics(jobs)
+    with metrics.timer("save_transaction_events.get_or_create_environment"):
+        _get_or_create_environment_many(jobs, projects)
+    with metrics.timer("save_transaction_events.get_or_create_release_associated_models"):
+        _get_or_create_release_associated_models(jobs, projects)
+    with metrics.timer("save_transaction_events.tsdb_record_all_metrics"):
+        _tsdb_record_all_metrics(jobs)
     _materialize_event_metrics(jobs)
-    _nodestore_save_many(jobs=jobs, app_feature="transactions")
-    _eventstream_insert_many(jobs)
+    with metrics.timer("save_transaction_events.nodestore_save"):
+        _nodestore_save_many(jobs=jobs, app_feature="transactions")
+    with metrics.timer("save_transaction_events.eventstream_insert"):
+        _eventstream_insert_many(jobs)
 
     for job in jobs:
         track_sampled_event(
@@ -2785,7 +2892,8 @@ def save_transaction_events(
         )
 
     _track_outcome_accepted_many(jobs)
-    _detect_performance_problems(jobs, projects)
+    with metrics.timer("save_transaction_events.detect_performance_problems"):
+        _detect_performance_problems(jobs, projects)
     _send_occurrence_to_platform(jobs, projects)
     _record_transaction_info(jobs, projects, skip_send_first_transaction)
 
@@ -2803,13 +2911,16 @@ def save_generic_events(jobs: Sequence[Job], projects: ProjectsMapping) -> Seque
         except KeyError:
             continue
 
-    _get_or_create_release_many(jobs, projects)
+    with metrics.timer("save_generic_events.get_or_create_release"):
+        _get_or_create_release_many(jobs, projects)
     _get_event_user_many(jobs, projects)
     _derive_tags_many(jobs, projects)
     _derive_interface_tags_many(jobs)
     _materialize_metadata_many(jobs)
-    _get_or_create_environment_many(jobs, projects)
+    with metrics.timer("save_generic_events.get_or_create_environment"):
+        _get_or_create_environment_many(jobs, projects)
     _materialize_event_metrics(jobs)
-    _nodestore_save_many(jobs=jobs, app_feature="issue_platform")
+    with metrics.timer("save_generic_events.nodestore_save"):
+        _nodestore_save_many(jobs=jobs, app_feature="issue_platform")
 
     return jobs
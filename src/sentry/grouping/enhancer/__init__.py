@@ -22,6 +22,7 @@ from sentry.grouping.component import FrameGroupingComponent, StacktraceGrouping
 from sentry.models.project import Project
 from sentry.stacktraces.functions import set_in_app
 from sentry.utils import metrics
+from sentry.utils.local_cache import LRUCache, ThreadSafeCache
 from sentry.utils.safe import get_path, set_path
 
 from .exceptions import InvalidEnhancerConfig
@@ -35,6 +36,26 @@ logger = logging.getLogger(__name__)
 # So this leaves quite a bit of headroom for custom enhancement rules as well.
 RUST_CACHE = RustCache(1_000)
 
+# Process-local cache of fully-built `EnhancementsConfig` objects, keyed by the raw base64 config
+# bytes plus the id of the grouping config doing the loading. Every event from a given project
+# carries the same base64 string, so on the ingest path this lets us skip decompressing, parsing,
+# and merging the same rules over and over. Each entry holds two merged rust enhancements objects,
+# so keep this bounded.
+BASE64_CONFIG_CACHE_SIZE = 500
+
+
+class Base64ConfigCache(LRUCache[tuple[bytes, str | None], "EnhancementsConfig"]):
+    # Evictions happen inside `__setitem__`, so when wrapped in a `ThreadSafeCache` they're
+    # counted under the same lock as the insert which caused them
+    def popitem(self) -> tuple[tuple[bytes, str | None], EnhancementsConfig]:
+        metrics.incr("grouping.enhancements.base64_cache.eviction")
+        return super().popitem()
+
+
+_base64_config_cache: ThreadSafeCache[tuple[bytes, str | None], EnhancementsConfig] = (
+    ThreadSafeCache(Base64ConfigCache(maxlen=BASE64_CONFIG_CACHE_SIZE))
+)
+
 # TODO: Version 2 can be removed once all events with that config have expired, 90 days after this
 # comment is merged
 VERSIONS = [2, 3]
@@ -434,25 +455,60 @@ class EnhancementsConfig:
         also be persisted in the saved event, so they can be used in the UI and when determining
         things like suspect commits and suggested assignees.
         """
-        # TODO: Fix this type to list[MatchFrame] once it's fixed in ophio
-        match_frames: list[Any] = [create_match_frame(frame, platform) for frame in frames]
-        rust_exception_data = _make_rust_exception_data(exception_data)
+        self.apply_category_and_updated_in_app_to_stacktraces([(frames, exception_data)], platform)
+
+    def apply_category_and_updated_in_app_to_stacktraces(
+        self,
+        stacktraces: Sequence[tuple[Sequence[dict[str, Any]], dict[str, Any] | None]],
+        platform: str,
+    ) -> None:
+        """
+        Batched version of `apply_category_and_updated_in_app_to_frames`, which takes every
+        stacktrace in an event (as pairs of frames and exception data) at once.
+
+        Only stacktraces which are exact duplicates as far as the rules are concerned (common with
+        native events, where many threads are often parked in the same place) are deduplicated:
+        they're run through the rust enhancer once, with the results applied to each copy. All
+        other stacktraces are still matched individually rather than concatenated, because rules
+        with caller/callee matchers depend on frame adjacency.
+
+        Nothing is shared with `assemble_stacktrace_component`, which runs later (during grouping)
+        on match frames rebuilt from the `in_app` and category values this method sets.
+        """
+        results_by_stacktrace_key: dict[tuple[Any, ...], list[tuple[str | None, bool | None]]] = {}
 
         with metrics.timer("grouping.enhancements.get_in_app") as metrics_timer_tags:
             metrics_timer_tags["split"] = True
-            category_and_in_app_results = (
-                self.classifier_rust_enhancements.apply_modifications_to_frames(
-                    match_frames, rust_exception_data
-                )
-            )
+            metrics_timer_tags["batched"] = len(stacktraces) > 1
 
-        for frame, (category, in_app) in zip(frames, category_and_in_app_results):
-            if in_app is not None:
-                # If the `in_app` value changes as a result of this call, the original value (in
-                # integer form) will be added to `frame.data` under the key "orig_in_app"
-                set_in_app(frame, in_app)
-            if category is not None:
-                set_path(frame, "data", "category", value=category)
+            for frames, exception_data in stacktraces:
+                # TODO: Fix this type to list[MatchFrame] once it's fixed in ophio
+                match_frames: list[Any] = [create_match_frame(frame, platform) for frame in frames]
+                rust_exception_data = _make_rust_exception_data(exception_data)
+
+                stacktrace_key = (
+                    tuple(rust_exception_data.values()),
+                    tuple(tuple(match_frame.values()) for match_frame in match_frames),
+                )
+                category_and_in_app_results = results_by_stacktrace_key.get(stacktrace_key)
+
+                if category_and_in_app_results is None:
+                    category_and_in_app_results = results_by_stacktrace_key[stacktrace_key] = (
+                        self.classifier_rust_enhancements.apply_modifications_to_frames(
+                            match_frames, rust_exception_data
+                        )
+                    )
+
+                for frame, (category, in_app) in zip(frames, category_and_in_app_results):
+                    if in_app is not None:
+                        # If the `in_app` value changes as a result of this call, the original
+                        # value (in integer form) will be added to `frame.data` under the key
+                        # "orig_in_app"
+                        set_in_app(frame, in_app)
+                    if category is not None:
+                        set_path(frame, "data", "category", value=category)
+
+            metrics_timer_tags["deduplicated"] = len(results_by_stacktrace_key) < len(stacktraces)
 
     def assemble_stacktrace_component(
         self,
@@ -597,19 +653,45 @@ class EnhancementsConfig:
 
     @classmethod
     def from_base64_string(
-        cls, base64_string: str | bytes, referrer: str | None = None
+        cls,
+        base64_string: str | bytes,
+        referrer: str | None = None,
+        grouping_config_id: str | None = None,
     ) -> EnhancementsConfig:
-        """Convert a base64 string into an `EnhancementsConfig` object"""
+        """
+        Convert a base64 string into an `EnhancementsConfig` object.
+
+        Results are cached in a process-local LRU cache keyed by the base64 bytes and the given
+        grouping config id, so repeated loads of the same config return the same (shared) object.
+        """
+        raw_bytes_str = (
+            base64_string.encode("ascii", "ignore")
+            if isinstance(base64_string, str)
+            else base64_string
+        )
+        cache_key = (raw_bytes_str, grouping_config_id)
+
+        cached_config = _base64_config_cache.get(cache_key)
+        metrics.incr(
+            "grouping.enhancements.base64_cache",
+            tags={"result": "hit" if cached_config is not None else "miss", "referrer": referrer},
+        )
+        if cached_config is not None:
+            return cached_config
+
+        enhancements_config = cls._from_base64_bytes(raw_bytes_str, referrer)
+
+        _base64_config_cache[cache_key] = enhancements_config
+
+        return enhancements_config
 
+    @classmethod
+    def _from_base64_bytes(
+        cls, raw_bytes_str: bytes, referrer: str | None = None
+    ) -> EnhancementsConfig:
         with metrics.timer("grouping.enhancements.creation") as metrics_timer_tags:
             metrics_timer_tags.update({"source": "base64_string", "referrer": referrer})
 
-            raw_bytes_str = (
-                base64_string.encode("ascii", "ignore")
-                if isinstance(base64_string, str)
-                else base64_string
-            )
-
             # Split the string to get encoded data for each set of rules: unsplit rules (i.e., rules
             # the way they're stored in project config), classifier rules, and contributes rules.
             # Older base64 strings - such as those stored in events created before rule-splitting
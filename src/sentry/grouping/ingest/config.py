@@ -12,6 +12,7 @@ from django.core.cache import cache
 from sentry import audit_log, options
 from sentry.conf.server import BETA_GROUPING_CONFIG, DEFAULT_GROUPING_CONFIG
 from sentry.grouping.strategies.configurations import GROUPING_CONFIG_CLASSES
+from sentry.ingest import hot_cache
 from sentry.locks import locks
 from sentry.models.options.project_option import ProjectOption
 from sentry.models.project import Project
@@ -150,9 +151,13 @@ def is_in_transition(project: Project) -> bool:
 
     If out-dated secondary config options are found, clean them up.
     """
-    primary_grouping_config = project.get_option("sentry:grouping_config")
-    secondary_grouping_config = project.get_option("sentry:secondary_grouping_config")
-    secondary_grouping_expiry = project.get_option("sentry:secondary_grouping_expiry")
+    primary_grouping_config = hot_cache.get_project_option(project, "sentry:grouping_config")
+    secondary_grouping_config = hot_cache.get_project_option(
+        project, "sentry:secondary_grouping_config"
+    )
+    secondary_grouping_expiry = hot_cache.get_project_option(
+        project, "sentry:secondary_grouping_expiry"
+    )
 
     if not secondary_grouping_config and not secondary_grouping_expiry:
         return False
@@ -8,6 +8,7 @@ the `GroupHash` model file, so that existing records will get updated with the n
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from datetime import datetime, timedelta
 from typing import Any, TypeIs, cast
 
@@ -244,6 +245,81 @@ def create_or_update_grouphash_metadata_if_needed(
             )
 
 
+def bulk_create_grouphash_metadata_if_needed(
+    event: Event,
+    project: Project,
+    grouphashes: Sequence[tuple[GroupHash, bool]],
+    grouping_config_id: str,
+    variants: dict[str, BaseVariant],
+) -> None:
+    """
+    Create metadata records for all of the given `(grouphash, grouphash_is_new)` pairs which don't
+    yet have one, using a single insert. The metadata only depends on the event, so it's computed
+    once and shared by all of the records.
+
+    Grouphashes which already have metadata are left alone; they still need to go through
+    `create_or_update_grouphash_metadata_if_needed` to be updated if necessary.
+    """
+    missing = [(grouphash, is_new) for grouphash, is_new in grouphashes if not grouphash.metadata]
+    if not missing:
+        return
+
+    new_data = get_grouphash_metadata_data(event, project, variants, grouping_config_id)
+    now = timezone.now()
+
+    GroupHashMetadata.objects.bulk_create(
+        [
+            GroupHashMetadata(
+                grouphash=grouphash,
+                **new_data,
+                # If we're adding metadata to an existing grouphash, don't pretend it was created now
+                date_added=now if is_new else None,
+                date_updated=now,
+            )
+            for grouphash, is_new in missing
+        ],
+        # Guards against race conditions without the need for a lock, same as the `get_or_create`
+        # in `create_or_update_grouphash_metadata_if_needed`
+        ignore_conflicts=True,
+    )
+
+    records = {
+        record.grouphash_id: record
+        for record in GroupHashMetadata.objects.filter(
+            grouphash_id__in=[grouphash.id for grouphash, _ in missing]
+        )
+    }
+
+    for grouphash, is_new in missing:
+        record = records.get(grouphash.id)
+        if record is None:
+            continue
+
+        grouphash._metadata = record
+
+        # Records we didn't write ourselves were created by another event with the same grouphash.
+        # As in `create_or_update_grouphash_metadata_if_needed`, let that event be the one to call
+        # Seer.
+        if record.date_updated != now:
+            logger.info(
+                "grouphash_metadata.creation_race_condition.record_exists",
+                extra={
+                    "grouphash_id": grouphash.id,
+                    "grouphash_is_new": is_new,
+                    "grouphash_has_group": bool(grouphash.group_id),
+                    "event_id": event.event_id,
+                    "hash": grouphash.hash,
+                },
+            )
+            event.should_skip_seer = True
+            continue
+
+        metrics.incr(
+            "grouping.grouphash_metadata.db_hit",
+            tags={"reason": "new_grouphash" if is_new else "missing_metadata"},
+        )
+
+
 def get_grouphash_metadata_data(
     event: Event,
     project: Project,
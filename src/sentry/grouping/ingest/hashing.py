@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 
 import sentry_sdk
 from django.core.cache import cache
+from django.db import IntegrityError, router, transaction
 
 from sentry import options
 from sentry.exceptions import HashDiscarded
@@ -25,6 +26,7 @@ from sentry.grouping.ingest.caching import (
 )
 from sentry.grouping.ingest.config import is_in_transition
 from sentry.grouping.ingest.grouphash_metadata import (
+    bulk_create_grouphash_metadata_if_needed,
     create_or_update_grouphash_metadata_if_needed,
     record_grouphash_metadata_metrics,
 )
@@ -253,6 +255,173 @@ def _get_or_create_single_grouphash(
         return (grouphash, created)
 
 
+def bulk_check_grouphash_existence(
+    hash_values: Iterable[str], project: Project, use_caching: bool
+) -> dict[str, bool]:
+    """
+    Batched version of `_grouphash_exists_for_hash_value`. Check any number of hash values (for
+    example, the secondary hashes of a whole batch of events from the same project) using a single
+    cache multi-get and a single database query for the cache misses.
+
+    Returns a mapping of each hash value to whether or not a `GroupHash` record exists for it.
+    """
+    hash_values = list(dict.fromkeys(hash_values))
+    results: dict[str, bool] = {}
+
+    if not hash_values:
+        return results
+
+    with metrics.timer(
+        "grouping.get_or_create_grouphashes.bulk_check_secondary_hash_existence"
+    ) as metrics_tags:
+        cache_keys = {
+            hash_value: get_grouphash_existence_cache_key(hash_value, project.id)
+            for hash_value in hash_values
+        }
+
+        if use_caching:
+            cached = cache.get_many(list(cache_keys.values()))
+            for hash_value, cache_key in cache_keys.items():
+                if cached.get(cache_key) is not None:
+                    results[hash_value] = cached[cache_key]
+
+            metrics.incr(
+                "grouping.get_or_create_grouphashes.bulk_cache_result",
+                amount=len(results),
+                tags={"cache_result": "hit", "lookup": "existence"},
+            )
+            metrics.incr(
+                "grouping.get_or_create_grouphashes.bulk_cache_result",
+                amount=len(hash_values) - len(results),
+                tags={"cache_result": "miss", "lookup": "existence"},
+            )
+
+        uncached_hash_values = [hash_value for hash_value in hash_values if hash_value not in results]
+        metrics_tags["num_db_lookups"] = len(uncached_hash_values)
+
+        if uncached_hash_values:
+            existing_hash_values = set(
+                GroupHash.objects.filter(
+                    project=project, hash__in=uncached_hash_values
+                ).values_list("hash", flat=True)
+            )
+            fetched = {
+                hash_value: hash_value in existing_hash_values
+                for hash_value in uncached_hash_values
+            }
+            results.update(fetched)
+
+            if use_caching:
+                cache.set_many(
+                    {cache_keys[hash_value]: exists for hash_value, exists in fetched.items()},
+                    GROUPHASH_CACHE_EXPIRY_SECONDS,
+                )
+
+    return results
+
+
+def bulk_get_or_create_grouphashes(
+    hash_values: Iterable[str], project: Project, use_caching: bool
+) -> dict[str, tuple[GroupHash, bool]]:
+    """
+    Batched version of `_get_or_create_single_grouphash`. Resolve any number of hash values (for
+    example, the primary hashes of a whole batch of events from the same project) using a single
+    cache multi-get, a single `IN (...)` query for the cache misses, and a single bulk insert for
+    any hashes which don't yet have a `GroupHash` record.
+
+    Returns a mapping of each hash value to a tuple of its `GroupHash` and whether it was created by
+    this call. As with the single-hash version, only grouphashes with an assigned group are cached.
+    """
+    hash_values = list(dict.fromkeys(hash_values))
+    results: dict[str, tuple[GroupHash, bool]] = {}
+
+    if not hash_values:
+        return results
+
+    with metrics.timer(
+        "grouping.get_or_create_grouphashes.bulk_get_or_create_grouphashes"
+    ) as metrics_tags:
+        cache_keys = {
+            hash_value: get_grouphash_object_cache_key(hash_value, project.id)
+            for hash_value in hash_values
+        }
+
+        if use_caching:
+            cached = cache.get_many(list(cache_keys.values()))
+            for hash_value, cache_key in cache_keys.items():
+                if cached.get(cache_key) is not None:
+                    results[hash_value] = (cached[cache_key], False)
+
+            metrics.incr(
+                "grouping.get_or_create_grouphashes.bulk_cache_result",
+                amount=len(results),
+                tags={"cache_result": "hit", "lookup": "object"},
+            )
+            metrics.incr(
+                "grouping.get_or_create_grouphashes.bulk_cache_result",
+                amount=len(hash_values) - len(results),
+                tags={"cache_result": "miss", "lookup": "object"},
+            )
+
+        uncached_hash_values = [hash_value for hash_value in hash_values if hash_value not in results]
+        metrics_tags["num_db_lookups"] = len(uncached_hash_values)
+
+        if not uncached_hash_values:
+            return results
+
+        existing = {
+            grouphash.hash: grouphash
+            for grouphash in GroupHash.objects.filter(
+                project=project, hash__in=uncached_hash_values
+            )
+        }
+        missing_hash_values = [
+            hash_value for hash_value in uncached_hash_values if hash_value not in existing
+        ]
+        created_hash_values: set[str] = set()
+
+        if missing_hash_values:
+            try:
+                with transaction.atomic(router.db_for_write(GroupHash)):
+                    created = GroupHash.objects.bulk_create(
+                        [
+                            GroupHash(project=project, hash=hash_value)
+                            for hash_value in missing_hash_values
+                        ]
+                    )
+                for grouphash in created:
+                    existing[grouphash.hash] = grouphash
+                created_hash_values.update(missing_hash_values)
+            except IntegrityError:
+                # Another process created at least one of these grouphashes in between our query
+                # and our insert. Fall back to creating them one at a time, so that we only claim
+                # the ones we actually inserted as created.
+                metrics_tags["insert_conflict"] = True
+                for hash_value in missing_hash_values:
+                    grouphash, was_created = GroupHash.objects.get_or_create(
+                        project=project, hash=hash_value
+                    )
+                    existing[hash_value] = grouphash
+                    if was_created:
+                        created_hash_values.add(hash_value)
+
+        metrics_tags["num_created"] = len(created_hash_values)
+
+        to_cache = {}
+        for hash_value in uncached_hash_values:
+            grouphash = existing[hash_value]
+            results[hash_value] = (grouphash, hash_value in created_hash_values)
+
+            # See `_get_or_create_single_grouphash` for why we only cache grouphashes with a group
+            if use_caching and grouphash.group_id is not None:
+                to_cache[cache_keys[hash_value]] = grouphash
+
+        if to_cache:
+            cache.set_many(to_cache, GROUPHASH_CACHE_EXPIRY_SECONDS)
+
+    return results
+
+
 def get_or_create_grouphashes(
     event: Event,
     project: Project,
@@ -264,20 +433,47 @@ def get_or_create_grouphashes(
     use_caching = options.get("grouping.use_ingest_grouphash_caching")
     grouphashes: list[GroupHash] = []
 
+    use_batching = options.get("grouping.batch_grouphash_lookups")
+    grouphash_results: dict[str, tuple[GroupHash, bool]] = {}
+    # We iterate over the hashes more than once below
+    hashes = list(hashes)
+
     if is_secondary:
         # The only utility of secondary hashes is to link new primary hashes to an existing group
         # via an existing grouphash. Secondary hashes which are new are therefore of no value, so
         # filter them out before creating grouphash records.
-        hashes = [
-            hash_value
-            for hash_value in hashes
-            if _grouphash_exists_for_hash_value(hash_value, project, use_caching)
-        ]
-
+        if use_batching:
+            existence = bulk_check_grouphash_existence(hashes, project, use_caching)
+            hashes = [hash_value for hash_value in hashes if existence[hash_value]]
+        else:
+            hashes = [
+                hash_value
+                for hash_value in hashes
+                if _grouphash_exists_for_hash_value(hash_value, project, use_caching)
+            ]
+
+    if use_batching:
+        grouphash_results = bulk_get_or_create_grouphashes(hashes, project, use_caching)
+
+    results: list[tuple[GroupHash, bool]] = []
     for hash_value in hashes:
-        grouphash, created = _get_or_create_single_grouphash(hash_value, project, use_caching)
+        if use_batching:
+            results.append(grouphash_results[hash_value])
+        else:
+            results.append(_get_or_create_single_grouphash(hash_value, project, use_caching))
+
+    metadata_writes_enabled = options.get("grouping.grouphash_metadata.ingestion_writes_enabled")
+    if metadata_writes_enabled and options.get("grouping.grouphash_metadata.batch_writes"):
+        try:
+            bulk_create_grouphash_metadata_if_needed(
+                event, project, results, grouping_config_id, variants
+            )
+        except Exception:
+            # Anything which didn't get metadata here gets it in the per-hash fallback below
+            sentry_sdk.capture_exception()
 
-        if options.get("grouping.grouphash_metadata.ingestion_writes_enabled"):
+    for grouphash, created in results:
+        if metadata_writes_enabled:
             try:
                 # We don't expect this to throw any errors, but collecting this metadata
                 # shouldn't ever derail ingestion, so better to be safe
@@ -205,7 +205,7 @@ class StrategyConfiguration:
             # this grouping config
             try:
                 enhancements_config = EnhancementsConfig.from_base64_string(
-                    base64_enhancements, referrer="strategy_config"
+                    base64_enhancements, referrer="strategy_config", grouping_config_id=self.id
                 )
             except InvalidEnhancerConfig:
                 enhancements_config = ENHANCEMENT_BASES[
@@ -12,14 +12,16 @@ from arroyo.processing.strategies import (
     ProcessingStrategyFactory,
     RunTask,
 )
+from arroyo.processing.strategies.batching import BatchStep
 from arroyo.types import Commit, FilteredPayload, Message, Partition
 
+from sentry import options
 from sentry.ingest.types import ConsumerType
 from sentry.processing.backpressure.arroyo import HealthChecker, create_backpressure_step
 from sentry.utils.arroyo import MultiprocessingPool, run_task_with_multiprocessing
 
 from .attachment_event import decode_and_process_chunks, process_attachments_and_events
-from .simple_event import process_simple_event_message
+from .simple_event import process_simple_event_message, save_event_transaction_batch
 
 
 class MultiProcessConfig(NamedTuple):
@@ -180,6 +182,8 @@ class IngestTransactionsStrategyFactory(ProcessingStrategyFactory[KafkaPayload])
         self.consumer_type = ConsumerType.Transactions
         self.reprocess_only_stuck_events = reprocess_only_stuck_events
         self.stop_at_timestamp = stop_at_timestamp
+        self.max_batch_size = max_batch_size
+        self.max_batch_time = max_batch_time
 
         self.multi_process = None
         self._pool = MultiprocessingPool(num_processes)
@@ -200,6 +204,25 @@ class IngestTransactionsStrategyFactory(ProcessingStrategyFactory[KafkaPayload])
 
         final_step = CommitOffsets(commit)
 
+        if options.get("ingest-transactions.save-many.enabled"):
+            # Collect the transactions of a batch of messages and save them
+            # together instead of dispatching a task per message.
+            save_step = BatchStep(
+                max_batch_size=self.max_batch_size,
+                max_batch_time=self.max_batch_time,
+                next_step=RunTask(function=save_event_transaction_batch, next_step=final_step),
+            )
+            event_function = partial(
+                process_simple_event_message,
+                consumer_type=self.consumer_type,
+                reprocess_only_stuck_events=self.reprocess_only_stuck_events,
+                defer_save_event_transaction=True,
+            )
+            next_step = maybe_multiprocess_step(mp, event_function, save_step, self._pool)
+            return create_backpressure_step(
+                health_checker=self.health_checker, next_step=next_step
+            )
+
         event_function = partial(
             process_simple_event_message,
             consumer_type=self.consumer_type,
@@ -15,6 +15,7 @@ from sentry.attachments import CachedAttachment, attachment_cache, store_attachm
 from sentry.event_manager import save_attachment
 from sentry.feedback.lib.utils import FeedbackCreationSource, is_in_feedback_denylist
 from sentry.feedback.usecases.ingest.userreport import Conflict, save_userreport
+from sentry.ingest import hot_cache
 from sentry.ingest.types import ConsumerType
 from sentry.killswitches import killswitch_matches_context
 from sentry.models.organization import Organization
@@ -79,9 +80,14 @@ def process_event(
     reprocess_only_stuck_events: bool = False,
     inline_save_event: bool = False,
     inline_save_event_transaction: bool = False,
-) -> None:
+    defer_save_event_transaction: bool = False,
+) -> dict[str, Any] | None:
     """
     Perform some initial filtering and deserialize the message payload.
+
+    With `defer_save_event_transaction`, transactions are not handed to the
+    `save_event_transaction` task. Instead, the arguments for saving them are
+    returned so that the caller can save a whole batch at once.
     """
     payload = message["payload"]
     start_time = float(message["start_time"])
@@ -171,6 +177,8 @@ def process_event(
         ):
             return
 
+    deferred_save: dict[str, Any] | None = None
+
     # Raise the retriable exception and skip DLQ if anything below this point fails as it may be caused by
     # intermittent network issue
     try:
@@ -214,7 +222,7 @@ def process_event(
 
         try:
             project.set_cached_field_value(
-                "organization", Organization.objects.get_from_cache(id=project.organization_id)
+                "organization", hot_cache.get_organization(project.organization_id)
             )
         except Organization.DoesNotExist:
             logger.warning(
@@ -236,7 +244,9 @@ def process_event(
                 "event_id": event_id,
                 "project_id": project_id,
             }
-            if inline_save_event_transaction:
+            if defer_save_event_transaction:
+                deferred_save = save_transaction_kwargs
+            elif inline_save_event_transaction:
                 save_event_transaction(**save_transaction_kwargs)
             else:
                 save_event_transaction.delay(**save_transaction_kwargs)
@@ -287,6 +297,8 @@ def process_event(
             raise
         raise Retriable(exc)
 
+    return deferred_save
+
 
 @trace_func(name="ingest_consumer.process_attachment_chunk")
 @metrics.wraps("ingest_consumer.process_attachment_chunk")
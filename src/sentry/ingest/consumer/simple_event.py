@@ -1,17 +1,22 @@
 import logging
+from collections import defaultdict
+from typing import Any
 
 import msgpack
 from arroyo.backends.kafka.consumer import KafkaPayload
 from arroyo.dlq import InvalidMessage
+from arroyo.processing.strategies.batching import ValuesBatch
 from arroyo.types import BrokerValue, Message
 from taskbroker_client.constants import CompressionType
 from taskbroker_client.retry import Retry
 
 from sentry import options
+from sentry.ingest import hot_cache
 from sentry.ingest.types import ConsumerType
 from sentry.models.project import Project
 from sentry.silo.base import SiloMode
 from sentry.tasks.base import instrumented_task
+from sentry.tasks.store import save_event_transactions_many
 from sentry.taskworker.namespaces import ingest_events_passthrough_tasks
 from sentry.utils import metrics
 
@@ -27,7 +32,8 @@ def process_simple_event_message(
     raw_message: Message[KafkaPayload],
     consumer_type: str,
     reprocess_only_stuck_events: bool,
-) -> None:
+    defer_save_event_transaction: bool = False,
+) -> dict[str, Any] | None:
     """
     Processes a single Kafka Message containing a "simple" Event payload.
 
@@ -40,6 +46,9 @@ def process_simple_event_message(
     - Store the JSON payload in the event processing store, and pass it on to
       `preprocess_event`, which will schedule a followup task such as
       `symbolicate_event` or `process_event`.
+
+    With `defer_save_event_transaction`, transactions are returned instead of
+    being saved, see `save_event_transaction_batch`.
     """
 
     raw_payload = raw_message.payload.value
@@ -61,7 +70,7 @@ def process_simple_event_message(
 
         try:
             with metrics.timer("ingest_consumer.fetch_project"):
-                project = Project.objects.get_from_cache(id=project_id)
+                project = hot_cache.get_project(project_id)
         except Project.DoesNotExist:
             return
 
@@ -70,6 +79,7 @@ def process_simple_event_message(
             message,
             project,
             reprocess_only_stuck_events,
+            defer_save_event_transaction=defer_save_event_transaction,
         )
 
     except Exception as exc:
@@ -82,6 +92,22 @@ def process_simple_event_message(
         raise InvalidMessage(raw_value.partition, raw_value.offset) from exc
 
 
+def save_event_transaction_batch(message: Message[ValuesBatch[dict[str, Any] | None]]) -> None:
+    """
+    Saves the transactions deferred by `process_simple_event_message` for a
+    batch of messages. Transactions are grouped by project, and each project's
+    are saved together by a single `save_event_transactions_many` task.
+    """
+    events_by_project: dict[int, list[dict[str, Any]]] = defaultdict(list)
+    for value in message.payload:
+        if value.payload is not None:
+            events_by_project[value.payload["project_id"]].append(value.payload)
+
+    for project_id, events in events_by_project.items():
+        metrics.distribution("ingest_consumer.save_event_transaction_batch.size", len(events))
+        save_event_transactions_many.delay(project_id=project_id, events=events)
+
+
 @instrumented_task(
     name="sentry.ingest.consumer.simple_event.process_event_from_kafka",
     namespace=ingest_events_passthrough_tasks,
@@ -109,7 +135,7 @@ def process_event_from_kafka(message_bytes: bytes) -> None:
 
     try:
         with metrics.timer("ingest_consumer.fetch_project"):
-            project = Project.objects.get_from_cache(id=project_id)
+            project = hot_cache.get_project(project_id)
     except Project.DoesNotExist:
         return
 
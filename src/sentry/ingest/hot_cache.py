@@ -0,0 +1,128 @@
+"""
+A process-local cache for the projects, organizations and project option snapshots that are looked
+up for every event on the ingest path, in front of the Django cache used by `get_from_cache` and
+`ProjectOption.objects.get_all_values`.
+
+Entries are dropped as soon as the model is saved or deleted in this process. Changes made in other
+processes, or through queryset updates which don't send signals, are picked up once an entry
+expires, so `store.hot-cache-ttl` bounds how stale a cached value can be.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+
+from sentry import options, projectoptions
+from sentry.db.models import Model
+from sentry.models.options.project_option import ProjectOption
+from sentry.models.organization import Organization
+from sentry.models.project import Project
+from sentry.utils import metrics
+from sentry.utils.local_cache import LRUCache
+
+MAX_ENTRIES = 10_000
+
+
+class _HotCache[V]:
+    def __init__(
+        self,
+        model_name: str,
+        load: Callable[[int], V],
+        instance_key: Callable[[Any], int] = lambda instance: instance.id,
+    ) -> None:
+        self.model_name = model_name
+        self.load = load
+        # Maps a saved or deleted model instance to the id of the entry it invalidates
+        self.instance_key = instance_key
+        self.entries: LRUCache[int, tuple[float, V]] = LRUCache(MAX_ENTRIES)
+        # Bumped on every invalidation, so that a value loaded concurrently with an invalidation is
+        # not put back into the cache.
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    def get(self, id: int) -> V:
+        ttl = options.get("store.hot-cache-ttl")
+        if ttl <= 0:
+            return self.load(id)
+
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(id)
+        if entry is not None and now - entry[0] < ttl:
+            metrics.incr("ingest.hot_cache.get", tags={"model": self.model_name, "result": "hit"})
+            metrics.distribution(
+                "ingest.hot_cache.age",
+                now - entry[0],
+                tags={"model": self.model_name},
+                unit="second",
+            )
+            # Callers are free to modify the instance (e.g. attach a cached organization), so
+            # never hand out the cached one itself.
+            return copy.copy(entry[1])
+
+        metrics.incr(
+            "ingest.hot_cache.get",
+            tags={"model": self.model_name, "result": "miss" if entry is None else "expired"},
+        )
+        generation = self.generation
+        value = self.load(id)
+        with self.lock:
+            if generation == self.generation:
+                self.entries[id] = (now, copy.copy(value))
+        return value
+
+    def invalidate(self, instance: Model, **kwargs: Any) -> None:
+        with self.lock:
+            self.generation += 1
+            self.entries.pop(self.instance_key(instance))
+
+    def clear(self) -> None:
+        with self.lock:
+            self.generation += 1
+            self.entries = LRUCache(MAX_ENTRIES)
+
+
+projects = _HotCache("project", lambda id: Project.objects.get_from_cache(id=id))
+organizations = _HotCache("organization", lambda id: Organization.objects.get_from_cache(id=id))
+project_options: _HotCache[Mapping[str, Any]] = _HotCache(
+    "project_option",
+    lambda project_id: dict(ProjectOption.objects.get_all_values(project_id)),
+    instance_key=lambda instance: instance.project_id,
+)
+
+_caches: tuple[tuple[type[Model], _HotCache[Any]], ...] = (
+    (Project, projects),
+    (Organization, organizations),
+    (ProjectOption, project_options),
+)
+for _model, _cache in _caches:
+    post_save.connect(_cache.invalidate, sender=_model, weak=False)
+    post_delete.connect(_cache.invalidate, sender=_model, weak=False)
+
+
+def get_project(project_id: int) -> Project:
+    return projects.get(project_id)
+
+
+def get_organization(organization_id: int) -> Organization:
+    return organizations.get(organization_id)
+
+
+def get_project_option(project: Project, key: str, default: Any | None = None) -> Any:
+    """
+    Like `project.get_option`, but reads the option from the project's cached option snapshot.
+    """
+    values = project_options.get(project.id)
+    if key in values:
+        return values[key]
+    if default is None:
+        well_known_key = projectoptions.lookup_well_known_key(key)
+        if well_known_key is not None:
+            return well_known_key.get_default(project)
+    return default
@@ -0,0 +1,98 @@
+import os
+from collections import defaultdict
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Trains per-platform zstd dictionaries for nodestore payloads from a sample of events"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project",
+            dest="projects",
+            action="append",
+            type=int,
+            required=True,
+            help="ID of a project to sample events from. Can be given multiple times.",
+        )
+        parser.add_argument(
+            "--limit", type=int, default=1000, help="Number of events to sample per project."
+        )
+        parser.add_argument(
+            "--days", type=int, default=7, help="Sample events from the last number of days."
+        )
+        parser.add_argument(
+            "--size", type=int, default=112640, help="Size of each dictionary in bytes."
+        )
+        parser.add_argument(
+            "--min-samples",
+            type=int,
+            default=100,
+            help="Skip platforms with fewer sampled events than this.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Directory to write dictionaries to. "
+            "Defaults to SENTRY_NODESTORE_ZSTD_DICTIONARY_DIR.",
+        )
+
+    def handle(self, **options):
+        import zstandard
+        from django.conf import settings
+        from django.utils import timezone
+
+        from sentry import nodestore
+        from sentry.services import eventstore
+        from sentry.services.nodestore.compression import dictionary_filename
+
+        output = options["output"] or settings.SENTRY_NODESTORE_ZSTD_DICTIONARY_DIR
+        if not output:
+            raise CommandError(
+                "Either --output or SENTRY_NODESTORE_ZSTD_DICTIONARY_DIR must be set"
+            )
+        os.makedirs(output, exist_ok=True)
+
+        end = timezone.now()
+        start = end - timedelta(days=options["days"])
+
+        samples: dict[str, list[bytes]] = defaultdict(list)
+        for project_id in options["projects"]:
+            events = eventstore.backend.get_events(
+                filter=eventstore.Filter(project_ids=[project_id], start=start, end=end),
+                limit=options["limit"],
+            )
+            for event in events:
+                if not event.data:
+                    continue
+                # Train on the payloads exactly as they are written to nodestore
+                samples[event.platform or "other"].append(
+                    nodestore.backend._encode({None: dict(event.data)})
+                )
+
+        dictionaries = {}
+        for platform, platform_samples in sorted(samples.items()):
+            if len(platform_samples) < options["min_samples"]:
+                self.stdout.write(
+                    f"Skipping {platform}: only {len(platform_samples)} events sampled"
+                )
+                continue
+
+            dictionary = zstandard.train_dictionary(options["size"], platform_samples)
+            with open(os.path.join(output, dictionary_filename(platform, dictionary)), "wb") as f:
+                f.write(dictionary.as_bytes())
+
+            dictionaries[platform] = dictionary.dict_id()
+            self.stdout.write(
+                f"Trained dictionary {dictionary.dict_id()} for {platform} "
+                f"from {len(platform_samples)} events"
+            )
+
+        if not dictionaries:
+            raise CommandError("Not enough events were sampled to train any dictionaries")
+
+        self.stdout.write(
+            "Distribute the dictionaries to every nodestore reader, then set "
+            f"`nodestore.zstd-compression.dictionaries` to {dictionaries!r}"
+        )
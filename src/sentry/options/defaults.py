@@ -834,6 +834,48 @@ register(
     flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Let concurrent identical Snuba requests that miss the query cache share one query.
+register(
+    "snuba.query-cache.single-flight.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# How long (in seconds) a request waits for an identical in-flight request of the
+# same process before querying Snuba itself.
+register(
+    "snuba.query-cache.single-flight.timeout",
+    type=Float,
+    default=30.0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Duration (in seconds) of the cross-process lease on a query cache key. Requests
+# for a key leased by another process wait up to this long for its result, blocking
+# the request thread and polling the cache every 50ms. Value of 0 disables the lease.
+register(
+    "snuba.query-cache.lease-seconds",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# How long (in seconds) past the query cache TTL a previous result is kept to be
+# served while another process revalidates it. Value of 0 disables stale results.
+register(
+    "snuba.query-cache.stale-seconds",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Store results in the Snuba query cache with a compressed columnar encoding
+# instead of JSON. Both encodings can be read regardless of this option.
+register(
+    "snuba.query-cache.columnar-encoding",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Cooldown period (in seconds) between Snuba queries for groupsnooze user count validation. Value of 0 disables the debounce check.
 register(
     "snuba.groupsnooze.user-counts-debounce-seconds",
@@ -889,6 +931,20 @@ register(
     flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Save the transactions of each batch the ingest-transactions consumer reads together, with one
+# `save_event_transactions_many` task per project, instead of one task per transaction. Read when
+# partitions are assigned.
+register(
+    "ingest-transactions.save-many.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# How long (in seconds) the ingest path may keep projects and organizations in its process-local
+# cache, see `sentry.ingest.hot_cache`. 0 disables the cache.
+register("store.hot-cache-ttl", type=Float, default=0.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+
 
 # Enable sending the flag to the microservice to tell it to purposefully take longer than our
 # timeout, to see the effect on the overall error event processing backlog
@@ -1215,6 +1271,29 @@ register(
     default=[],
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Fraction of post_process jobs for which every pipeline step reports CPU time
+# and database query counts in addition to its wall time.
+register(
+    "post_process.pipeline.step-metrics.sample-rate",
+    type=Float,
+    default=0.0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Fraction of traced post_process_group tasks that are also profiled.
+register(
+    "post_process.pipeline.profiling.rate",
+    type=Float,
+    default=0.01,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Number of threads used to run independent post_process pipeline stages
+# concurrently. 1 runs every stage sequentially in the calling thread.
+register(
+    "post_process.pipeline.max-workers",
+    type=Int,
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "api.organization.disable-last-deploys",
     type=Sequence,
@@ -1273,6 +1352,16 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# When True, RedisProjectConfigCache only refreshes the TTL of cached project
+# configs whose content did not change since the last write, instead of
+# rewriting them with a new revision.
+register(
+    "relay.projectconfig-cache.skip-unchanged-writes",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Controls the encoding used in Relay for encoding distributions and sets
 # when writing to Kafka.
 #
@@ -2187,6 +2276,59 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Write all nodes saved by the event manager in a single `set_subkeys_multi`
+# call instead of one `set_subkeys` call per node.
+register(
+    "nodestore.save-many.enabled",
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Write nodestore payloads with an offset table in front of the subkeys, so
+# that reading a single subkey does not need to split the whole payload. All
+# readers understand both layouts, so this only controls the write path.
+register(
+    "nodestore.encode-indexed-subkeys",
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Compress nodestore payloads with a zstd dictionary before writing them.
+# Payloads of platforms listed in `nodestore.zstd-compression.dictionaries`
+# (platform => dictionary id) are compressed with that dictionary, which must
+# be present in SENTRY_NODESTORE_ZSTD_DICTIONARY_DIR on every reader. Other
+# payloads, and payloads of backends that compress on their own, are written
+# as before. Readers always understand compressed payloads, so these only
+# control the write path.
+register(
+    "nodestore.zstd-compression.enabled",
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "nodestore.zstd-compression.dictionaries",
+    default={},
+    type=Dict,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Number of threads used to fetch nodes concurrently for nodestore backends
+# which do not implement a native multi-get but declare `concurrent_get_bytes`,
+# and the deadline in seconds (0 to wait for
+# every fetch) after which the nodes fetched so far are returned.
+register(
+    "nodestore.get-bytes-multi.concurrency",
+    default=1,
+    type=Int,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "nodestore.get-bytes-multi.timeout",
+    default=0.0,
+    type=Float,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # TTL in seconds for nodestore cache entries. Event bodies are immutable
 # so longer TTLs are safe and improve cache hit rates for batch reads
 # (e.g. group events list endpoint).
@@ -2611,6 +2753,14 @@ register(
     default=False,
     flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Memoize converted on-demand metric specs per process, so that organization-wide
+# widgets are not converted again for every project config of the organization.
+register(
+    "on_demand_metrics.spec_memo.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 # Use to rollout using a cache for should_use_on_demand function, which resolves queries
 register(
     "on_demand_metrics.cache_should_use_on_demand",
@@ -2799,6 +2949,16 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Resolve all of an event's (or a batch of events') grouphashes with a single cache multi-get, a
+# single `IN (...)` query, and a single bulk insert for misses, rather than one cache lookup and one
+# query per hash.
+register(
+    "grouping.batch_grouphash_lookups",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 
 # SPAN BUFFER
 # Span buffer killswitch
@@ -2910,6 +3070,23 @@ register(
     default=0,
     flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Maximum number of payload bytes to process in each Redis pipeline, on top of
+# `spans.buffer.pipeline-batch-size`. Set to 0 for unlimited.
+register(
+    "spans.buffer.pipeline-batch-max-bytes",
+    type=Int,
+    default=0,
+    flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Write subsegment payloads and run the add-buffer EVALSHA calls for a batch
+# in a single Redis pipeline, instead of one pipeline for payloads followed by
+# one for EVALSHA calls. Halves the number of round-trips per batch.
+register(
+    "spans.buffer.combined-insert-pipeline",
+    type=Bool,
+    default=False,
+    flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
+)
 # Maximum number of spans per EVALSHA call. Large subsegments are split into
 # chunks to avoid Lua unpack() limits. Set to 0 for unlimited.
 register(
@@ -3096,6 +3273,23 @@ register(
     default=False,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Number of partitions the buffer's pending set is split into when draining it. With more than one
+# partition, the periodic `process_pending` task fans out to one task per partition, each of which
+# only drains the keys hashing to its partition.
+register(
+    "buffer.process-pending.num-partitions",
+    type=Int,
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Maximum number of source sketches merged into a TSDB frequency table by a single script call.
+# Larger merges are split up to stay well clear of Lua's unpack() limit on argument counts.
+register(
+    "tsdb.redis.frequency-merge-batch-size",
+    type=Int,
+    default=1000,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "delayed_processing.batch_size",
     default=10000,
@@ -3127,6 +3321,15 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Create the metadata records for all of an event's grouphashes which don't yet have one with a
+# single bulk insert (computing the metadata only once), rather than one `get_or_create` per hash.
+register(
+    "grouping.grouphash_metadata.batch_writes",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 register(
     "workflow_engine.group.type_id.disable_issue_stream_detector",
     type=Sequence,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from time import time
 from typing import Any
 
 from sentry_redis_tools.clients import RedisCluster, StrictRedis
@@ -15,7 +16,8 @@ from sentry_redis_tools.sliding_windows_rate_limiter import (
 )
 
 from sentry.exceptions import InvalidConfiguration
-from sentry.utils import redis
+from sentry.utils import metrics, redis
+from sentry.utils.local_cache import LRUCache, ThreadSafeCache
 from sentry.utils.services import Service
 
 __all__ = ["Quota", "GrantedQuota", "RequestedQuota", "Timestamp"]
@@ -124,10 +126,23 @@ class SlidingWindowRateLimiter(Service):
 
 
 class RedisSlidingWindowRateLimiter(SlidingWindowRateLimiter):
+    """
+    When `exhausted_cache_ttl` (seconds) is set, quotas which have been found
+    to be fully used up are remembered in-process. Usage within a sliding
+    window can only drop once the window moves on to the next granule, so
+    until then (or until the TTL elapses, whichever is first) requests
+    against an exhausted quota are denied without a round-trip to Redis.
+    """
+
     def __init__(self, **options: Any) -> None:
         self.cluster_key = options.get("cluster", "default")
         self._client: RedisCluster[str] | StrictRedis[str] | None = None
         self._impl: RedisSlidingWindowRateLimiterImpl | None = None
+        self.exhausted_cache_ttl: int = options.get("exhausted_cache_ttl", 0)
+        # (prefix, quota) -> (granule, expires_at)
+        self._exhausted_quotas: ThreadSafeCache[tuple[str, Quota], tuple[int, int]] = (
+            ThreadSafeCache(LRUCache(maxlen=options.get("exhausted_cache_size", 10000)))
+        )
         super().__init__(**options)
 
     @property
@@ -153,7 +168,81 @@ class RedisSlidingWindowRateLimiter(SlidingWindowRateLimiter):
     def check_within_quotas(
         self, requests: Sequence[RequestedQuota], timestamp: Timestamp | None = None
     ) -> tuple[Timestamp, Sequence[GrantedQuota]]:
-        return self.impl.check_within_quotas(requests, timestamp)
+        if not self.exhausted_cache_ttl:
+            return self.impl.check_within_quotas(requests, timestamp)
+
+        timestamp = int(time()) if timestamp is None else int(timestamp)
+
+        grants: list[GrantedQuota | None] = []
+        remaining_requests = []
+        for request in requests:
+            exhausted_quota = self._get_exhausted_quota(request, timestamp)
+            if exhausted_quota is None:
+                grants.append(None)
+                remaining_requests.append(request)
+            else:
+                grants.append(
+                    GrantedQuota(prefix=request.prefix, granted=0, reached_quotas=[exhausted_quota])
+                )
+
+        if len(remaining_requests) < len(requests):
+            metrics.incr(
+                "ratelimits.sliding_windows.exhausted_cache_hit",
+                amount=len(requests) - len(remaining_requests),
+                skip_internal=True,
+            )
+
+        remaining_grants: Sequence[GrantedQuota] = []
+        if remaining_requests:
+            _, remaining_grants = self.impl.check_within_quotas(remaining_requests, timestamp)
+
+        results = []
+        remaining = iter(zip(remaining_requests, remaining_grants))
+        for grant in grants:
+            if grant is None:
+                request, grant = next(remaining)
+                self._record_exhausted_quota(request, grant, timestamp)
+            results.append(grant)
+
+        return timestamp, results
+
+    def _get_exhausted_quota(self, request: RequestedQuota, timestamp: Timestamp) -> Quota | None:
+        if request.requested <= 0:
+            return None
+
+        for quota in request.quotas:
+            if quota.prefix_override is not None:
+                continue
+
+            cached = self._exhausted_quotas.get((request.prefix, quota))
+            if cached is None:
+                continue
+
+            granule, expires_at = cached
+            if granule == timestamp // quota.granularity_seconds and timestamp < expires_at:
+                return quota
+
+        return None
+
+    def _record_exhausted_quota(
+        self, request: RequestedQuota, grant: GrantedQuota, timestamp: Timestamp
+    ) -> None:
+        if grant.granted > 0 or not grant.reached_quotas:
+            return
+
+        # The granted amount is trimmed by each reached quota in turn, so the
+        # last reached quota is the one with nothing left. Quotas shared
+        # between requests via `prefix_override` are skipped, since their
+        # usage includes amounts granted within the same call which may never
+        # be used.
+        quota = grant.reached_quotas[-1]
+        if quota.prefix_override is not None:
+            return
+
+        self._exhausted_quotas[(request.prefix, quota)] = (
+            timestamp // quota.granularity_seconds,
+            timestamp + self.exhausted_cache_ttl,
+        )
 
     def use_quotas(
         self,
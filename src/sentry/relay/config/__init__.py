@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import uuid
 from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Literal, TypedDict
 
@@ -85,11 +86,61 @@ MIN_CLUSTERER_RUNS = 10
 logger = logging.getLogger(__name__)
 
 
-def get_exposed_features(project: Project) -> Sequence[str]:
+#: Organization features that project configs depend on, see `OrganizationConfigInputs`.
+ORGANIZATION_CONFIG_FEATURES = [
+    *(feature for feature in EXPOSABLE_FEATURES if feature.startswith("organizations:")),
+    "organizations:ingest-through-trusted-relays-only",
+]
+
+
+@dataclass(frozen=True)
+class OrganizationConfigInputs:
+    """
+    The organization-level inputs of a project config. They are the same for all projects of an
+    organization, so they are loaded once when computing the configs of many of its projects.
+    """
+
+    features: Mapping[str, bool]
+    trusted_relays: Sequence[Mapping[str, Any]]
+    verify_signature: str | None
+    event_retention: int | None
+    downsampled_event_retention: int | None
+    retentions: Mapping[Any, Any]
+    trimming_configs: Any
+
+
+def get_organization_config_inputs(organization: Organization) -> OrganizationConfigInputs:
+    features_enabled = {
+        feature: features.has(feature, organization) for feature in ORGANIZATION_CONFIG_FEATURES
+    }
+    verify_signature = None
+    if features_enabled["organizations:ingest-through-trusted-relays-only"]:
+        verify_signature = organization.get_option(
+            "sentry:ingest-through-trusted-relays-only",
+            INGEST_THROUGH_TRUSTED_RELAYS_ONLY_DEFAULT,
+        )
+
+    return OrganizationConfigInputs(
+        features=features_enabled,
+        trusted_relays=organization.get_option("sentry:trusted-relays", []),
+        verify_signature=verify_signature,
+        event_retention=quotas.backend.get_event_retention(organization),
+        downsampled_event_retention=quotas.backend.get_downsampled_event_retention(organization),
+        retentions=quotas.backend.get_retentions(organization),
+        trimming_configs=quotas.backend.get_trimming_configs(organization),
+    )
+
+
+def get_exposed_features(
+    project: Project, organization_features: Mapping[str, bool] | None = None
+) -> Sequence[str]:
     active_features = []
     for feature in EXPOSABLE_FEATURES:
         if feature.startswith("organizations:"):
-            has_feature = features.has(feature, project.organization)
+            if organization_features is not None:
+                has_feature = organization_features[feature]
+            else:
+                has_feature = features.has(feature, project.organization)
         elif feature.startswith("projects:"):
             has_feature = features.has(feature, project)
         else:
@@ -213,7 +264,9 @@ def get_quotas(project: Project, keys: Iterable[ProjectKey] | None = None) -> li
 
 
 def get_project_config(
-    project: Project, project_keys: Iterable[ProjectKey] | None = None
+    project: Project,
+    project_keys: Iterable[ProjectKey] | None = None,
+    organization_inputs: OrganizationConfigInputs | None = None,
 ) -> ProjectConfig:
     """Constructs the ProjectConfig information.
     :param project: The project to load configuration for. Ensure that
@@ -223,6 +276,9 @@ def get_project_config(
         no project keys are provided it is assumed that the config does not
         need to contain auth information (this is the case when used in
         python's StoreView)
+    :param organization_inputs: Pre-fetched organization-level inputs, see
+        `get_organization_config_inputs`. Loaded for the project's
+        organization if not given.
     :return: a ProjectConfig object for the given project
     """
     with sentry_sdk.isolation_scope() as scope:
@@ -232,7 +288,56 @@ def get_project_config(
             sentry_sdk.start_transaction(name="get_project_config"),
             metrics.timer("relay.config.get_project_config.duration"),
         ):
-            return _get_project_config(project, project_keys=project_keys)
+            return _get_project_config(
+                project, project_keys=project_keys, organization_inputs=organization_inputs
+            )
+
+
+def get_project_key_configs(
+    project: Project,
+    project_keys: Sequence[ProjectKey],
+    organization_inputs: OrganizationConfigInputs | None = None,
+) -> dict[str, ProjectConfig]:
+    """Constructs one ProjectConfig per project key, as they are cached for Relay.
+
+    Only the public key and the quotas differ between the configs of a
+    project's keys, so everything else is computed once and shared.
+
+    :param project: The project to load configuration for, see `get_project_config`.
+    :param project_keys: The keys to build configs for. They must all belong to `project`.
+    :param organization_inputs: See `get_project_config`.
+    :return: a dict mapping each public key to its ProjectConfig
+    """
+    if not project_keys:
+        return {}
+
+    first_key, *other_keys = project_keys
+    base = get_project_config(
+        project, project_keys=[first_key], organization_inputs=organization_inputs
+    )
+    configs = {first_key.public_key: base}
+    if base.disabled:
+        configs.update((key.public_key, base) for key in other_keys)
+        return configs
+
+    base_data = base.to_dict()
+    for key in other_keys:
+        config = dict(base_data["config"])
+        config.pop("quotas", None)
+        if quotas_config := get_quotas(project, keys=[key]):
+            config["quotas"] = quotas_config
+
+        configs[key.public_key] = ProjectConfig(
+            project,
+            **{
+                **base_data,
+                "rev": uuid.uuid4().hex,
+                "publicKeys": get_public_key_configs(project_keys=[key]),
+                "config": config,
+            },
+        )
+
+    return configs
 
 
 def get_dynamic_sampling_config(timeout: TimeChecker, project: Project) -> Mapping[str, Any] | None:
@@ -822,11 +927,17 @@ def _get_default_browser_performance_profiles(
 
 
 def _get_project_config(
-    project: Project, project_keys: Iterable[ProjectKey] | None = None
+    project: Project,
+    project_keys: Iterable[ProjectKey] | None = None,
+    organization_inputs: OrganizationConfigInputs | None = None,
 ) -> ProjectConfig:
     if project.status != ObjectStatus.ACTIVE:
         return ProjectConfig(project, disabled=True)
 
+    if organization_inputs is None:
+        with sentry_sdk.start_span(op="get_organization_config_inputs"):
+            organization_inputs = get_organization_config_inputs(project.organization)
+
     public_keys = get_public_key_configs(project_keys=project_keys)
 
     with sentry_sdk.start_span(op="get_public_config"):
@@ -840,11 +951,7 @@ def _get_project_config(
             "publicKeys": public_keys,
             "config": {
                 "allowedDomains": list(get_origins(project)),
-                "trustedRelays": [
-                    r["public_key"]
-                    for r in project.organization.get_option("sentry:trusted-relays", [])
-                    if r
-                ],
+                "trustedRelays": [r["public_key"] for r in organization_inputs.trusted_relays if r],
                 "piiConfig": get_pii_config(project),
                 "datascrubbingSettings": get_datascrubbing_settings(project),
             },
@@ -854,16 +961,11 @@ def _get_project_config(
 
     config = cfg["config"]
 
-    if features.has("organizations:ingest-through-trusted-relays-only", project.organization):
-        config["trustedRelaySettings"] = {
-            "verifySignature": project.organization.get_option(
-                "sentry:ingest-through-trusted-relays-only",
-                INGEST_THROUGH_TRUSTED_RELAYS_ONLY_DEFAULT,
-            )
-        }
+    if organization_inputs.features["organizations:ingest-through-trusted-relays-only"]:
+        config["trustedRelaySettings"] = {"verifySignature": organization_inputs.verify_signature}
 
     with sentry_sdk.start_span(op="get_exposed_features"):
-        if exposed_features := get_exposed_features(project):
+        if exposed_features := get_exposed_features(project, organization_inputs.features):
             config["features"] = exposed_features
 
     # NOTE: Omitting dynamicSampling because of a failure increases the number
@@ -919,30 +1021,19 @@ def _get_project_config(
         grouping_config = get_grouping_config_dict_for_project(project)
         if grouping_config is not None:
             config["groupingConfig"] = grouping_config
-    with sentry_sdk.start_span(op="get_event_retention"):
-        event_retention = quotas.backend.get_event_retention(project.organization)
-        if event_retention is not None:
-            config["eventRetention"] = event_retention
-    with sentry_sdk.start_span(op="get_downsampled_event_retention"):
-        downsampled_event_retention = quotas.backend.get_downsampled_event_retention(
-            project.organization
-        )
-        if downsampled_event_retention is not None:
-            config["downsampledEventRetention"] = downsampled_event_retention
-    with sentry_sdk.start_span(op="get_retentions"):
-        retentions = quotas.backend.get_retentions(project.organization)
-        retentions_config = {
-            RETENTIONS_CONFIG_MAPPING[c]: v.to_object()
-            for c, v in retentions.items()
-            if c in RETENTIONS_CONFIG_MAPPING
-        }
-        if retentions_config:
-            config["retentions"] = retentions_config
-
-    with sentry_sdk.start_span(op="get_trimming_configs"):
-        trimming_configs = quotas.backend.get_trimming_configs(project.organization)
-        if trimming_configs:
-            config["trimming"] = trimming_configs
+    if organization_inputs.event_retention is not None:
+        config["eventRetention"] = organization_inputs.event_retention
+    if organization_inputs.downsampled_event_retention is not None:
+        config["downsampledEventRetention"] = organization_inputs.downsampled_event_retention
+    retentions_config = {
+        RETENTIONS_CONFIG_MAPPING[c]: v.to_object()
+        for c, v in organization_inputs.retentions.items()
+        if c in RETENTIONS_CONFIG_MAPPING
+    }
+    if retentions_config:
+        config["retentions"] = retentions_config
+    if organization_inputs.trimming_configs:
+        config["trimming"] = organization_inputs.trimming_configs
 
     with sentry_sdk.start_span(op="get_all_quotas"):
         if quotas_config := get_quotas(project, keys=project_keys):
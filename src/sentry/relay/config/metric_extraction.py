@@ -1,5 +1,6 @@
 import logging
 import random
+import threading
 from collections import defaultdict
 from collections.abc import Sequence
 from dataclasses import dataclass
@@ -36,6 +37,7 @@ from sentry.search.events.builder.discover import DiscoverQueryBuilder
 from sentry.search.events.types import ParamsType, QueryBuilderConfig
 from sentry.snuba.dataset import Dataset
 from sentry.snuba.metrics.extraction import (
+    _ONDEMAND_OP_TO_PROJECT_SPEC_GENERATOR,
     WIDGET_QUERY_CACHE_MAX_CHUNKS,
     MetricSpec,
     MetricSpecType,
@@ -52,6 +54,7 @@ from sentry.snuba.models import SnubaQuery
 from sentry.snuba.referrer import Referrer
 from sentry.utils import json, metrics
 from sentry.utils.cache import cache
+from sentry.utils.local_cache import LRUCache
 
 OnDemandExtractionState = DashboardWidgetQueryOnDemand.OnDemandExtractionState
 
@@ -68,6 +71,11 @@ _WIDGET_QUERY_CARDINALITY_SOFT_DEADLINE_TTL = 3600 * 0.5  # 30m
 
 HashedMetricSpec = tuple[str, MetricSpec, SpecVersion]
 
+# Process-local memo of converted on-demand specs, see `_get_memoized_metric_spec`.
+_SPEC_MEMO_MAX_ENTRIES = 10000
+_spec_memo: LRUCache[tuple[Any, ...], tuple[str, MetricSpec]] = LRUCache(_SPEC_MEMO_MAX_ENTRIES)
+_spec_memo_lock = threading.Lock()
+
 
 class HighCardinalityWidgetException(Exception):
     pass
@@ -849,6 +857,21 @@ def _convert_aggregate_and_query_to_metrics(
         span.set_data("widget_query_args", {"query": query, "aggregate": aggregate})
         # Create as many specs as we support
         for spec_version in OnDemandMetricSpecVersioning.get_spec_versions():
+            memo_key = (
+                dataset,
+                aggregate,
+                query,
+                environment,
+                tuple(groupbys or ()),
+                spec_type,
+                spec_version.version,
+                frozenset(spec_version.flags),
+            )
+            if memoized := _get_memoized_metric_spec(memo_key):
+                query_hash, metric_spec = memoized
+                metric_specs_and_hashes.append((query_hash, metric_spec, spec_version))
+                continue
+
             try:
                 on_demand_spec = OnDemandMetricSpec(
                     field=aggregate,
@@ -870,6 +893,10 @@ def _convert_aggregate_and_query_to_metrics(
                 metric_specs_and_hashes.append(
                     (on_demand_spec.query_hash, metric_spec, spec_version)
                 )
+                # Apdex and user misery specs depend on the project's transaction
+                # thresholds, all other specs only depend on the memo key.
+                if on_demand_spec.op not in _ONDEMAND_OP_TO_PROJECT_SPEC_GENERATOR:
+                    _set_memoized_metric_spec(memo_key, (on_demand_spec.query_hash, metric_spec))
             except ValueError:
                 # raised by validate_sampling_condition or metric_spec lacking "condition"
                 metrics.incr(
@@ -891,6 +918,35 @@ def _convert_aggregate_and_query_to_metrics(
     return metric_specs_and_hashes
 
 
+def _get_memoized_metric_spec(memo_key: tuple[Any, ...]) -> tuple[str, MetricSpec] | None:
+    """
+    Returns a previously converted spec for the given aggregate, query and spec version.
+
+    Widgets are defined per organization, so without the memo every widget query
+    is converted again for every project config of the organization. Memoized
+    specs are shared between project configs and must not be mutated.
+    """
+    if not options.get("on_demand_metrics.spec_memo.enabled"):
+        return None
+
+    with _spec_memo_lock:
+        memoized = _spec_memo.get(memo_key)
+    metrics.incr(
+        "on_demand_metrics.spec_memo",
+        tags={"result": "hit" if memoized is not None else "miss"},
+        sample_rate=0.1,
+    )
+    return memoized
+
+
+def _set_memoized_metric_spec(memo_key: tuple[Any, ...], value: tuple[str, MetricSpec]) -> None:
+    if not options.get("on_demand_metrics.spec_memo.enabled"):
+        return
+
+    with _spec_memo_lock:
+        _spec_memo[memo_key] = value
+
+
 # CONDITIONAL TAGGING
 
 
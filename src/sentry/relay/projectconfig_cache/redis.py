@@ -1,19 +1,64 @@
+import hashlib
 import logging
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any
 
 import zstandard
 
+from sentry import options
 from sentry.relay.projectconfig_cache.base import ProjectConfigCache
 from sentry.utils import json, metrics, redis
 from sentry.utils.redis import validate_dynamic_cluster
 
 REDIS_CACHE_TIMEOUT = 8400  # 2 hr, 20 minutes
 COMPRESSION_LEVEL = 3  # 3 is the default level of compression
+# How many levels of nested objects are assembled from separately encoded members.
+SHARED_ENCODING_DEPTH = 2
+# Top-level fields that change with every computation of a config, even if nothing
+# else did. They are excluded from the digest used to detect unchanged configs.
+VOLATILE_FIELDS = frozenset(("rev", "lastFetch", "lastChange"))
 
 logger = logging.getLogger(__name__)
 
 
+class _SharedEncoder:
+    """
+    Serializes a batch of project configs to JSON, encoding sub-documents that
+    are shared between them only once.
+
+    Configs for the keys of one project reference the same objects for most of
+    their content (metric extraction, filters, sampling), see
+    `get_project_key_configs`. Fragments are memoized by object identity. The
+    memo keeps every memoized object alive, so that its id cannot be reused by
+    another object for as long as the encoder exists.
+    """
+
+    def __init__(self) -> None:
+        self._fragments: dict[int, tuple[Any, bytes]] = {}
+        self.shared = 0
+
+    def encode(self, value: Any, depth: int = SHARED_ENCODING_DEPTH) -> bytes:
+        if not isinstance(value, (dict, list)):
+            return json.dumps(value).encode()
+
+        if (memoized := self._fragments.get(id(value))) is not None:
+            self.shared += 1
+            return memoized[1]
+
+        if isinstance(value, dict) and depth > 0 and all(isinstance(k, str) for k in value):
+            fragment = b"{%s}" % self.encode_members(value.items(), depth - 1)
+        else:
+            fragment = json.dumps(value).encode()
+        self._fragments[id(value)] = (value, fragment)
+        return fragment
+
+    def encode_members(self, items: Iterable[tuple[str, Any]], depth: int) -> bytes:
+        return b",".join(
+            b"%s:%s" % (json.dumps(key).encode(), self.encode(value, depth))
+            for key, value in items
+        )
+
+
 class RedisProjectConfigCache(ProjectConfigCache):
     def __init__(self, **options):
         cluster_key = options.get("cluster", "default")
@@ -33,13 +78,66 @@ class RedisProjectConfigCache(ProjectConfigCache):
     def __get_redis_rev_key(self, public_key) -> str:
         return f"{self.__get_redis_key(public_key)}.rev"
 
+    def __get_redis_digest_key(self, public_key) -> str:
+        return f"{self.__get_redis_key(public_key)}.digest"
+
     def set_many(self, configs: dict[str, Mapping[str, Any]]):
         metrics.incr("relay.projectconfig_cache.write", amount=len(configs), tags={"action": "set"})
 
+        encoder = _SharedEncoder()
+        payloads = {}
+        for public_key, config in configs.items():
+            volatile = encoder.encode_members(
+                ((k, v) for k, v in config.items() if k in VOLATILE_FIELDS),
+                SHARED_ENCODING_DEPTH - 1,
+            )
+            body = encoder.encode_members(
+                ((k, v) for k, v in config.items() if k not in VOLATILE_FIELDS),
+                SHARED_ENCODING_DEPTH - 1,
+            )
+            payloads[public_key] = (
+                volatile,
+                body,
+                hashlib.blake2b(body, digest_size=16).hexdigest(),
+            )
+        metrics.incr("relay.projectconfig_cache.shared_fragments", amount=encoder.shared)
+
+        unchanged = set()
+        if options.get("relay.projectconfig-cache.skip-unchanged-writes"):
+            public_keys = list(payloads)
+            # Note: Those are multiple pipelines, one per cluster node.
+            with self.cluster.pipeline(transaction=False) as p:
+                for public_key in public_keys:
+                    p.get(self.__get_redis_digest_key(public_key))
+                digests = p.execute()
+            unchanged = {
+                public_key
+                for public_key, digest in zip(public_keys, digests)
+                if digest is not None and digest.decode() == payloads[public_key][2]
+            }
+            metrics.incr(
+                "relay.projectconfig_cache.write",
+                amount=len(unchanged),
+                tags={"action": "unchanged"},
+            )
+
         # Note: Those are multiple pipelines, one per cluster node.
         p = self.cluster.pipeline(transaction=False)
         for public_key, config in configs.items():
-            serialized = json.dumps(config).encode()
+            volatile, body, digest = payloads[public_key]
+            if public_key in unchanged:
+                # The stored config and its revision are still accurate, only
+                # keep them alive. Relay keeps the old revision and has nothing
+                # to refetch.
+                for key in (
+                    self.__get_redis_key(public_key),
+                    self.__get_redis_rev_key(public_key),
+                    self.__get_redis_digest_key(public_key),
+                ):
+                    p.expire(key, REDIS_CACHE_TIMEOUT)
+                continue
+
+            serialized = b"{%s}" % b",".join(member for member in (volatile, body) if member)
             compressed = zstandard.compress(serialized, level=COMPRESSION_LEVEL)
             metrics.distribution(
                 "relay.projectconfig_cache.uncompressed_size", len(serialized), unit="byte"
@@ -47,6 +145,7 @@ class RedisProjectConfigCache(ProjectConfigCache):
             metrics.distribution("relay.projectconfig_cache.size", len(compressed), unit="byte")
 
             p.setex(self.__get_redis_key(public_key), REDIS_CACHE_TIMEOUT, compressed)
+            p.setex(self.__get_redis_digest_key(public_key), REDIS_CACHE_TIMEOUT, digest)
             # Update the revision after updating the config, while not strictly necessary
             # this means when the reader is checking the revision before reading the key
             # the revision won't be updated already while the project config is still the old.
@@ -66,7 +165,11 @@ class RedisProjectConfigCache(ProjectConfigCache):
         # Note: Those are multiple pipelines, one per cluster node
         with self.cluster.pipeline() as p:
             for public_key in public_keys:
-                p.delete(self.__get_redis_key(public_key), self.__get_redis_rev_key(public_key))
+                p.delete(
+                    self.__get_redis_key(public_key),
+                    self.__get_redis_rev_key(public_key),
+                    self.__get_redis_digest_key(public_key),
+                )
             return_values = p.execute()
 
         # Count deletions of project configs, not deletions of individual Redis keys.
@@ -84,6 +187,16 @@ class RedisProjectConfigCache(ProjectConfigCache):
             return json.loads(rv)
         return None
 
+    def exists_many(self, public_keys) -> set[str]:
+        public_keys = list(public_keys)
+        # Note: Those are multiple pipelines, one per cluster node
+        with self.cluster_read.pipeline(transaction=False) as p:
+            for public_key in public_keys:
+                p.exists(self.__get_redis_key(public_key))
+            return_values = p.execute()
+
+        return {public_key for public_key, rv in zip(public_keys, return_values) if rv}
+
     def get_rev(self, public_key) -> str | None:
         if value := self.cluster_read.get(self.__get_redis_rev_key(public_key)):
             return value.decode()
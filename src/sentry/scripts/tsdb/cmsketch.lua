@@ -23,6 +23,9 @@ The public API consists of three main methods:
 - ESTIMATE: used to query the number of times a specific item has been seen,
 - RANKED: used to query the top N items that have been recorded in a sketch.
 
+Sketches can also be moved between keys with EXPORT and IMPORT, or merged
+without leaving the server with MERGE.
+
 The named command to use is the first item passed as ``ARGV``.  The command is
 followed by the accuracy and storage parameters to use when initializing a new
 sketch:
@@ -646,4 +649,20 @@ return Router:new({
         end
     ),
 
+    --[[
+    Merge all of the sketches after the first into the first sketch, deleting
+    the merged sketches. This is equivalent to exporting each source, deleting
+    it and importing the export into the destination, without the sketch data
+    ever leaving the server.
+    ]]--
+    MERGE = Command:new(
+        function (sketches, arguments)
+            local destination, sources = head(sketches)
+            for _, source in ipairs(sources) do
+                destination:import(source:export())
+                redis.call('DEL', source.index, source.estimates)
+            end
+        end
+    ),
+
 })(KEYS, ARGV)
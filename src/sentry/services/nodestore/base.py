@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import struct
 from collections.abc import Mapping
+from concurrent.futures import as_completed
 from datetime import datetime, timedelta
-from threading import local
+from threading import Lock, local
 from typing import Any
 
 import sentry_sdk
 from django.core.cache import BaseCache, InvalidCacheBackendError, caches
+from django.db import close_old_connections
 from django.utils.functional import cached_property
 
 from sentry import options
+from sentry.services.nodestore import compression
 from sentry.utils import json, metrics
+from sentry.utils.concurrent import ContextPropagatingThreadPoolExecutor
 from sentry.utils.services import Service
 
 # Cache an instance of the encoder we want to use
@@ -28,6 +33,37 @@ json_dumps = json.JSONEncoder(
 
 json_loads = json.loads
 
+# Payloads can be written with a small offset table in front of the subkey
+# sections, so that reading a single subkey only needs to parse the table and
+# slice out that section. A JSON document can never start with a NUL byte,
+# which is what distinguishes this layout from the legacy newline-separated
+# one.
+INDEXED_SUBKEYS_MAGIC = b"\x00ns1"
+_INDEXED_SUBKEYS_COUNT = struct.Struct("<H")
+_INDEXED_SUBKEYS_KEY_LENGTH = struct.Struct("<B")
+_INDEXED_SUBKEYS_SECTION = struct.Struct("<II")  # offset, length
+
+_get_bytes_executor: tuple[int, ContextPropagatingThreadPoolExecutor] | None = None
+_get_bytes_executor_lock = Lock()
+
+
+def _get_get_bytes_executor(max_workers: int) -> ContextPropagatingThreadPoolExecutor:
+    # The pool is shared by all backends and calls, so that its threads (and
+    # the per-thread state of the thread-local backends) are set up once
+    # rather than on every multi-get.
+    global _get_bytes_executor
+    with _get_bytes_executor_lock:
+        if _get_bytes_executor is None or _get_bytes_executor[0] != max_workers:
+            if _get_bytes_executor is not None:
+                _get_bytes_executor[1].shutdown(wait=False)
+            _get_bytes_executor = (
+                max_workers,
+                ContextPropagatingThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="nodestore"
+                ),
+            )
+        return _get_bytes_executor[1]
+
 
 class NodeStorage(local, Service):
     """
@@ -72,12 +108,23 @@ class NodeStorage(local, Service):
         "get_multi",
         "set",
         "set_bytes",
+        "set_bytes_multi",
+        "set_multi",
         "set_subkeys",
+        "set_subkeys_multi",
         "cleanup",
         "validate",
         "bootstrap",
     )
 
+    # Whether `_get_bytes` may be called from several threads at once, which
+    # lets the default `_get_bytes_multi` fetch nodes concurrently.
+    concurrent_get_bytes = False
+
+    # Whether the backend compresses payloads itself, in which case they are
+    # not compressed with a dictionary by `set_subkeys` on top of that.
+    compresses_payloads = False
+
     def delete(self, id: str) -> None:
         """
         >>> nodestore.delete('key1')
@@ -96,10 +143,20 @@ class NodeStorage(local, Service):
         for id in id_list:
             self.delete(id)
 
+    def _compress(self, value: bytes, platform: str | None) -> bytes:
+        if self.compresses_payloads:
+            return value
+        return compression.compress(value, platform)
+
     def _decode(self, value: None | bytes, subkey: str | None) -> Any | None:
         if value is None:
             return None
 
+        value = compression.decompress(value)
+
+        if value.startswith(INDEXED_SUBKEYS_MAGIC):
+            return self._decode_indexed(value, subkey)
+
         lines_iter = iter(value.splitlines())
         try:
             if subkey is not None:
@@ -120,6 +177,27 @@ class NodeStorage(local, Service):
         except StopIteration:
             return None
 
+    def _decode_indexed(self, value: bytes, subkey: str | None) -> Any | None:
+        # The default (`None`) subkey is stored under the empty key.
+        _subkey = b"" if subkey is None else subkey.encode("ascii")
+
+        pos = len(INDEXED_SUBKEYS_MAGIC)
+        (count,) = _INDEXED_SUBKEYS_COUNT.unpack_from(value, pos)
+        pos += _INDEXED_SUBKEYS_COUNT.size
+
+        for _ in range(count):
+            (key_length,) = _INDEXED_SUBKEYS_KEY_LENGTH.unpack_from(value, pos)
+            pos += _INDEXED_SUBKEYS_KEY_LENGTH.size
+            key = value[pos : pos + key_length]
+            pos += key_length
+            offset, length = _INDEXED_SUBKEYS_SECTION.unpack_from(value, pos)
+            pos += _INDEXED_SUBKEYS_SECTION.size
+
+            if key == _subkey:
+                return json_loads(value[offset : offset + length])
+
+        return None
+
     def get_bytes(self, id: str) -> bytes | None:
         """
         >>> nodestore._get_bytes('key1')
@@ -169,7 +247,45 @@ class NodeStorage(local, Service):
             "key2": b'{"message": "hello world"}'
         }
         """
-        return {id: self._get_bytes(id) for id in id_list}
+        concurrency = options.get("nodestore.get-bytes-multi.concurrency")
+        if not self.concurrent_get_bytes or concurrency <= 1 or len(id_list) <= 1:
+            return {id: self._get_bytes(id) for id in id_list}
+
+        timeout = options.get("nodestore.get-bytes-multi.timeout") or None
+        return self._get_bytes_multi_concurrent(id_list, concurrency, timeout)
+
+    def _get_bytes_multi_concurrent(
+        self, id_list: list[str], max_workers: int, timeout: float | None
+    ) -> dict[str, bytes | None]:
+        """
+        Fetch ids on a shared pool of `max_workers` threads. Ids that have not
+        been fetched once `timeout` seconds have passed are returned as `None`,
+        like missing nodes.
+        """
+        rv: dict[str, bytes | None] = {id: None for id in id_list}
+
+        executor = _get_get_bytes_executor(max_workers)
+        futures = {executor.submit(self._get_bytes_in_worker, id): id for id in id_list}
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                rv[futures[future]] = future.result()
+        except TimeoutError:
+            pending = [future for future in futures if not future.done()]
+            # Fetches that haven't started yet are dropped, the ones in flight
+            # still occupy their worker until they finish.
+            for future in pending:
+                future.cancel()
+            metrics.incr("nodestore.get_bytes_multi.timeout", amount=len(pending))
+
+        return rv
+
+    def _get_bytes_in_worker(self, id: str) -> bytes | None:
+        try:
+            return self._get_bytes(id)
+        finally:
+            # Pool threads outlive the request, so don't leave database
+            # connections opened by the backend behind.
+            close_old_connections()
 
     def get_multi(self, id_list: list[str], subkey: str | None = None) -> dict[str, Any | None]:
         """
@@ -223,6 +339,9 @@ class NodeStorage(local, Service):
         >>> _encode({"unprocessed": {}, None: {"stacktrace": {}}})
         b'{"stacktrace": {}}\nunprocessed\n{}'
         """
+        if options.get("nodestore.encode-indexed-subkeys"):
+            return self._encode_indexed(data)
+
         lines = [json_dumps(data.pop(None)).encode("utf8")]
         for key, value in data.items():
             if key is not None:
@@ -231,6 +350,35 @@ class NodeStorage(local, Service):
 
         return b"\n".join(lines)
 
+    def _encode_indexed(self, data: dict[str | None, Mapping[str, Any]]) -> bytes:
+        """
+        Encode data dict as a header of (key, offset, length) entries followed
+        by the JSON payload of each subkey, so that `_decode` can slice out a
+        single subkey without splitting the whole payload.
+        """
+        sections = [(b"", json_dumps(data.pop(None)).encode("utf8"))]
+        for key, value in data.items():
+            if key is not None:
+                sections.append((key.encode("ascii"), json_dumps(value).encode("utf8")))
+
+        offset = (
+            len(INDEXED_SUBKEYS_MAGIC)
+            + _INDEXED_SUBKEYS_COUNT.size
+            + sum(
+                _INDEXED_SUBKEYS_KEY_LENGTH.size + len(key) + _INDEXED_SUBKEYS_SECTION.size
+                for key, _ in sections
+            )
+        )
+
+        header = [INDEXED_SUBKEYS_MAGIC, _INDEXED_SUBKEYS_COUNT.pack(len(sections))]
+        for key, payload in sections:
+            header.append(_INDEXED_SUBKEYS_KEY_LENGTH.pack(len(key)))
+            header.append(key)
+            header.append(_INDEXED_SUBKEYS_SECTION.pack(offset, len(payload)))
+            offset += len(payload)
+
+        return b"".join(header + [payload for _, payload in sections])
+
     def set_bytes(self, item_id: str, data: bytes, ttl: timedelta | None = None) -> None:
         """
         >>> nodestore.set_bytes('key1', b"{'foo': 'bar'}")
@@ -268,12 +416,71 @@ class NodeStorage(local, Service):
         {'foo': 'bam'}
         """
         cache_item = data.get(None)
-        bytes_data = self._encode(data)
+        platform = cache_item.get("platform") if cache_item else None
+        bytes_data = self._compress(self._encode(data), platform)
         self.set_bytes(item_id, bytes_data, ttl=ttl)
         # set cache only after encoding and write to nodestore has succeeded
         if options.get("nodestore.set-subkeys.enable-set-cache-item"):
             self._set_cache_item(item_id, cache_item)
 
+    def set_bytes_multi(self, items: Mapping[str, bytes], ttl: timedelta | None = None) -> None:
+        """
+        >>> nodestore.set_bytes_multi({'key1': b"{'foo': 'bar'}", 'key2': b"{'foo': 'baz'}"})
+        """
+        for data in items.values():
+            metrics.distribution("nodestore.set_bytes", len(data))
+        return self._set_bytes_multi(items, ttl)
+
+    def _set_bytes_multi(self, items: Mapping[str, bytes], ttl: timedelta | None = None) -> None:
+        # Backends should override this to write the whole batch in one
+        # round-trip.
+        for item_id, data in items.items():
+            self._set_bytes(item_id, data, ttl)
+
+    def set_multi(
+        self, items: Mapping[str, Mapping[str, Any]], ttl: timedelta | None = None
+    ) -> None:
+        """
+        Set values for several ids at once. Like `set`, this deletes existing
+        subkeys of each id.
+
+        >>> nodestore.set_multi({'key1': {'foo': 'bar'}, 'key2': {'foo': 'baz'}})
+        """
+        return self.set_subkeys_multi(
+            {item_id: {None: data} for item_id, data in items.items()}, ttl=ttl
+        )
+
+    @sentry_sdk.tracing.trace
+    def set_subkeys_multi(
+        self,
+        items: Mapping[str, dict[str | None, Mapping[str, Any]]],
+        ttl: timedelta | None = None,
+    ) -> None:
+        """
+        Set values and subkeys for several ids at once, see `set_subkeys`.
+
+        >>> nodestore.set_subkeys_multi({
+        ...    'key1': {None: {'foo': 'bar'}, "reprocessing": {'foo': 'bam'}},
+        ...    'key2': {None: {'foo': 'baz'}},
+        ... })
+        """
+        if not items:
+            return
+
+        bytes_items = {}
+        cache_items = {}
+        for item_id, data in items.items():
+            cache_item = data.get(None)
+            platform = cache_item.get("platform") if cache_item else None
+            bytes_items[item_id] = self._compress(self._encode(data), platform)
+            if cache_item:
+                cache_items[item_id] = cache_item
+
+        self.set_bytes_multi(bytes_items, ttl=ttl)
+        # set cache only after encoding and write to nodestore has succeeded
+        if options.get("nodestore.set-subkeys.enable-set-cache-item"):
+            self._set_cache_items(cache_items)
+
     def cleanup(self, cutoff_timestamp: datetime) -> None:
         raise NotImplementedError
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping
 from datetime import timedelta
 from typing import Any
 
@@ -35,6 +36,7 @@ class BigtableNodeStorage(NodeStorage):
     """
 
     store_class = BigtableKVStorage
+    concurrent_get_bytes = True
 
     def __init__(
         self,
@@ -63,6 +65,7 @@ class BigtableNodeStorage(NodeStorage):
         )
         self.automatic_expiry = automatic_expiry
         self.skip_deletes = automatic_expiry and "_SENTRY_CLEANUP" in os.environ
+        self.compresses_payloads = _compression is not None
 
     @sentry_sdk.tracing.trace
     def _get_bytes(self, id: str) -> bytes | None:
@@ -89,6 +92,12 @@ class BigtableNodeStorage(NodeStorage):
         with measure_storage_operation("put", "nodestore", len(data)):
             self.store.set(id, data, ttl)
 
+    def _set_bytes_multi(self, items: Mapping[str, bytes], ttl: timedelta | None = None) -> None:
+        with measure_storage_operation(
+            "put-multi", "nodestore", sum(len(data) for data in items.values())
+        ):
+            self.store.set_many(list(items.items()), ttl)
+
     def delete(self, id: str) -> None:
         if self.skip_deletes:
             return
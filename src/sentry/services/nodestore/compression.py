@@ -0,0 +1,89 @@
+"""
+Optional zstd compression of nodestore payloads.
+
+Event payloads from the same platform are very repetitive, so payloads can be
+compressed with a dictionary trained per platform (see the
+`train_nodestore_dictionaries` management command). Dictionaries are loaded
+from SENTRY_NODESTORE_ZSTD_DICTIONARY_DIR, and the id of the dictionary used
+is stored in the zstd frame header, so payloads written with a dictionary that
+is no longer used for writing can still be read as long as its file is kept.
+Backends that compress payloads on their own skip this layer.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import cache
+
+import zstandard
+from django.conf import settings
+
+from sentry import options
+from sentry.utils.codecs import ZstdCodec
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+DICTIONARY_SUFFIX = ".zdict"
+
+
+def dictionary_filename(platform: str, dictionary: zstandard.ZstdCompressionDict) -> str:
+    return f"{platform}.{dictionary.dict_id()}{DICTIONARY_SUFFIX}"
+
+
+@cache
+def load_dictionaries() -> dict[int, zstandard.ZstdCompressionDict]:
+    """
+    Load all dictionaries in SENTRY_NODESTORE_ZSTD_DICTIONARY_DIR, keyed by
+    their dictionary id.
+    """
+    path = settings.SENTRY_NODESTORE_ZSTD_DICTIONARY_DIR
+    if not path:
+        return {}
+
+    dictionaries = {}
+    for filename in sorted(os.listdir(path)):
+        if filename.endswith(DICTIONARY_SUFFIX):
+            with open(os.path.join(path, filename), "rb") as f:
+                dictionary = zstandard.ZstdCompressionDict(f.read())
+            dictionaries[dictionary.dict_id()] = dictionary
+    return dictionaries
+
+
+@cache
+def get_codec(dictionary_id: int) -> ZstdCodec:
+    """
+    Return a codec for the dictionary with the given id (0 for no
+    dictionary). Codecs are shared so that their compression contexts are
+    reused between payloads.
+    """
+    return ZstdCodec(load_dictionaries()[dictionary_id] if dictionary_id else None)
+
+
+def compress(value: bytes, platform: str | None) -> bytes:
+    """
+    Compress an encoded nodestore payload with the dictionary configured for
+    `platform` if compression is enabled. Payloads of platforms without a
+    dictionary are returned as-is.
+    """
+    if not options.get("nodestore.zstd-compression.enabled"):
+        return value
+
+    dictionary_id = options.get("nodestore.zstd-compression.dictionaries").get(platform or "")
+    if not dictionary_id or int(dictionary_id) not in load_dictionaries():
+        return value
+
+    return get_codec(int(dictionary_id)).encode(value)
+
+
+def decompress(value: bytes) -> bytes:
+    """
+    Decompress a nodestore payload written by `compress`. Uncompressed
+    payloads are returned as-is.
+    """
+    if not value.startswith(ZSTD_MAGIC):
+        return value
+
+    dictionary_id = zstandard.get_frame_parameters(value).dict_id
+    if dictionary_id and dictionary_id not in load_dictionaries():
+        raise ValueError(f"Unknown nodestore zstd dictionary {dictionary_id}")
+
+    return get_codec(dictionary_id).decode(value)
@@ -3,12 +3,14 @@ from __future__ import annotations
 import logging
 import math
 import pickle
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 from typing import Any
 
 from django.utils import timezone
 
-from sentry.services.nodestore.base import NodeStorage
+from sentry.services.nodestore import compression
+from sentry.services.nodestore.base import INDEXED_SUBKEYS_MAGIC, NodeStorage
 from sentry.utils.strings import compress, decompress
 
 from .models import Node
@@ -26,7 +28,9 @@ class DjangoNodeStorage(NodeStorage):
             return None
 
         try:
-            if value.startswith(b"{"):
+            value = compression.decompress(value)
+
+            if value.startswith((b"{", INDEXED_SUBKEYS_MAGIC)):
                 return NodeStorage._decode(self, value, subkey=subkey)
 
             if subkey is None:
@@ -56,6 +60,15 @@ class DjangoNodeStorage(NodeStorage):
             id=id, defaults={"data": compress(data), "timestamp": timezone.now()}
         )
 
+    def _set_bytes_multi(self, items: Mapping[str, bytes], ttl: timedelta | None = None) -> None:
+        timestamp = timezone.now()
+        Node.objects.bulk_create(
+            [Node(id=id, data=compress(data), timestamp=timestamp) for id, data in items.items()],
+            update_conflicts=True,
+            unique_fields=["id"],
+            update_fields=["data", "timestamp"],
+        )
+
     def cleanup(self, cutoff_timestamp: datetime) -> None:
         from sentry.db.deletion import BulkDeleteQuery
 
@@ -12,6 +12,8 @@ class FileSystemNodeStorage(NodeStorage):
     debugging and development!
     """
 
+    concurrent_get_bytes = True
+
     def __init__(self, path: str | None = None):
         self.path: str = ""
 
@@ -195,24 +195,37 @@ class SpansBuffer:
         redis_ttl = options.get("spans.buffer.redis-ttl")
         max_spans_per_evalsha = options.get("spans.buffer.max-spans-per-evalsha")
         pipeline_batch_size = options.get("spans.buffer.pipeline-batch-size")
+        pipeline_batch_max_bytes = options.get("spans.buffer.pipeline-batch-max-bytes")
         max_segment_bytes = options.get("spans.buffer.max-segment-bytes")
         flush_lock_ttl = options.get("spans.buffer.flusher.flush-lock-ttl")
         timeout = options.get("spans.buffer.timeout")
         root_timeout = options.get("spans.buffer.root-timeout")
 
-        trees, subsegment_batches = self._push_payloads(
-            spans,
-            redis_ttl=redis_ttl,
-            max_spans_per_evalsha=max_spans_per_evalsha,
-            pipeline_batch_size=pipeline_batch_size,
-        )
+        if options.get("spans.buffer.combined-insert-pipeline"):
+            trees, inserted_subsegments = self._push_and_insert_spans(
+                spans,
+                redis_ttl=redis_ttl,
+                max_spans_per_evalsha=max_spans_per_evalsha,
+                pipeline_batch_size=pipeline_batch_size,
+                pipeline_batch_max_bytes=pipeline_batch_max_bytes,
+                max_segment_bytes=max_segment_bytes,
+                flush_lock_ttl=flush_lock_ttl,
+            )
+        else:
+            trees, subsegment_batches = self._push_payloads(
+                spans,
+                redis_ttl=redis_ttl,
+                max_spans_per_evalsha=max_spans_per_evalsha,
+                pipeline_batch_size=pipeline_batch_size,
+                pipeline_batch_max_bytes=pipeline_batch_max_bytes,
+            )
 
-        inserted_subsegments = self._insert_spans(
-            subsegment_batches,
-            redis_ttl=redis_ttl,
-            max_segment_bytes=max_segment_bytes,
-            flush_lock_ttl=flush_lock_ttl,
-        )
+            inserted_subsegments = self._insert_spans(
+                subsegment_batches,
+                redis_ttl=redis_ttl,
+                max_segment_bytes=max_segment_bytes,
+                flush_lock_ttl=flush_lock_ttl,
+            )
 
         self._update_queue(
             trees,
@@ -260,11 +273,39 @@ class SpansBuffer:
         self,
         subsegments: list[Subsegment],
         pipeline_batch_size: int,
+        pipeline_batch_max_bytes: int = 0,
     ) -> Sequence[Sequence[Subsegment]]:
-        if pipeline_batch_size > 0:
-            return list(itertools.batched(subsegments, pipeline_batch_size))
-        else:
-            return [subsegments]
+        """
+        Split subsegments into batches of at most `pipeline_batch_size`
+        subsegments and (roughly) `pipeline_batch_max_bytes` payload bytes. A
+        single subsegment larger than the byte limit gets a batch of its own.
+        """
+        if pipeline_batch_max_bytes <= 0:
+            if pipeline_batch_size > 0:
+                return list(itertools.batched(subsegments, pipeline_batch_size))
+            else:
+                return [subsegments]
+
+        batches: list[list[Subsegment]] = []
+        current_batch: list[Subsegment] = []
+        current_bytes = 0
+        for subsegment in subsegments:
+            byte_count = subsegment.byte_count
+            if current_batch and (
+                current_bytes + byte_count > pipeline_batch_max_bytes
+                or 0 < pipeline_batch_size <= len(current_batch)
+            ):
+                batches.append(current_batch)
+                current_batch = []
+                current_bytes = 0
+
+            current_batch.append(subsegment)
+            current_bytes += byte_count
+
+        if current_batch:
+            batches.append(current_batch)
+
+        return batches
 
     def _push_payloads(
         self,
@@ -273,6 +314,7 @@ class SpansBuffer:
         redis_ttl: int,
         max_spans_per_evalsha: int,
         pipeline_batch_size: int,
+        pipeline_batch_max_bytes: int = 0,
     ) -> tuple[
         dict[tuple[str, str], list[Span]],
         Sequence[Sequence[Subsegment]],
@@ -280,7 +322,9 @@ class SpansBuffer:
         with metrics.timer("spans.buffer.process_spans.push_payloads"):
             trees = self._group_by_parent(spans)
             subsegments = self._build_subsegments(trees, max_spans_per_evalsha)
-            subsegment_batches = self._batch_subsegments(subsegments, pipeline_batch_size)
+            subsegment_batches = self._batch_subsegments(
+                subsegments, pipeline_batch_size, pipeline_batch_max_bytes
+            )
             self.store.store_payloads(
                 subsegment_batches,
                 redis_ttl=redis_ttl,
@@ -288,6 +332,39 @@ class SpansBuffer:
 
         return trees, subsegment_batches
 
+    def _push_and_insert_spans(
+        self,
+        spans: Sequence[Span],
+        *,
+        redis_ttl: int,
+        max_spans_per_evalsha: int,
+        pipeline_batch_size: int,
+        pipeline_batch_max_bytes: int,
+        max_segment_bytes: int,
+        flush_lock_ttl: int,
+    ) -> tuple[dict[tuple[str, str], list[Span]], list[InsertedSubsegment]]:
+        """
+        Combined version of `_push_payloads` and `_insert_spans`, which writes
+        payloads and runs the add-buffer script in one pipeline per batch.
+        """
+        with metrics.timer("spans.buffer.process_spans.push_and_insert_spans"):
+            trees = self._group_by_parent(spans)
+            subsegments = self._build_subsegments(trees, max_spans_per_evalsha)
+            subsegment_batches = self._batch_subsegments(
+                subsegments, pipeline_batch_size, pipeline_batch_max_bytes
+            )
+            self._emit_subsegment_debug_logs(subsegment_batches)
+
+            inserted_subsegments = self.store.store_and_insert_subsegments(
+                subsegment_batches,
+                redis_ttl=redis_ttl,
+                max_segment_bytes=max_segment_bytes,
+                flush_lock_ttl=flush_lock_ttl,
+            )
+
+        self._emit_insert_spans_metrics(inserted_subsegments)
+        return trees, inserted_subsegments
+
     def _insert_spans(
         self,
         batches: Sequence[Sequence[Subsegment]],
@@ -297,13 +374,7 @@ class SpansBuffer:
         flush_lock_ttl: int,
     ) -> list[InsertedSubsegment]:
         with metrics.timer("spans.buffer.process_spans.insert_spans"):
-            for batch in batches:
-                for subsegment in batch:
-                    SubsegmentDebugLog(
-                        project_and_trace=subsegment.project_and_trace,
-                        parent_span_id=subsegment.parent_span_id,
-                        subsegment=subsegment.spans,
-                    ).emit(self._get_debug_trace_logger)
+            self._emit_subsegment_debug_logs(batches)
 
             inserted_subsegments = self.store.insert_subsegments(
                 batches,
@@ -312,6 +383,19 @@ class SpansBuffer:
                 flush_lock_ttl=flush_lock_ttl,
             )
 
+        self._emit_insert_spans_metrics(inserted_subsegments)
+        return inserted_subsegments
+
+    def _emit_subsegment_debug_logs(self, batches: Sequence[Sequence[Subsegment]]) -> None:
+        for batch in batches:
+            for subsegment in batch:
+                SubsegmentDebugLog(
+                    project_and_trace=subsegment.project_and_trace,
+                    parent_span_id=subsegment.parent_span_id,
+                    subsegment=subsegment.spans,
+                ).emit(self._get_debug_trace_logger)
+
+    def _emit_insert_spans_metrics(self, inserted_subsegments: list[InsertedSubsegment]) -> None:
         # Emit metrics for insert spans / EVALSHA Lua script
         insert_spans_metrics = InsertSpansMetrics.from_inserted_subsegments(inserted_subsegments)
         insert_spans_metrics.emit_metrics()
@@ -319,8 +403,6 @@ class SpansBuffer:
         # Record cumulative latency per trace slow-operation logger
         self._buffer_logger.log(insert_spans_metrics.evalsha_latency_entries)
 
-        return inserted_subsegments
-
     def _emit_process_spans_count_metrics(
         self,
         spans: Sequence[Span],
@@ -100,27 +100,40 @@ class SpansBufferStore:
         """
         Store subsegment payload bytes in Redis sets keyed by subsegment salt.
         """
-        compression_level = options.get("spans.buffer.compression.level")
-        zstd_compressor = (
-            None if compression_level == -1 else zstandard.ZstdCompressor(level=compression_level)
-        )
+        zstd_compressor = self._get_zstd_compressor()
 
         for batch in batches:
             with self.client.pipeline(transaction=False) as p:
                 for subsegment in batch:
-                    set_members = self._prepare_payloads(
-                        subsegment.spans,
-                        zstd_compressor,
-                    )
-                    payload_key = self.get_payload_key(
-                        subsegment.project_and_trace,
-                        subsegment.salt,
-                    )
-                    p.sadd(payload_key, *set_members)
-                    p.expire(payload_key, redis_ttl)
+                    self._queue_store_payload(p, subsegment, zstd_compressor, redis_ttl=redis_ttl)
 
                 p.execute()
 
+    def _get_zstd_compressor(self) -> zstandard.ZstdCompressor | None:
+        compression_level = options.get("spans.buffer.compression.level")
+        return (
+            None if compression_level == -1 else zstandard.ZstdCompressor(level=compression_level)
+        )
+
+    def _queue_store_payload(
+        self,
+        p: Any,
+        subsegment: Subsegment,
+        zstd_compressor: zstandard.ZstdCompressor | None,
+        *,
+        redis_ttl: int,
+    ) -> None:
+        set_members = self._prepare_payloads(
+            subsegment.spans,
+            zstd_compressor,
+        )
+        payload_key = self.get_payload_key(
+            subsegment.project_and_trace,
+            subsegment.salt,
+        )
+        p.sadd(payload_key, *set_members)
+        p.expire(payload_key, redis_ttl)
+
     def _prepare_payloads(
         self,
         spans: list[Span],
@@ -165,20 +178,13 @@ class SpansBufferStore:
         for batch in batches:
             with self.client.pipeline(transaction=False) as p:
                 for subsegment in batch:
-                    p.execute_command(
-                        "EVALSHA",
+                    self._queue_add_buffer(
+                        p,
+                        subsegment,
                         add_buffer_sha,
-                        1,
-                        subsegment.project_and_trace,
-                        len(subsegment.spans),
-                        subsegment.parent_span_id,
-                        "true" if subsegment.has_segment_span else "false",
-                        redis_ttl,
-                        subsegment.byte_count,
-                        max_segment_bytes,
-                        subsegment.salt,
-                        check_flush_lock,
-                        *subsegment.span_ids,
+                        redis_ttl=redis_ttl,
+                        max_segment_bytes=max_segment_bytes,
+                        check_flush_lock=check_flush_lock,
                     )
 
                 redis_results = p.execute()
@@ -191,6 +197,80 @@ class SpansBufferStore:
 
         return inserted_subsegments
 
+    def store_and_insert_subsegments(
+        self,
+        batches: Sequence[Sequence[Subsegment]],
+        *,
+        redis_ttl: int,
+        max_segment_bytes: int,
+        flush_lock_ttl: int,
+    ) -> list[InsertedSubsegment]:
+        """
+        Combined version of `store_payloads` and `insert_subsegments`: store the
+        payloads and run the add-buffer Lua script for each batch in a single
+        pipeline, so every batch costs one round-trip per Redis node instead of two.
+
+        The Lua script never reads payload keys (it only records the salt in the
+        member-keys index), so it is safe to send both in the same pipeline.
+        """
+        check_flush_lock = "true" if flush_lock_ttl > 0 else "false"
+        zstd_compressor = self._get_zstd_compressor()
+        add_buffer_sha = self.ensure_script()
+
+        inserted_subsegments: list[InsertedSubsegment] = []
+        for batch in batches:
+            with self.client.pipeline(transaction=False) as p:
+                for subsegment in batch:
+                    self._queue_store_payload(p, subsegment, zstd_compressor, redis_ttl=redis_ttl)
+
+                for subsegment in batch:
+                    self._queue_add_buffer(
+                        p,
+                        subsegment,
+                        add_buffer_sha,
+                        redis_ttl=redis_ttl,
+                        max_segment_bytes=max_segment_bytes,
+                        check_flush_lock=check_flush_lock,
+                    )
+
+                redis_results = p.execute()
+
+            # Skip the SADD/EXPIRE results, two per subsegment
+            evalsha_results = redis_results[2 * len(batch) :]
+            assert len(batch) == len(evalsha_results)
+            inserted_subsegments.extend(
+                InsertedSubsegment.from_redis_result(subsegment, redis_result)
+                for subsegment, redis_result in zip(batch, evalsha_results)
+            )
+
+        return inserted_subsegments
+
+    def _queue_add_buffer(
+        self,
+        p: Any,
+        subsegment: Subsegment,
+        add_buffer_sha: str,
+        *,
+        redis_ttl: int,
+        max_segment_bytes: int,
+        check_flush_lock: str,
+    ) -> None:
+        p.execute_command(
+            "EVALSHA",
+            add_buffer_sha,
+            1,
+            subsegment.project_and_trace,
+            len(subsegment.spans),
+            subsegment.parent_span_id,
+            "true" if subsegment.has_segment_span else "false",
+            redis_ttl,
+            subsegment.byte_count,
+            max_segment_bytes,
+            subsegment.salt,
+            check_flush_lock,
+            *subsegment.span_ids,
+        )
+
     def update_queue(
         self,
         trees: dict[tuple[str, str], list[Span]],
@@ -222,38 +222,74 @@ class FlushedSegment(NamedTuple):
         Each message gets a unique flush_id generated at call time, ensuring duplicate
         flushes from Redis produce distinct IDs.
         """
-        max_segment_bytes = options.get("spans.buffer.max-segment-bytes")
-
         spans: list[SpanPayload] = [span.payload for span in self.spans]
 
         sizes = [len(orjson.dumps(s)) for s in spans]
-        if sum(sizes) <= max_segment_bytes:
-            return [{"flush_id": uuid.uuid4().hex, "spans": spans}]
+        chunks, skip_enrichment = self._chunk_by_size(sizes)
 
         messages: list[dict[str, Any]] = []
-        current: list[SpanPayload] = []
+        for chunk in chunks:
+            message: dict[str, Any] = {"flush_id": uuid.uuid4().hex, "spans": spans[chunk]}
+            if skip_enrichment:
+                message["skip_enrichment"] = True
+            messages.append(message)
+
+        return messages
+
+    def to_encoded_messages(self) -> list[tuple[bytes, int]]:
+        """
+        Same as `to_messages`, but returns the messages already JSON-encoded,
+        paired with the number of spans in each.
+
+        Every span is serialized exactly once: the encoded spans are used both
+        to measure the segment and, joined together, as the body of the output
+        messages. This avoids serializing each span a second time as part of
+        encoding the full message dict, which matters for large segments.
+        """
+        encoded_spans = [orjson.dumps(span.payload) for span in self.spans]
+        chunks, skip_enrichment = self._chunk_by_size([len(e) for e in encoded_spans])
+        suffix = b'],"skip_enrichment":true}' if skip_enrichment else b"]}"
+
+        return [
+            (
+                b'{"flush_id":"%s","spans":[%s%s'
+                % (uuid.uuid4().hex.encode("ascii"), b",".join(encoded_spans[chunk]), suffix),
+                chunk.stop - chunk.start,
+            )
+            for chunk in chunks
+        ]
+
+    def _chunk_by_size(self, sizes: Sequence[int]) -> tuple[list[slice], bool]:
+        """
+        Split the segment's spans into slices which each stay within
+        `spans.buffer.max-segment-bytes`, given the encoded size of each span.
+        Also returns whether the segment had to be split (in which case
+        enrichment should be skipped for every message).
+        """
+        max_segment_bytes = options.get("spans.buffer.max-segment-bytes")
+
+        if sum(sizes) <= max_segment_bytes:
+            return [slice(0, len(sizes))], False
+
+        chunks: list[slice] = []
+        start = 0
         current_size = 0
 
-        for span, size in zip(spans, sizes):
-            if current and current_size + size > max_segment_bytes:
-                messages.append(
-                    {"flush_id": uuid.uuid4().hex, "spans": current, "skip_enrichment": True}
-                )
-                current = []
+        for i, size in enumerate(sizes):
+            if i > start and current_size + size > max_segment_bytes:
+                chunks.append(slice(start, i))
+                start = i
                 current_size = 0
-            current.append(span)
             current_size += size
 
-        if current:
-            messages.append(
-                {"flush_id": uuid.uuid4().hex, "spans": current, "skip_enrichment": True}
-            )
+        if start < len(sizes):
+            chunks.append(slice(start, len(sizes)))
 
-        if len(messages) > 1:
+        if len(chunks) > 1:
             metrics.timing(
                 "spans.buffer.oversized_segments_chunked",
-                len(messages),
+                len(chunks),
             )
             metrics.timing("spans.buffer.oversized_segments_size", sum(sizes))
 
-        return messages
+        return chunks, True
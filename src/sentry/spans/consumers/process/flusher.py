@@ -8,7 +8,6 @@ from collections.abc import Callable, Mapping
 from concurrent.futures import Future
 from functools import partial
 
-import orjson
 import sentry_sdk
 from arroyo import Topic as ArroyoTopic
 from arroyo.backends.abstract import Producer
@@ -351,8 +350,8 @@ class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
                                 },
                             )
 
-                        for message in flushed_segment.to_messages():
-                            kafka_payload = KafkaPayload(None, orjson.dumps(message), [])
+                        for message, num_spans in flushed_segment.to_encoded_messages():
+                            kafka_payload = KafkaPayload(None, message, [])
                             metrics.timing(
                                 "spans.buffer.segment_size_bytes",
                                 len(kafka_payload.value),
@@ -361,7 +360,7 @@ class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
                             produce(
                                 flushed_segment.project_id,
                                 kafka_payload,
-                                len(message["spans"]),
+                                num_spans,
                             )
 
                 with metrics.timer("spans.buffer.flusher.wait_produce", tags={"shards": shard_tag}):
@@ -441,11 +441,11 @@ def normalize_stacktraces_for_grouping(
     # If a grouping config is available, run grouping enhancers
     if grouping_config is not None:
         with sentry_sdk.start_span(op=op, name="apply_modifications_to_frame"):
-            for frames, stacktrace_container in zip(stacktrace_frames, stacktrace_containers):
-                # This call has a caching mechanism when the same stacktrace and rules are used
-                grouping_config.enhancements.apply_category_and_updated_in_app_to_frames(
-                    frames, platform, stacktrace_container
-                )
+            # Run all of the event's stacktraces through the enhancer at once, so identical
+            # stacktraces (e.g. idle threads) only get matched against the rules a single time
+            grouping_config.enhancements.apply_category_and_updated_in_app_to_stacktraces(
+                list(zip(stacktrace_frames, stacktrace_containers)), platform
+            )
 
     # normalize `in_app` values, noting and storing the event's mix of in-app and system frames, so
     # we can track the mix with a metric in cases where this event creates a new group
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import functools
 import logging
 import random
+import threading
 import uuid
-from collections.abc import MutableMapping, Sequence
+from collections.abc import Generator, MutableMapping, Sequence
+from concurrent.futures import wait
+from contextlib import AbstractContextManager, ExitStack, contextmanager, nullcontext
 from datetime import datetime
-from time import time
+from time import thread_time, time
 from typing import TYPE_CHECKING, Any, Callable, TypedDict
 
 import sentry_sdk
 from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.db import close_old_connections, connections
 from django.db.models.signals import post_save
 from django.utils import timezone
 from google.api_core.exceptions import ServiceUnavailable
@@ -29,6 +35,7 @@ from sentry.taskworker.namespaces import ingest_errors_postprocess_tasks
 from sentry.types.group import GroupSubStatus
 from sentry.utils import json, metrics
 from sentry.utils.cache import cache
+from sentry.utils.concurrent import ContextPropagatingThreadPoolExecutor
 from sentry.utils.event import track_event_since_received
 from sentry.utils.event_frames import get_sdk_name
 from sentry.utils.locking import UnableToAcquireLock
@@ -656,50 +663,314 @@ def run_post_process_job(job: PostProcessJob) -> None:
     else:
         pipeline = GENERIC_POST_PROCESS_PIPELINE
 
-    for pipeline_step in pipeline:
-        try:
-            with (
-                metrics.timer(
-                    "tasks.post_process.run_post_process_job.pipeline.duration",
-                    tags={
-                        "pipeline": pipeline_step.__name__,
-                        "issue_category": issue_category_metric,
-                        "is_reprocessed": job["is_reprocessed"],
-                    },
-                ),
-                sentry_sdk.start_span(op=f"tasks.post_process_group.{pipeline_step.__name__}"),
-            ):
-                pipeline_step(job)
-        except Exception:
+    measure = random.random() < options.get("post_process.pipeline.step-metrics.sample-rate")
+    _run_pipeline(job, pipeline, issue_category_metric, measure)
+
+
+def _run_pipeline(
+    job: PostProcessJob,
+    pipeline: Sequence[Callable[[PostProcessJob], None]],
+    issue_category_metric: str | None,
+    measure: bool,
+) -> None:
+    max_workers = options.get("post_process.pipeline.max-workers")
+    if max_workers > 1:
+        levels = _get_pipeline_levels(tuple(pipeline))
+    else:
+        levels = [[pipeline_step] for pipeline_step in pipeline]
+
+    for level in levels:
+        if len(level) == 1:
+            _run_pipeline_step(job, level[0], issue_category_metric, measure)
+            halted_step = level[0] if job.get("halt_post_process") else None
+        else:
+            halted_step = _run_pipeline_level(
+                job, level, issue_category_metric, measure, max_workers
+            )
+
+        if halted_step is not None:
             metrics.incr(
-                "sentry.tasks.post_process.post_process_group.exception",
+                "sentry.tasks.post_process.post_process_group.halted",
                 tags={
                     "issue_category": issue_category_metric,
-                    "pipeline": pipeline_step.__name__,
+                    "pipeline": halted_step.__name__,
                 },
             )
-            logger.exception(
-                "Failed to process pipeline step %s",
-                pipeline_step.__name__,
-                extra={"event": group_event, "group": group_event.group},
+            break
+
+
+def _run_pipeline_level(
+    job: PostProcessJob,
+    level: Sequence[Callable[[PostProcessJob], None]],
+    issue_category_metric: str | None,
+    measure: bool,
+    max_workers: int,
+) -> Callable[[PostProcessJob], None] | None:
+    """
+    Run the steps of a level concurrently and return the step that halted the
+    pipeline, if any.
+
+    Every step works on its own shallow copy of the job, and the keys it sets
+    are merged back into the job in pipeline order once the level finished.
+    Steps that have not started by the time a sibling halts are skipped.
+    """
+    executor = _get_pipeline_executor(max_workers)
+    halted = threading.Event()
+    step_jobs = [PostProcessJob(**job) for _ in level]
+
+    def run_step(pipeline_step: Callable[[PostProcessJob], None], step_job: PostProcessJob) -> None:
+        if halted.is_set():
+            return
+        _run_pipeline_step_in_executor(step_job, pipeline_step, issue_category_metric, measure)
+        if step_job.get("halt_post_process"):
+            halted.set()
+
+    with metrics.timer(
+        "tasks.post_process.run_post_process_job.level.duration",
+        tags={"issue_category": issue_category_metric, "stages": len(level)},
+    ):
+        wait(
+            [
+                executor.submit(run_step, pipeline_step, step_job)
+                for pipeline_step, step_job in zip(level, step_jobs)
+            ]
+        )
+
+    original = dict(job)
+    halted_step = None
+    for pipeline_step, step_job in zip(level, step_jobs):
+        for key, value in step_job.items():
+            if key not in original or original[key] is not value:
+                job[key] = value  # type: ignore[literal-required]
+        if halted_step is None and step_job.get("halt_post_process"):
+            halted_step = pipeline_step
+    return halted_step
+
+
+def _run_pipeline_step(
+    job: PostProcessJob,
+    pipeline_step: Callable[[PostProcessJob], None],
+    issue_category_metric: str | None,
+    measure: bool = False,
+) -> None:
+    group_event = job["event"]
+    tags = {
+        "pipeline": pipeline_step.__name__,
+        "issue_category": issue_category_metric,
+        "is_reprocessed": job["is_reprocessed"],
+    }
+    try:
+        with (
+            metrics.timer("tasks.post_process.run_post_process_job.pipeline.duration", tags=tags),
+            sentry_sdk.start_span(op=f"tasks.post_process_group.{pipeline_step.__name__}"),
+            _measure_pipeline_step(tags) if measure else nullcontext(),
+            _pipeline_step_hook(pipeline_step.__name__, job),
+        ):
+            pipeline_step(job)
+    except Exception:
+        metrics.incr(
+            "sentry.tasks.post_process.post_process_group.exception",
+            tags={
+                "issue_category": issue_category_metric,
+                "pipeline": pipeline_step.__name__,
+            },
+        )
+        logger.exception(
+            "Failed to process pipeline step %s",
+            pipeline_step.__name__,
+            extra={"event": group_event, "group": group_event.group},
+        )
+    else:
+        metrics.incr(
+            "sentry.tasks.post_process.post_process_group.completed",
+            tags={
+                "issue_category": issue_category_metric,
+                "pipeline": pipeline_step.__name__,
+            },
+        )
+
+
+def _run_pipeline_step_in_executor(
+    job: PostProcessJob,
+    pipeline_step: Callable[[PostProcessJob], None],
+    issue_category_metric: str | None,
+    measure: bool,
+) -> None:
+    # Executor threads outlive the task and Django only cleans up connections
+    # at the end of a request, so drop any connection that went stale or broke
+    # since this thread last ran a step, and after running this one.
+    close_old_connections()
+    try:
+        _run_pipeline_step(job, pipeline_step, issue_category_metric, measure)
+    finally:
+        close_old_connections()
+
+
+@contextmanager
+def _measure_pipeline_step(tags: dict[str, Any]) -> Generator[None]:
+    """
+    Report CPU time, database queries and cache lookups of a single pipeline
+    step. All of them are measured for the current thread, so this is
+    accurate for steps that run concurrently as well.
+    """
+    queries = 0
+
+    def count_queries(execute, sql, params, many, context):
+        nonlocal queries
+        queries += 1
+        return execute(sql, params, many, context)
+
+    start = thread_time()
+    with ExitStack() as stack:
+        for conn in connections.all():
+            stack.enter_context(conn.execute_wrapper(count_queries))
+        cache_lookups = stack.enter_context(_count_cache_lookups())
+        try:
+            yield
+        finally:
+            metrics.distribution(
+                "tasks.post_process.run_post_process_job.pipeline.cpu_time",
+                (thread_time() - start) * 1000,
+                tags=tags,
+                unit="millisecond",
             )
-        else:
-            metrics.incr(
-                "sentry.tasks.post_process.post_process_group.completed",
-                tags={
-                    "issue_category": issue_category_metric,
-                    "pipeline": pipeline_step.__name__,
-                },
+            metrics.distribution(
+                "tasks.post_process.run_post_process_job.pipeline.db_queries",
+                queries,
+                tags=tags,
             )
-            if job.get("halt_post_process"):
+            for result, amount in cache_lookups.items():
                 metrics.incr(
-                    "sentry.tasks.post_process.post_process_group.halted",
-                    tags={
-                        "issue_category": issue_category_metric,
-                        "pipeline": pipeline_step.__name__,
-                    },
+                    "tasks.post_process.run_post_process_job.pipeline.cache",
+                    amount=amount,
+                    tags={**tags, "result": result},
                 )
-                break
+
+
+_CACHE_MISS = object()
+
+
+@contextmanager
+def _count_cache_lookups() -> Generator[dict[str, int]]:
+    """
+    Count hits and misses of the Django cache in the current thread. Django
+    keeps one cache instance per thread, so wrapping its lookups on the
+    instance does not affect other threads.
+    """
+    counts = {"hit": 0, "miss": 0}
+    backend = caches[DEFAULT_CACHE_ALIAS]
+    # Lookups may already be wrapped on the instance, e.g. by a nested measurement
+    overridden = {
+        name: vars(backend)[name] for name in ("get", "get_many") if name in vars(backend)
+    }
+    original_get = backend.get
+    original_get_many = backend.get_many
+
+    def get(key, default=None, version=None):
+        value = original_get(key, _CACHE_MISS, version=version)
+        if value is _CACHE_MISS:
+            counts["miss"] += 1
+            return default
+        counts["hit"] += 1
+        return value
+
+    def get_many(keys, version=None):
+        keys = list(keys)
+        values = original_get_many(keys, version=version)
+        counts["hit"] += len(values)
+        counts["miss"] += len(keys) - len(values)
+        return values
+
+    backend.get = get
+    backend.get_many = get_many
+    try:
+        yield counts
+    finally:
+        for name in ("get", "get_many"):
+            if name in overridden:
+                setattr(backend, name, overridden[name])
+            else:
+                delattr(backend, name)
+
+
+def _noop_pipeline_step_hook(step_name: str, job: PostProcessJob) -> AbstractContextManager[object]:
+    return nullcontext()
+
+
+_pipeline_step_hook: Callable[[str, PostProcessJob], AbstractContextManager[object]] = (
+    _noop_pipeline_step_hook
+)
+
+
+def set_pipeline_step_hook(
+    hook: Callable[[str, PostProcessJob], AbstractContextManager[object]],
+) -> None:
+    """
+    Install a context manager factory that wraps every post_process pipeline
+    step, e.g. to collect additional instrumentation.
+    """
+    global _pipeline_step_hook
+    _pipeline_step_hook = hook
+
+
+@functools.cache
+def _get_pipeline_levels(
+    pipeline: tuple[Callable[[PostProcessJob], None], ...],
+) -> list[list[Callable[[PostProcessJob], None]]]:
+    """
+    Group the steps of a pipeline into levels that can run concurrently.
+
+    A step listed in `POST_PROCESS_STAGE_DEPENDENCIES` runs in the level after
+    the last of its dependencies, but never before an unlisted step that
+    precedes it in the pipeline. Any other step runs after every step that
+    precedes it, so unlisted steps stay strictly ordered relative to the rest
+    of the pipeline.
+    """
+    levels: list[list[Callable[[PostProcessJob], None]]] = []
+    step_levels: dict[str, int] = {}
+    # The first level after the most recent unlisted step
+    min_level = 0
+
+    for pipeline_step in pipeline:
+        name = pipeline_step.__name__
+        dependencies = POST_PROCESS_STAGE_DEPENDENCIES.get(name)
+        if dependencies is None:
+            level = len(levels)
+            min_level = level + 1
+        else:
+            level = max(
+                (step_levels[dep] + 1 for dep in dependencies if dep in step_levels),
+                default=min_level,
+            )
+            level = max(level, min_level)
+
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(pipeline_step)
+        step_levels[name] = level
+
+    return levels
+
+
+_pipeline_executor: tuple[int, ContextPropagatingThreadPoolExecutor] | None = None
+_pipeline_executor_lock = threading.Lock()
+
+
+def _get_pipeline_executor(max_workers: int) -> ContextPropagatingThreadPoolExecutor:
+    # The pool is shared across tasks so that its threads, and the database
+    # connections they hold, are reused instead of being set up per event.
+    global _pipeline_executor
+    with _pipeline_executor_lock:
+        if _pipeline_executor is None or _pipeline_executor[0] != max_workers:
+            if _pipeline_executor is not None:
+                _pipeline_executor[1].shutdown(wait=False)
+            _pipeline_executor = (
+                max_workers,
+                ContextPropagatingThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="post_process_pipeline"
+                ),
+            )
+        return _pipeline_executor[1]
 
 
 def process_event(data: MutableMapping[str, Any], group_id: int | None) -> Event:
@@ -1660,6 +1931,39 @@ GROUP_CATEGORY_POST_PROCESS_PIPELINE: dict[
     ],
 }
 
+# Steps that update the group state the rest of the pipeline reads from (the
+# `has_reappeared`/`has_escalated` flags, inbox and escalation status) or that
+# may halt the pipeline.
+_GROUP_STATE_STAGES = frozenset(
+    (
+        "_capture_group_stats",
+        "process_snoozes",
+        "process_inbox_adds",
+        "process_malicious_issue_detection",
+        "detect_new_escalation",
+    )
+)
+
+# Steps that are safe to run concurrently with each other once their
+# dependencies have finished, see `_get_pipeline_levels`. Steps that aren't
+# listed here run strictly in pipeline order.
+POST_PROCESS_STAGE_DEPENDENCIES: dict[str, frozenset[str]] = {
+    "process_commits": _GROUP_STATE_STAGES,
+    "handle_owner_assignment": _GROUP_STATE_STAGES,
+    "handle_auto_assignment": _GROUP_STATE_STAGES | {"handle_owner_assignment"},
+    "process_code_mappings": _GROUP_STATE_STAGES,
+    "process_similarity": _GROUP_STATE_STAGES,
+    "update_existing_attachments": _GROUP_STATE_STAGES,
+    "fire_error_processed": _GROUP_STATE_STAGES,
+    "sdk_crash_monitoring": _GROUP_STATE_STAGES,
+    "process_replay_link": _GROUP_STATE_STAGES,
+    "link_event_to_user_report": _GROUP_STATE_STAGES,
+    "detect_base_urls_for_uptime": _GROUP_STATE_STAGES,
+    "check_if_flags_sent": _GROUP_STATE_STAGES,
+    "process_processing_errors_eap": _GROUP_STATE_STAGES,
+    "process_processing_issue_detection": _GROUP_STATE_STAGES,
+}
+
 GENERIC_POST_PROCESS_PIPELINE: list[Callable[[PostProcessJob], None]] = [
     process_snoozes,
     process_inbox_adds,
@@ -4,6 +4,7 @@ from typing import Any
 import sentry_sdk
 from django.apps import apps
 
+from sentry import options
 from sentry.db.models.base import Model
 from sentry.tasks.base import instrumented_task
 from sentry.taskworker.namespaces import buffer_tasks
@@ -30,6 +31,15 @@ def process_pending() -> None:
     """
     from sentry import buffer
 
+    num_partitions = options.get("buffer.process-pending.num-partitions")
+    if num_partitions > 1:
+        for partition in range(num_partitions):
+            process_pending_partition.apply_async(
+                kwargs={"partition": partition, "num_partitions": num_partitions},
+                headers={"sentry-propagate-traces": False},
+            )
+        return
+
     lock = get_process_lock("process_pending")
 
     try:
@@ -39,6 +49,28 @@ def process_pending() -> None:
         logger.warning("process_pending.fail", extra={"error": error})
 
 
+@instrumented_task(
+    name="sentry.tasks.process_buffer.process_pending_partition",
+    namespace=buffer_tasks,
+    processing_deadline_duration=60,
+)
+def process_pending_partition(partition: int, num_partitions: int) -> None:
+    """
+    Process the pending buffers belonging to a single partition of the pending set.
+    """
+    from sentry import buffer
+
+    lock = get_process_lock(f"process_pending:{partition}")
+
+    try:
+        with lock.acquire():
+            buffer.backend.process_pending(partition=partition, num_partitions=num_partitions)
+    except UnableToAcquireLock as error:
+        logger.warning(
+            "process_pending_partition.fail", extra={"error": error, "partition": partition}
+        )
+
+
 @instrumented_task(
     name="sentry.tasks.process_buffer.process_incr",
     namespace=buffer_tasks,
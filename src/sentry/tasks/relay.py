@@ -1,5 +1,6 @@
 import logging
 import time
+from collections import defaultdict
 
 import sentry_sdk
 from django.db import connections, router, transaction
@@ -138,22 +139,7 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
         # it could be possible that refrequent invalidations cause the task to take excessive time
         # to complete.
         for organization in Organization.objects.filter(id=organization_id):
-            for project in Project.objects.filter(organization_id=organization_id):
-                project.set_cached_field_value("organization", organization)
-                for key in ProjectKey.objects.filter(project_id=project.id):
-                    key.set_cached_field_value("project", project)
-                    # If we find the config in the cache it means it was active.  As such we want to
-                    # recalculate it.  If the config was not there at all, we leave it and avoid the
-                    # cost of re-computation.
-                    if projectconfig_cache.backend.get(key.public_key) is not None:
-                        configs[key.public_key] = compute_projectkey_config(key)
-                        action = "recompute"
-                    else:
-                        action = "not-cached"
-                    metrics.incr(
-                        "relay.projectconfig_cache.invalidation.recompute",
-                        tags={"action": action, "scope": "organization"},
-                    )
+            configs.update(compute_organization_configs(organization))
     elif project_id:
         for project in Project.objects.filter(id=project_id):
             for key in ProjectKey.objects.filter(project_id=project_id):
@@ -192,6 +178,68 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
     return configs
 
 
+def compute_organization_configs(organization):
+    """Computes the configs of all keys in the organization that are currently cached.
+
+    Projects and keys are loaded with one query each, the cache is checked
+    for all keys at once and organization-level inputs are loaded once, so
+    that this scales to organizations with many projects.
+
+    :returns: A dict mapping the public keys to their config.
+    """
+    from sentry.models.project import Project
+    from sentry.models.projectkey import ProjectKey, ProjectKeyStatus
+    from sentry.relay.config import get_organization_config_inputs, get_project_key_configs
+
+    projects = {
+        project.id: project for project in Project.objects.filter(organization_id=organization.id)
+    }
+    keys = list(ProjectKey.objects.filter(project_id__in=projects))
+
+    # If we find the config in the cache it means it was active.  As such we want to
+    # recalculate it.  If the config was not there at all, we leave it and avoid the
+    # cost of re-computation.
+    cached = projectconfig_cache.backend.exists_many([key.public_key for key in keys])
+    metrics.incr(
+        "relay.projectconfig_cache.invalidation.recompute",
+        amount=len(cached),
+        tags={"action": "recompute", "scope": "organization"},
+    )
+    metrics.incr(
+        "relay.projectconfig_cache.invalidation.recompute",
+        amount=len(keys) - len(cached),
+        tags={"action": "not-cached", "scope": "organization"},
+    )
+
+    configs = {}
+    keys_by_project = defaultdict(list)
+    for key in keys:
+        if key.public_key not in cached:
+            continue
+        if key.status != ProjectKeyStatus.ACTIVE:
+            configs[key.public_key] = {"disabled": True}
+            continue
+        key.set_cached_field_value("project", projects[key.project_id])
+        keys_by_project[key.project_id].append(key)
+
+    if not keys_by_project:
+        return configs
+
+    # Organization features, options and quotas are the same for every project, so load them
+    # once instead of once per project.
+    organization_inputs = get_organization_config_inputs(organization)
+    for project_id, project_keys in keys_by_project.items():
+        project = projects[project_id]
+        project.set_cached_field_value("organization", organization)
+        project_configs = get_project_key_configs(
+            project, project_keys, organization_inputs=organization_inputs
+        )
+        for public_key, config in project_configs.items():
+            configs[public_key] = config.to_dict()
+
+    return configs
+
+
 def compute_projectkey_config(key):
     """Computes a single config for the given :class:`ProjectKey`.
 
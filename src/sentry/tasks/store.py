@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import random
-from collections.abc import Mapping, MutableMapping
+from collections.abc import Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -739,6 +739,92 @@ def save_event_transaction(
         )
 
 
+def _do_save_event_transactions_many(
+    project_id: int, events: Sequence[Mapping[str, Any]]
+) -> None:
+    """
+    Saves a batch of transactions of one project, as collected by the ingest
+    consumer, running each stage of the save pipeline once for the whole batch.
+    Each item holds the arguments `save_event_transaction` would have been
+    called with.
+    """
+
+    set_current_event_project(project_id)
+
+    from sentry.event_manager import EventManager, resolve_project
+
+    processing_store = processing.transaction_processing_store
+    loaded: list[tuple[Mapping[str, Any], MutableMapping[str, Any]]] = []
+
+    for event in events:
+        track_sampled_event(
+            event["event_id"], ConsumerType.Transactions, TransactionStageStatus.SAVE_TXN_STARTED
+        )
+        data = processing_store.get(event["cache_key"])
+        if not data:
+            metrics.incr(
+                "events.failed", tags={"reason": "cache", "stage": "post"}, skip_internal=False
+            )
+            continue
+        track_event_since_received(step="start_save_event", event_data=data)
+        loaded.append((event, data))
+
+    if not loaded:
+        return
+
+    metrics.distribution("events.save_event_transactions_many.batch_size", len(loaded))
+
+    with metrics.global_tags(tags={"event_type": "transaction"}):
+        try:
+            project = resolve_project(project_id)
+            to_save = [
+                (EventManager(data), project, event["start_time"])
+                for event, data in loaded
+                if not killswitch_matches_context(
+                    "store.load-shed-save-event-projects",
+                    {
+                        "project_id": project_id,
+                        "event_type": "transaction",
+                        "platform": data.get("platform") or "none",
+                    },
+                )
+            ]
+            if to_save:
+                EventManager.save_many(to_save, assume_normalized=True)
+        except Exception:
+            metrics.incr("events.save_event.exception", tags={"event_type": "transaction"})
+            raise
+        finally:
+            # we won't use the transaction data in post_process so we can delete
+            # it from the cache now.
+            for event, data in loaded:
+                processing_store.delete_by_key(event["cache_key"])
+                track_sampled_event(
+                    data["event_id"],
+                    ConsumerType.Transactions,
+                    TransactionStageStatus.REDIS_DELETED,
+                )
+                reprocessing2.mark_event_reprocessed(data)
+                track_event_since_received(step="end_save_event", event_data=data)
+
+    for event, _ in loaded:
+        track_sampled_event(
+            event["event_id"], ConsumerType.Transactions, TransactionStageStatus.SAVE_TXN_FINISHED
+        )
+
+
+@instrumented_task(
+    name="sentry.tasks.store.save_event_transactions_many",
+    namespace=ingest_transactions_tasks,
+    processing_deadline_duration=65,
+    silo_mode=SiloMode.CELL,
+)
+def save_event_transactions_many(
+    project_id: int, events: list[dict[str, Any]], **kwargs: Any
+) -> None:
+    _do_save_event_transactions_many(project_id, events)
+
+
 @instrumented_task(
     name="sentry.tasks.store.save_event_feedback",
     namespace=issues_tasks,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib.util
 import socket
 
 import pytest
@@ -17,6 +18,10 @@ def _service_available(host: str, port: int) -> bool:
         return True
 
 
+def _module_available(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
 def _requires_service_message(name: str) -> str:
     return f"requires '{name}' server running\n\t💡 Hint: run `devservices up`"
 
@@ -56,3 +61,7 @@ requires_snuba = pytest.mark.usefixtures("_requires_snuba")
 requires_symbolicator = pytest.mark.usefixtures("_requires_symbolicator")
 requires_kafka = pytest.mark.usefixtures("_requires_kafka")
 requires_objectstore = pytest.mark.usefixtures("_requires_objectstore")
+
+requires_pytest_benchmark = pytest.mark.skipif(
+    not _module_available("pytest_benchmark"), reason="requires pytest-benchmark"
+)
@@ -2,8 +2,10 @@ import binascii
 import itertools
 import logging
 import uuid
+from array import array
 from collections import defaultdict, namedtuple
 from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime
 from hashlib import md5
 from typing import Any, ContextManager, Generic, TypeVar
@@ -13,6 +15,7 @@ from django.utils import timezone
 from django.utils.encoding import force_bytes
 from redis.client import Script
 
+from sentry import options as sentry_options
 from sentry.tsdb.base import (
     BaseTSDB,
     IncrMultiOptions,
@@ -66,6 +69,35 @@ class SuppressionWrapper(Generic[T]):
         return True
 
 
+@dataclass(frozen=True)
+class CounterRange:
+    """\
+    Counter values for a set of keys over a shared series of rollup epochs.
+
+    The values are stored row-major (one row of ``len(series)`` values per
+    key) in a single flat integer array, which is much smaller than the
+    equivalent mapping of key => [(timestamp, count), ...] when reading
+    hundreds of keys at once.
+    """
+
+    keys: Sequence[TSDBKey]
+    series: Sequence[int]
+    values: array
+
+    def get_values(self, index: int) -> array:
+        width = len(self.series)
+        return self.values[index * width : (index + 1) * width]
+
+    def to_dict(self) -> dict[TSDBKey, list[tuple[int, int]]]:
+        return {
+            key: list(zip(self.series, self.get_values(index)))
+            for index, key in enumerate(self.keys)
+        }
+
+    def totals(self) -> dict[TSDBKey, int]:
+        return {key: sum(self.get_values(index)) for index, key in enumerate(self.keys)}
+
+
 class RedisTSDB(BaseTSDB):
     """
     A time series storage backend for Redis.
@@ -192,6 +224,20 @@ class RedisTSDB(BaseTSDB):
 
         Returns a 2-tuple that contains the hash key and the hash field.
         """
+        vnode, hash_field = self.make_counter_vnode_and_field(key, environment_id)
+        return (
+            f"{self.prefix}{model.value}:{self.normalize_to_rollup(timestamp, rollup)}:{vnode}",
+            hash_field,
+        )
+
+    def make_counter_vnode_and_field(
+        self, key: int | str | bytes, environment_id: int | None
+    ) -> tuple[int, str | int]:
+        """
+        Returns a 2-tuple that contains the vnode (the hash key suffix) and
+        the hash field used for a counter key, which do not depend on the
+        rollup or timestamp.
+        """
         model_key = self.get_model_key(key)
 
         if isinstance(model_key, int):
@@ -199,10 +245,7 @@ class RedisTSDB(BaseTSDB):
         else:
             vnode = _crc32(force_bytes(model_key)) % self.vnodes
 
-        return (
-            f"{self.prefix}{model.value}:{self.normalize_to_rollup(timestamp, rollup)}:{vnode}",
-            self.add_environment_parameter(model_key, environment_id),
-        )
+        return vnode, self.add_environment_parameter(model_key, environment_id)
 
     def get_model_key(self, key: int | str | bytes) -> int | str:
         # We specialize integers so that a pure int-map can be optimized by
@@ -329,31 +372,78 @@ class RedisTSDB(BaseTSDB):
             raise NotImplementedError
         environment_id = environment_ids[0] if environment_ids else None
 
+        return self.get_range_counts(model, keys, start, end, rollup, environment_id).to_dict()
+
+    def get_timeseries_sums(
+        self,
+        model: TSDBModel,
+        keys: Sequence[TSDBKey],
+        start: datetime,
+        end: datetime,
+        rollup: int | None = None,
+        environment_id: int | None = None,
+        use_cache: bool = False,
+        jitter_value: int | None = None,
+        tenant_ids: dict[str, str | int] | None = None,
+        referrer_suffix: str | None = None,
+        conditions: list[SnubaCondition] | None = None,
+        group_on_time: bool = True,
+        project_ids: Sequence[int] | None = None,
+    ) -> dict[TSDBKey, int]:
+        return self.get_range_counts(model, keys, start, end, rollup, environment_id).totals()
+
+    def get_range_counts(
+        self,
+        model: TSDBModel,
+        keys: Sequence[TSDBKey],
+        start: datetime,
+        end: datetime,
+        rollup: int | None = None,
+        environment_id: int | None = None,
+    ) -> "CounterRange":
+        """
+        Fetch the counter values for many keys at once, returning them as a
+        ``CounterRange`` rather than a mapping of per-key point lists.
+
+        Counters for different keys in the same rollup bucket and vnode share
+        a hash, so all of the fields needed from each hash are read with a
+        single ``HMGET``, and the commands for each host are pipelined by the
+        cluster map.
+        """
         self.validate_arguments([model], [environment_id])
 
         rollup, series = self.get_optimal_rollup_series(start, end, rollup)
-        _series = [to_datetime(item) for item in series]
+        keys = list(dict.fromkeys(keys))
+
+        # hash_key -> ([value index, ...], [hash field, ...])
+        fields_by_hash_key: dict[str, tuple[list[int], list[str | int]]] = defaultdict(
+            lambda: ([], [])
+        )
+        hash_key_prefixes = [
+            f"{self.prefix}{model.value}:{self.normalize_to_rollup(epoch, rollup)}:"
+            for epoch in series
+        ]
+        for key_index, key in enumerate(keys):
+            vnode, hash_field = self.make_counter_vnode_and_field(key, environment_id)
+            for series_index, hash_key_prefix in enumerate(hash_key_prefixes):
+                indexes, fields = fields_by_hash_key[f"{hash_key_prefix}{vnode}"]
+                indexes.append(key_index * len(series) + series_index)
+                fields.append(hash_field)
 
-        results = []
         cluster, _ = self.get_cluster(environment_id)
         with cluster.map() as client:
-            for key in keys:
-                for timestamp in _series:
-                    hash_key, hash_field = self.make_counter_key(
-                        model, rollup, timestamp, key, environment_id
-                    )
-                    results.append(
-                        (int(timestamp.timestamp()), key, client.hget(hash_key, hash_field))
-                    )
+            promises = [
+                (indexes, client.hmget(hash_key, fields))
+                for hash_key, (indexes, fields) in fields_by_hash_key.items()
+            ]
 
-        results_by_key: dict[TSDBKey, dict[int, int]] = defaultdict(dict)
-        for epoch, key, count in results:
-            results_by_key[key][epoch] = int(count.value or 0)
+        values = array("q", bytes(8 * len(keys) * len(series)))
+        for indexes, promise in promises:
+            for index, value in zip(indexes, promise.value):
+                if value:
+                    values[index] = int(value)
 
-        output = {}
-        for key, points in results_by_key.items():
-            output[key] = sorted(points.items())
-        return output
+        return CounterRange(keys=keys, series=series, values=values)
 
     def merge(
         self,
@@ -810,11 +900,29 @@ class RedisTSDB(BaseTSDB):
             )
             rollups.append((rollup, [to_datetime(item) for item in rollup_series]))
 
+        parameters = list(self.DEFAULT_SKETCH_PARAMETERS)
+        batch_size = max(sentry_options.get("tsdb.redis.frequency-merge-batch-size"), 1)
+
         for (cluster, durable), _ids in self.get_cluster_groups(ids):
+            # Frequency tables are routed by their key, so any sources that
+            # live on the same host as the destination can be merged by the
+            # script without the sketches being transferred through here.
+            router = cluster.get_router()
+            destination_host = router.get_host_for_key(destination)
+            local_sources = []
+            remote_sources = []
+            for source in sources:
+                if source == destination:
+                    continue
+                elif router.get_host_for_key(source) == destination_host:
+                    local_sources.append(source)
+                else:
+                    remote_sources.append(source)
+
             exports: dict[TSDBKey, list[tuple[Script, list[str], list[str]] | list[str]]]
             exports = defaultdict(list)
 
-            for source in sources:
+            for source in remote_sources:
                 for rollup, series in rollups:
                     for serie_timestamp in series:
                         keys: list[str] = []
@@ -828,41 +936,66 @@ class RedisTSDB(BaseTSDB):
                                     environment_id,
                                 )
                             )
-                        arguments = ["EXPORT"] + list(self.DEFAULT_SKETCH_PARAMETERS)
+                        arguments = ["EXPORT"] + parameters
                         exports[source].extend([(CountMinScript, keys, arguments), ["DEL"] + keys])
 
             try:
-                responses = cluster.execute_commands(exports)
+                responses = cluster.execute_commands(exports) if exports else {}
             except Exception:
                 if durable:
                     raise
                 else:
                     continue
 
-            imports = []
-
+            # (rollup, timestamp, environment_id) -> [payload, ...]
+            payloads: dict[tuple[int, datetime, int | None], list[bytes]] = defaultdict(list)
             for source, results in responses.items():
                 results = iter(results)
                 for rollup, series in rollups:
                     for _timestamp in series:
                         for environment_id, payload in zip(_ids, next(results).value):
-                            imports.append(
-                                (
-                                    CountMinScript,
+                            payloads[(rollup, _timestamp, environment_id)].append(payload)
+                        next(results)  # pop off the result of DEL
+
+            merges = []
+            imports = []
+            for rollup, series in rollups:
+                for _timestamp in series:
+                    for environment_id in _ids:
+                        destination_keys = self.make_frequency_table_keys(
+                            model, rollup, _timestamp.timestamp(), destination, environment_id
+                        )
+
+                        # The script unpacks its keys and arguments, so
+                        # merges are split into bounded batches of sources.
+                        for source_batch in itertools.batched(local_sources, batch_size):
+                            keys = list(destination_keys)
+                            for source in source_batch:
+                                keys.extend(
                                     self.make_frequency_table_keys(
                                         model,
                                         rollup,
                                         _timestamp.timestamp(),
-                                        destination,
+                                        source,
                                         environment_id,
-                                    ),
-                                    ["IMPORT"] + list(self.DEFAULT_SKETCH_PARAMETERS) + [payload],
+                                    )
+                                )
+                            merges.append((CountMinScript, keys, ["MERGE"] + parameters))
+
+                        # Exported payloads for this sketch are imported in
+                        # batches by repeating the destination keys.
+                        _payloads = payloads.get((rollup, _timestamp, environment_id), [])
+                        for payload_batch in itertools.batched(_payloads, batch_size):
+                            imports.append(
+                                (
+                                    CountMinScript,
+                                    destination_keys * len(payload_batch),
+                                    ["IMPORT"] + parameters + list(payload_batch),
                                 )
                             )
-                        next(results)  # pop off the result of DEL
 
             try:
-                cluster.execute_commands({destination: imports})
+                cluster.execute_commands({destination: merges + imports})
             except Exception:
                 if durable:
                     raise
@@ -1,5 +1,9 @@
+import sys
+import threading
 import zlib
 from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import Any, Generic, TypeVar
 
 import zstandard
@@ -78,16 +82,175 @@ class JSONCodec(Codec[Any, str]):
 
 
 class ZlibCodec(Codec[bytes, bytes]):
+    def __init__(self, level: int = zlib.Z_DEFAULT_COMPRESSION) -> None:
+        self.level = level
+
     def encode(self, value: bytes) -> bytes:
-        return zlib.compress(value)
+        return zlib.compress(value, self.level)
 
     def decode(self, value: bytes) -> bytes:
         return zlib.decompress(value)
 
+    def encode_iter(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Compress a value provided as a sequence of chunks, yielding the
+        compressed output as it becomes available. The result can be decoded
+        with either `decode` or `decode_iter`.
+        """
+        compressor = zlib.compressobj(self.level)
+        for chunk in chunks:
+            if compressed := compressor.compress(chunk):
+                yield compressed
+        yield compressor.flush()
+
+    def decode_iter(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        decompressor = zlib.decompressobj()
+        for chunk in chunks:
+            if decompressed := decompressor.decompress(chunk):
+                yield decompressed
+        yield decompressor.flush()
+
 
 class ZstdCodec(Codec[bytes, bytes]):
+    """
+    Compress/decompress bytes with zstd, optionally using a trained
+    dictionary. The dictionary id is written into each frame header.
+
+    Compression contexts are expensive to set up relative to compressing a
+    small value, so each thread reuses its own compressor and decompressor
+    (they are not safe to use concurrently.)
+    """
+
+    def __init__(
+        self, dictionary: zstandard.ZstdCompressionDict | None = None, level: int = 3
+    ) -> None:
+        self.dictionary = dictionary
+        self.level = level
+        self._local = threading.local()
+
+    @property
+    def compressor(self) -> zstandard.ZstdCompressor:
+        try:
+            return self._local.compressor
+        except AttributeError:
+            compressor = self._local.compressor = zstandard.ZstdCompressor(
+                level=self.level, dict_data=self.dictionary
+            )
+            return compressor
+
+    @property
+    def decompressor(self) -> zstandard.ZstdDecompressor:
+        try:
+            return self._local.decompressor
+        except AttributeError:
+            decompressor = self._local.decompressor = zstandard.ZstdDecompressor(
+                dict_data=self.dictionary
+            )
+            return decompressor
+
     def encode(self, value: bytes) -> bytes:
-        return zstandard.ZstdCompressor().compress(value)
+        return self.compressor.compress(value)
 
     def decode(self, value: bytes) -> bytes:
-        return zstandard.ZstdDecompressor().decompress(value)
+        return self.decompressor.decompress(value)
+
+    def encode_iter(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Compress a value provided as a sequence of chunks, yielding the
+        compressed output as it becomes available. The frame does not record
+        the size of the value, so it must be decoded with `decode_iter`.
+        """
+        # A compressobj must not share its compressor with anything else while
+        # it is alive, and a suspended generator may overlap with `encode` calls
+        # on the same thread, so streaming gets its own context.
+        compressor = zstandard.ZstdCompressor(
+            level=self.level, dict_data=self.dictionary
+        ).compressobj()
+        for chunk in chunks:
+            if compressed := compressor.compress(chunk):
+                yield compressed
+        yield compressor.flush()
+
+    def decode_iter(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        decompressor = zstandard.ZstdDecompressor(dict_data=self.dictionary).decompressobj()
+        for chunk in chunks:
+            if decompressed := decompressor.decompress(chunk):
+                yield decompressed
+
+
+class ColumnarResultCodec(Codec[Mapping[str, Any], bytes]):
+    """
+    Encode/decode Snuba results to/from a columnar layout.
+
+    The column names of `data` are written once in a JSON header, integer and
+    float columns follow as packed little-endian arrays. Columns with any other
+    or mixed types (strings, nulls, lists) are written as JSON lists. Results
+    whose rows don't all have the same columns are kept in the header as is.
+    """
+
+    ARRAY_TYPECODES = {int: "q", float: "d"}
+
+    def encode(self, value: Mapping[str, Any]) -> bytes:
+        rows = value.get("data")
+        names = list(rows[0]) if isinstance(rows, list) and rows else []
+        if not isinstance(rows, list) or any(list(row) != names for row in rows):
+            return json.dumps({"result": value, "columns": None}).encode() + b"\n"
+
+        columns = []
+        blobs = []
+        for name in names:
+            values = [row[name] for row in rows]
+            if (packed := self._encode_array(values)) is not None:
+                kind, blob = packed.typecode, packed.tobytes()
+            else:
+                kind, blob = "json", json.dumps(values).encode()
+            columns.append((name, kind, len(blob)))
+            blobs.append(blob)
+
+        header = {
+            "result": {k: v for k, v in value.items() if k != "data"},
+            "rows": len(rows),
+            "columns": columns,
+        }
+        return json.dumps(header).encode() + b"\n" + b"\n".join(blobs)
+
+    def decode(self, value: bytes) -> Mapping[str, Any]:
+        header_end = value.index(b"\n")
+        header = json.loads(value[:header_end])
+        if header["columns"] is None:
+            return header["result"]
+
+        names = []
+        columns: list[Sequence[Any]] = []
+        offset = header_end + 1
+        for name, kind, length in header["columns"]:
+            blob = value[offset : offset + length]
+            offset += length + 1
+            names.append(name)
+            if kind == "json":
+                columns.append(json.loads(blob))
+            else:
+                values = array(kind, blob)
+                if sys.byteorder == "big":
+                    values.byteswap()
+                columns.append(values.tolist())
+
+        result = header["result"]
+        if columns:
+            result["data"] = [dict(zip(names, row)) for row in zip(*columns)]
+        else:
+            result["data"] = [{} for _ in range(header["rows"])]
+        return result
+
+    def _encode_array(self, values: list[Any]) -> array[Any] | None:
+        value_type = type(values[0])
+        typecode = self.ARRAY_TYPECODES.get(value_type)
+        if typecode is None or any(type(v) is not value_type for v in values):
+            return None
+        try:
+            encoded = array(typecode, values)
+        except OverflowError:
+            return None
+        if sys.byteorder == "big":
+            encoded.byteswap()
+        return encoded
@@ -40,7 +40,7 @@ class LRUCache[K, V]:
         self.cache[key] = value
         self.cache.move_to_end(key)
         if len(self.cache) > self.maxlen:
-            self.cache.popitem(last=False)
+            self.popitem()
 
     def get(self, key: K) -> V | None:
         try:
@@ -51,6 +51,10 @@ class LRUCache[K, V]:
     def pop(self, key: K) -> V | None:
         return self.cache.pop(key, None)
 
+    def popitem(self) -> tuple[K, V]:
+        """Evict and return the least recently used item."""
+        return self.cache.popitem(last=False)
+
     def keys(self) -> Iterator[K]:
         yield from self.cache.keys()
 
@@ -216,6 +216,12 @@ def profiles_sampler(sampling_context):
         if transaction_name in PROFILES_SAMPLING_RATE:
             return PROFILES_SAMPLING_RATE[transaction_name]
 
+    if "taskworker" in sampling_context:
+        task_name = sampling_context["taskworker"].get("task")
+
+        if task_name == "sentry.tasks.post_process.post_process_group":
+            return options.get("post_process.pipeline.profiling.rate")
+
     # Default to the sampling rate in settings
     return float(settings.SENTRY_PROFILES_SAMPLE_RATE or 0)
 
@@ -6,8 +6,12 @@ import logging
 import math
 import os
 import re
+import threading
+import time
 from collections import namedtuple
 from collections.abc import Callable, Collection, Mapping, MutableMapping, Sequence
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
@@ -25,6 +29,7 @@ from snuba_sdk import Column, DeleteQuery, Function, MetricsQuery, Request
 from snuba_sdk.legacy import json_to_snql
 from snuba_sdk.query import SelectableExpression
 
+from sentry import options
 from sentry.api.helpers.error_upsampling import (
     UPSAMPLED_ERROR_AGGREGATION,
     are_any_projects_error_upsampled,
@@ -44,6 +49,7 @@ from sentry.snuba.events import Columns
 from sentry.snuba.query_sources import QuerySource
 from sentry.snuba.referrer import validate_referrer
 from sentry.utils import json, metrics
+from sentry.utils.codecs import ColumnarResultCodec, ZstdCodec
 from sentry.utils.concurrent import ContextPropagatingThreadPoolExecutor
 from sentry.utils.dates import deprecated_utcnow, outside_retention_with_modified_start
 
@@ -1206,21 +1212,20 @@ def _apply_cache_and_build_results(
                 to_query.append((query_pos, snuba_request, cache_key))
             else:
                 metrics.incr("snuba.query_cache.hit", tags=metric_tags)
-                results.append((query_pos, json.loads(cached_result)))
+                results.append((query_pos, _decode_cached_result(cached_result)))
     else:
         for query_pos, snuba_request in snuba_requests_list:
             to_query.append((query_pos, snuba_request, None))
 
     if to_query:
-        query_results = _bulk_snuba_query([item[1] for item in to_query])
-        for result, (query_pos, _, opt_cache_key) in zip(query_results, to_query):
-            if opt_cache_key:
-                cache.set(
-                    opt_cache_key,
-                    json.dumps(result),
-                    settings.SENTRY_SNUBA_CACHE_TTL_SECONDS,
-                )
-            results.append((query_pos, result))
+        if use_cache and options.get("snuba.query-cache.single-flight.enabled"):
+            results.extend(_single_flight_query(to_query))
+        else:
+            query_results = _bulk_snuba_query([item[1] for item in to_query])
+            for result, (query_pos, _, opt_cache_key) in zip(query_results, to_query):
+                if opt_cache_key:
+                    _set_cached_result(opt_cache_key, result)
+                results.append((query_pos, result))
 
     # Sort so that we get the results back in the original param list order
     results.sort()
@@ -1228,6 +1233,173 @@ def _apply_cache_and_build_results(
     return [result[1] for result in results]
 
 
+_cached_result_codec = ColumnarResultCodec() | ZstdCodec()
+
+
+def _encode_cached_result(result: Mapping[str, Any]) -> str | bytes:
+    if options.get("snuba.query-cache.columnar-encoding"):
+        return _cached_result_codec.encode(result)
+    return json.dumps(result)
+
+
+def _decode_cached_result(cached_result: str | bytes) -> Mapping[str, Any]:
+    # Results cached before the columnar encoding was enabled are JSON strings.
+    if isinstance(cached_result, bytes):
+        return _cached_result_codec.decode(cached_result)
+    return json.loads(cached_result)
+
+
+def _set_cached_result(cache_key: str, result: Mapping[str, Any]) -> str | bytes:
+    serialized = _encode_cached_result(result)
+    cache.set(cache_key, serialized, settings.SENTRY_SNUBA_CACHE_TTL_SECONDS)
+    if stale_seconds := options.get("snuba.query-cache.stale-seconds"):
+        cache.set(
+            f"{cache_key}:stale",
+            serialized,
+            settings.SENTRY_SNUBA_CACHE_TTL_SECONDS + stale_seconds,
+        )
+    return serialized
+
+
+# Cache keys of the queries currently running in this process, see `_single_flight_query`.
+# The futures resolve to the encoded result, which every waiter decodes into its own copy.
+_inflight_queries: dict[str, Future[str | bytes]] = {}
+_inflight_queries_lock = threading.Lock()
+
+
+def _single_flight_query(
+    to_query: Sequence[tuple[int, SnubaRequest, str | None]],
+) -> list[tuple[int, Mapping[str, Any]]]:
+    """
+    Runs cache misses so that identical requests share one Snuba query.
+
+    A request whose cache key is already being queried by another thread waits
+    for that result. When `snuba.query-cache.lease-seconds` is set, processes
+    additionally take a short lease on the cache key, and requests for a key
+    leased elsewhere wait for the result to show up in the cache. With
+    `snuba.query-cache.stale-seconds` they are served the previous result
+    right away while the lease holder revalidates it.
+    """
+    leaders: list[tuple[int, SnubaRequest, str]] = []
+    followers: list[tuple[int, SnubaRequest, str, Future[str | bytes]]] = []
+    futures: dict[str, Future[str | bytes]] = {}
+    with _inflight_queries_lock:
+        for query_pos, snuba_request, cache_key in to_query:
+            assert cache_key is not None
+            future = _inflight_queries.get(cache_key)
+            if future is None:
+                future = _inflight_queries[cache_key] = futures[cache_key] = Future()
+                leaders.append((query_pos, snuba_request, cache_key))
+            else:
+                followers.append((query_pos, snuba_request, cache_key, future))
+
+    results: list[tuple[int, Mapping[str, Any]]] = []
+    leases: list[str] = []
+    try:
+        leaders = _resolve_leased_queries(leaders, futures, leases, results)
+        if leaders:
+            metrics.incr(
+                "snuba.query_cache.single_flight", amount=len(leaders), tags={"result": "leader"}
+            )
+            query_results = _bulk_snuba_query([item[1] for item in leaders])
+            for result, (query_pos, _, cache_key) in zip(query_results, leaders):
+                futures[cache_key].set_result(_set_cached_result(cache_key, result))
+                results.append((query_pos, result))
+    except BaseException as e:
+        for future in futures.values():
+            if not future.done():
+                future.set_exception(e)
+        raise
+    finally:
+        with _inflight_queries_lock:
+            for cache_key in futures:
+                _inflight_queries.pop(cache_key, None)
+        if leases:
+            cache.delete_many(leases)
+
+    timeout = options.get("snuba.query-cache.single-flight.timeout")
+    timed_out: list[tuple[int, SnubaRequest, str]] = []
+    for query_pos, snuba_request, cache_key, future in followers:
+        try:
+            cached_result = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            timed_out.append((query_pos, snuba_request, cache_key))
+            continue
+        metrics.incr("snuba.query_cache.single_flight", tags={"result": "follower"})
+        results.append((query_pos, _decode_cached_result(cached_result)))
+
+    if timed_out:
+        metrics.incr(
+            "snuba.query_cache.single_flight",
+            amount=len(timed_out),
+            tags={"result": "follower_timeout"},
+        )
+        query_results = _bulk_snuba_query([item[1] for item in timed_out])
+        for result, (query_pos, _, cache_key) in zip(query_results, timed_out):
+            _set_cached_result(cache_key, result)
+            results.append((query_pos, result))
+
+    return results
+
+
+def _resolve_leased_queries(
+    leaders: list[tuple[int, SnubaRequest, str]],
+    futures: dict[str, Future[str | bytes]],
+    leases: list[str],
+    results: list[tuple[int, Mapping[str, Any]]],
+) -> list[tuple[int, SnubaRequest, str]]:
+    """
+    Takes the cross-process lease for every leader. Leaders whose key is leased
+    by another process are resolved from the cache, either from the stale copy
+    or by waiting for the lease holder's result.
+
+    :returns: The leaders that still need to be queried.
+    """
+    lease_seconds = options.get("snuba.query-cache.lease-seconds")
+    if not lease_seconds:
+        return leaders
+
+    to_query = []
+    waiting: dict[str, tuple[int, SnubaRequest]] = {}
+    for query_pos, snuba_request, cache_key in leaders:
+        if cache.add(f"{cache_key}:lease", 1, lease_seconds):
+            leases.append(f"{cache_key}:lease")
+            to_query.append((query_pos, snuba_request, cache_key))
+        else:
+            waiting[cache_key] = (query_pos, snuba_request)
+
+    def resolve(cache_key: str, cached_result: str | bytes, result_tag: str) -> None:
+        query_pos, _ = waiting.pop(cache_key)
+        futures[cache_key].set_result(cached_result)
+        metrics.incr("snuba.query_cache.single_flight", tags={"result": result_tag})
+        results.append((query_pos, _decode_cached_result(cached_result)))
+
+    if waiting and options.get("snuba.query-cache.stale-seconds"):
+        stale_keys = {f"{cache_key}:stale": cache_key for cache_key in waiting}
+        for stale_key, cached_result in cache.get_many(list(stale_keys)).items():
+            resolve(stale_keys[stale_key], cached_result, "stale")
+
+    deadline = time.monotonic() + lease_seconds
+    while waiting and time.monotonic() < deadline:
+        time.sleep(0.05)
+        for cache_key, cached_result in cache.get_many(list(waiting)).items():
+            resolve(cache_key, cached_result, "lease_wait")
+
+    if waiting:
+        # The lease holders did not produce a result in time, query ourselves.
+        metrics.incr(
+            "snuba.query_cache.single_flight",
+            amount=len(waiting),
+            tags={"result": "lease_timeout"},
+        )
+        to_query.extend(
+            (query_pos, snuba_request, cache_key)
+            for cache_key, (query_pos, snuba_request) in waiting.items()
+        )
+
+    return to_query
+
+
 def _is_rejected_query(body: Any) -> bool:
     return bool(
         "quota_allowance" in body
@@ -72,6 +72,35 @@ class TestRedisBuffer:
         client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
         assert client.zrange("b:p", 0, -1) == []
 
+    @mock.patch("sentry.buffer.redis.process_incr")
+    @mock.patch("sentry.buffer.redis.metrics.distribution")
+    def test_process_pending_partitioned(self, metrics_distribution, process_incr) -> None:
+        self.buf.incr_batch_size = 100
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        keys = [f"b:k:sentry.group:{i}" for i in range(20)]
+        client.zadd("b:p", {key: 1 for key in keys})
+
+        dispatched_by_partition = []
+        for partition in range(2):
+            process_incr.reset_mock()
+            self.buf.process_pending(partition=partition, num_partitions=2)
+            dispatched = [
+                key
+                for call in process_incr.apply_async.mock_calls
+                for key in call.kwargs["kwargs"]["batch_keys"]
+            ]
+            assert all(
+                self.buf._get_pending_partition(key, 2) == partition for key in dispatched
+            )
+            dispatched_by_partition.append(dispatched)
+
+        # Every key was dispatched exactly once, by the partition which owns it
+        assert sorted(dispatched_by_partition[0] + dispatched_by_partition[1]) == sorted(keys)
+        assert client.zrange("b:p", 0, -1) == []
+        metrics_distribution.assert_any_call(
+            "buffer.pending-lag", mock.ANY, unit="second", tags={"model": "sentry.group"}
+        )
+
     @mock.patch("sentry.buffer.redis.make_key", mock.Mock(return_value="foo"))
     @mock.patch("sentry.buffer.base.Buffer.process")
     def test_process_does_bubble_up_json(self, process) -> None:
@@ -200,6 +229,77 @@ class TestRedisBuffer:
         else:
             assert pending == [key.encode("utf-8")]
 
+    def test_incr_combines_writes(self) -> None:
+        self.buf.combine_window_seconds = 60
+        self.buf.combine_max_incrs = 3
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        model = mock.Mock()
+        model.__name__ = "Mock"
+        filters = {"pk": 1}
+        key = make_key(model, filters=filters)
+
+        self.buf.incr(model, {"times_seen": 1}, filters, extra={"foo": "bar"})
+        self.buf.incr(model, {"times_seen": 2}, filters, extra={"foo": "baz"}, signal_only=True)
+
+        # Nothing has been written yet, but the pending amount is still visible
+        assert not client.exists(key)
+        assert self.buf.get(model, ["times_seen"], filters=filters) == {"times_seen": 3}
+
+        # Hitting `combine_max_incrs` forces a flush
+        self.buf.incr(model, {"times_seen": 4}, filters)
+        result = _hgetall_decode_keys(client, key, self.buf.is_redis_cluster)
+        assert int(result["i+times_seen"]) == 7
+        assert int(result["s"]) == 1
+        if self.buf.is_redis_cluster:
+            assert self.buf._load_value(json.loads(result["e+foo"])) == "baz"
+        else:
+            assert pickle.loads(result["e+foo"]) == "baz"
+        assert self.buf.get(model, ["times_seen"], filters=filters) == {"times_seen": 7}
+
+    def test_flush_combined_incrs_pipelines_by_host(self) -> None:
+        self.buf.combine_window_seconds = 60
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        model = mock.Mock()
+        model.__name__ = "Mock"
+        keys = [make_key(model, filters={"pk": i}) for i in range(10)]
+
+        for i in range(10):
+            self.buf.incr(model, {"times_seen": i + 1}, {"pk": i})
+
+        if self.buf.is_redis_cluster:
+            self.buf.flush_combined_incrs()
+        else:
+            with mock.patch.object(
+                self.buf.cluster, "get_local_client", wraps=self.buf.cluster.get_local_client
+            ) as get_local_client:
+                self.buf.flush_combined_incrs()
+            # One pipeline per host, however many keys live there
+            router = self.buf.cluster.get_router()
+            hosts = {router.get_host_for_key(key) for key in keys}
+            assert get_local_client.call_count == len(hosts)
+
+        for i, key in enumerate(keys):
+            result = _hgetall_decode_keys(client, key, self.buf.is_redis_cluster)
+            assert int(result["i+times_seen"]) == i + 1
+        assert len(client.zrange("b:p", 0, -1)) == 10
+
+    def test_process_pending_flushes_combined_incrs(self) -> None:
+        self.buf.combine_window_seconds = 60
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        model = mock.Mock()
+        model.__name__ = "Mock"
+        filters = {"pk": 1}
+
+        self.buf.incr(model, {"times_seen": 1}, filters)
+        assert client.zrange("b:p", 0, -1) == []
+
+        with mock.patch("sentry.buffer.redis.process_incr") as process_incr:
+            self.buf.process_pending()
+
+        process_incr.apply_async.assert_called_once_with(
+            kwargs={"batch_keys": [make_key(model, filters=filters)]}, headers=mock.ANY
+        )
+
     @mock.patch("sentry.buffer.redis.make_key", mock.Mock(return_value="foo"))
     @mock.patch("sentry.buffer.base.Buffer.process")
     def test_process_uses_signal_only(self, process) -> None:
@@ -8,9 +8,16 @@ from unittest.mock import ANY, MagicMock, patch
 from django.utils import timezone
 
 from sentry.conf.server import DEFAULT_GROUPING_CONFIG
-from sentry.grouping.ingest.grouphash_metadata import create_or_update_grouphash_metadata_if_needed
+from sentry.grouping.ingest.grouphash_metadata import (
+    bulk_create_grouphash_metadata_if_needed,
+    create_or_update_grouphash_metadata_if_needed,
+)
 from sentry.models.grouphash import GroupHash
-from sentry.models.grouphashmetadata import GROUPHASH_METADATA_SCHEMA_VERSION, HashBasis
+from sentry.models.grouphashmetadata import (
+    GROUPHASH_METADATA_SCHEMA_VERSION,
+    GroupHashMetadata,
+    HashBasis,
+)
 from sentry.services.eventstore.models import Event
 from sentry.testutils.cases import TestCase
 from sentry.testutils.helpers.eventprocessing import save_new_event
@@ -403,3 +410,53 @@ class GroupHashMetadataTest(TestCase):
         # Verify that neither the event_id or the update timestamp were changed
         assert grouphash.metadata.event_id == event1.event_id
         assert grouphash.metadata.date_updated == current_date_updated
+
+    @override_options({"grouping.grouphash_metadata.batch_writes": True})
+    def test_batched_writes(self) -> None:
+        with patch("sentry.grouping.ingest.grouphash_metadata.metrics.incr") as mock_metrics_incr:
+            event = save_new_event({"message": "Dogs are great!"}, self.project)
+            grouphash = GroupHash.objects.filter(
+                project=self.project, hash=event.get_primary_hash()
+            ).first()
+
+            self.assert_metadata_values(
+                grouphash,
+                {
+                    "schema_version": GROUPHASH_METADATA_SCHEMA_VERSION,
+                    "latest_grouping_config": DEFAULT_GROUPING_CONFIG,
+                    "hash_basis": HashBasis.MESSAGE,
+                    "event_id": event.event_id,
+                },
+            )
+            assert grouphash and grouphash.metadata and grouphash.metadata.date_added
+            mock_metrics_incr.assert_any_call(
+                "grouping.grouphash_metadata.db_hit", tags={"reason": "new_grouphash"}
+            )
+
+    def test_batched_writes_race_condition(self) -> None:
+        with override_options({"grouping.grouphash_metadata.ingestion_writes_enabled": False}):
+            event = save_new_event({"message": "Dogs are great!"}, self.project)
+
+        existing_grouphash = GroupHash.objects.get(
+            project=self.project, hash=event.get_primary_hash()
+        )
+        new_grouphash = GroupHash.objects.create(project=self.project, hash="a" * 32)
+
+        # Another event wins the race to create the metadata for the existing grouphash after we
+        # loaded it
+        stale_grouphash = GroupHash.objects.get(id=existing_grouphash.id)
+        GroupHashMetadata.objects.create(grouphash=existing_grouphash, event_id="b" * 32)
+
+        bulk_create_grouphash_metadata_if_needed(
+            event,
+            self.project,
+            [(stale_grouphash, False), (new_grouphash, True)],
+            DEFAULT_GROUPING_CONFIG,
+            event.get_grouping_variants(),
+        )
+
+        # Both grouphashes point at real records, but only the one we created has our data
+        self.assert_metadata_values(stale_grouphash, {"event_id": "b" * 32})
+        self.assert_metadata_values(new_grouphash, {"event_id": event.event_id})
+        assert GroupHashMetadata.objects.filter(grouphash=new_grouphash).count() == 1
+        assert event.should_skip_seer is True
@@ -33,6 +33,7 @@ from sentry.dynamic_sampling import (
 from sentry.event_manager import (
     EventManager,
     _get_event_instance,
+    _get_or_create_release_many,
     get_event_type,
     has_pending_commit_resolution,
     materialize_metadata,
@@ -2006,6 +2007,89 @@ class EventManagerTest(TestCase, SnubaTestCase, EventManagerTestMixin, Performan
         data = manager.get_data()
         assert data["type"] == "transaction"
 
+    def test_save_many(self) -> None:
+        def make_transaction(release: str | None) -> dict[str, Any]:
+            return make_event(
+                transaction="wait",
+                release=release,
+                environment="production",
+                contexts={
+                    "trace": {
+                        "parent_span_id": "bce14471e0e9654d",
+                        "op": "foobar",
+                        "trace_id": "a0fa8803753e40fd8124b21eeb2986b5",
+                        "span_id": "bf5be759039ede9a",
+                    }
+                },
+                spans=[],
+                timestamp=before_now(minutes=1).isoformat(),
+                start_timestamp=before_now(minutes=1, seconds=1).isoformat(),
+                type="transaction",
+            )
+
+        managers = [
+            EventManager(make_transaction("1.0")),
+            # A job without a release must not stop the following jobs from
+            # getting theirs.
+            EventManager(make_transaction(None)),
+            EventManager(make_event(message="foo")),
+            EventManager(make_transaction("1.0")),
+        ]
+
+        with mock.patch(
+            "sentry.event_manager.Release.get_or_create", wraps=Release.get_or_create
+        ) as get_or_create:
+            events = EventManager.save_many(
+                [(manager, self.project, None) for manager in managers]
+            )
+
+        assert get_or_create.call_count == 1
+        assert len(events) == 4
+        assert all(event is not None for event in events)
+        assert [event.get_event_type() for event in events if event is not None] == [
+            "transaction",
+            "transaction",
+            "default",
+            "transaction",
+        ]
+        assert events[0] is not None and events[0].get_tag("sentry:release") == "1.0"
+        assert events[1] is not None and events[1].get_tag("sentry:release") is None
+        assert events[3] is not None and events[3].get_tag("sentry:release") == "1.0"
+        assert events[2] is not None and events[2].group is not None
+        assert Environment.objects.filter(name="production").count() == 1
+
+    def test_save_many_nodestore_writes(self) -> None:
+        managers = [EventManager(make_event(message="foo")), EventManager(make_event(message="bar"))]
+
+        with (
+            mock.patch.object(
+                nodestore.backend, "set_subkeys", wraps=nodestore.backend.set_subkeys
+            ) as set_subkeys,
+            mock.patch.object(
+                nodestore.backend, "set_subkeys_multi", wraps=nodestore.backend.set_subkeys_multi
+            ) as set_subkeys_multi,
+        ):
+            EventManager.save_many([(manager, self.project, None) for manager in managers])
+            assert set_subkeys.call_count == 2
+            assert set_subkeys_multi.call_count == 0
+
+            set_subkeys.reset_mock()
+            managers = [
+                EventManager(make_event(message="foo")),
+                EventManager(make_event(message="bar")),
+            ]
+            with override_options({"nodestore.save-many.enabled": True}):
+                events = EventManager.save_many(
+                    [(manager, self.project, None) for manager in managers]
+                )
+            assert set_subkeys_multi.call_count == 1
+            assert set_subkeys.call_count == 0
+
+        for event in events:
+            assert event is not None
+            node_id = Event.generate_node_id(self.project.id, event.event_id)
+            assert nodestore.backend.get(node_id)["logentry"]["formatted"] in ("foo", "bar")
+
     def test_transaction_event_span_grouping(self) -> None:
         manager = EventManager(
             make_event(
@@ -3595,6 +3679,23 @@ class ReleaseIssueTest(TestCase):
         assert release_project_env.first_seen == self.convert_timestamp(first_seen)
         assert release_project_env.last_seen == self.convert_timestamp(last_seen)
 
+    def test_get_or_create_release_many_skips_jobs_without_release(self) -> None:
+        jobs = [
+            {
+                "data": make_event(release=release),
+                "project_id": self.project.id,
+                "event": mock.Mock(datetime=timezone.now()),
+            }
+            for release in (None, "2.0", None, "3.0")
+        ]
+
+        _get_or_create_release_many(jobs, {self.project.id: self.project})
+
+        assert "release" not in jobs[0]
+        assert jobs[1]["release"].version == "2.0"
+        assert "release" not in jobs[2]
+        assert jobs[3]["release"].version == "3.0"
+
     def test_different_groups(self) -> None:
         event1 = self.make_release_event(
             release_version=self.release.version,
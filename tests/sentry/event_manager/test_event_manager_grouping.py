@@ -21,6 +21,8 @@ from sentry.grouping.ingest.caching import (
 )
 from sentry.grouping.ingest.hashing import (
     GROUPHASH_CACHE_EXPIRY_SECONDS,
+    bulk_check_grouphash_existence,
+    bulk_get_or_create_grouphashes,
     find_grouphash_with_group,
     get_or_create_grouphashes,
 )
@@ -456,6 +458,99 @@ class GroupHashCachingTest(TestCase):
             assert not grouphash
 
 
+class BatchedGroupHashLookupTest(TestCase):
+    def test_bulk_get_or_create_grouphashes(self) -> None:
+        existing_with_group = GroupHash.objects.create(
+            project=self.project, hash="dogs", group=self.group
+        )
+        existing_without_group = GroupHash.objects.create(project=self.project, hash="cats")
+
+        results = bulk_get_or_create_grouphashes(
+            ["dogs", "cats", "ferrets", "dogs"], self.project, use_caching=True
+        )
+
+        assert set(results.keys()) == {"dogs", "cats", "ferrets"}
+        assert results["dogs"] == (existing_with_group, False)
+        assert results["cats"] == (existing_without_group, False)
+        new_grouphash, created = results["ferrets"]
+        assert created is True
+        assert new_grouphash.id is not None
+        assert new_grouphash == GroupHash.objects.get(project=self.project, hash="ferrets")
+
+        # Only grouphashes with a group get cached
+        assert cache.get(get_grouphash_object_cache_key("dogs", self.project.id)) is not None
+        assert cache.get(get_grouphash_object_cache_key("cats", self.project.id)) is None
+        assert cache.get(get_grouphash_object_cache_key("ferrets", self.project.id)) is None
+
+        # A second call creates nothing new
+        results = bulk_get_or_create_grouphashes(["dogs", "ferrets"], self.project, True)
+        assert results["ferrets"] == (new_grouphash, False)
+        assert GroupHash.objects.filter(project=self.project).count() == 3
+
+    def test_bulk_get_or_create_grouphashes_uses_single_query_for_misses(self) -> None:
+        GroupHash.objects.create(project=self.project, hash="dogs", group=self.group)
+
+        with patch(
+            "sentry.grouping.ingest.hashing.GroupHash.objects.filter",
+            wraps=GroupHash.objects.filter,
+        ) as filter_spy:
+            bulk_get_or_create_grouphashes(["dogs", "cats"], self.project, use_caching=True)
+
+        # The bulk insert hands back the created rows, so there's no need to re-fetch them
+        assert filter_spy.call_count == 1
+
+    def test_bulk_get_or_create_grouphashes_concurrent_insert(self) -> None:
+        # Simulate another process creating one of the grouphashes in between our query and our
+        # insert by having the query come back empty
+        existing = GroupHash.objects.create(project=self.project, hash="cats")
+
+        with patch(
+            "sentry.grouping.ingest.hashing.GroupHash.objects.filter",
+            return_value=GroupHash.objects.none(),
+        ):
+            results = bulk_get_or_create_grouphashes(
+                ["cats", "ferrets"], self.project, use_caching=True
+            )
+
+        # Only the grouphash this call actually inserted is reported as created
+        assert results["cats"] == (existing, False)
+        assert results["ferrets"] == (
+            GroupHash.objects.get(project=self.project, hash="ferrets"),
+            True,
+        )
+        assert GroupHash.objects.filter(project=self.project).count() == 2
+
+    def test_bulk_check_grouphash_existence(self) -> None:
+        GroupHash.objects.create(project=self.project, hash="dogs")
+
+        assert bulk_check_grouphash_existence(["dogs", "cats"], self.project, True) == {
+            "dogs": True,
+            "cats": False,
+        }
+        assert cache.get(get_grouphash_existence_cache_key("dogs", self.project.id)) is True
+        assert cache.get(get_grouphash_existence_cache_key("cats", self.project.id)) is False
+
+        # Nothing was created for the hash which doesn't exist
+        assert not GroupHash.objects.filter(project=self.project, hash="cats").exists()
+
+    @override_options({"grouping.batch_grouphash_lookups": True})
+    def test_get_or_create_grouphashes_with_batching(self) -> None:
+        event = Event(self.project.id, "11212012123120120415201309082013")
+        existing = GroupHash.objects.create(project=self.project, hash="dogs", group=self.group)
+
+        with (
+            patch("sentry.grouping.ingest.hashing.create_or_update_grouphash_metadata_if_needed"),
+            patch("sentry.grouping.ingest.hashing.record_grouphash_metadata_metrics"),
+        ):
+            grouphashes = get_or_create_grouphashes(
+                event, self.project, {}, ["dogs", "cats"], "new_config"
+            )
+
+        assert [grouphash.hash for grouphash in grouphashes] == ["dogs", "cats"]
+        assert grouphashes[0] == existing
+        assert find_grouphash_with_group(grouphashes) == existing
+
+
 class PlaceholderTitleTest(TestCase):
     """
     Tests for a bug where error events were interpreted as default-type events and therefore all
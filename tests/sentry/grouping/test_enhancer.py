@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Generator, Sequence
 from dataclasses import dataclass
 from typing import Any
 from unittest import mock
@@ -12,7 +12,9 @@ from sentry.conf.server import DEFAULT_GROUPING_CONFIG
 from sentry.grouping.api import get_grouping_config_dict_for_project, load_grouping_config
 from sentry.grouping.component import FrameGroupingComponent, StacktraceGroupingComponent
 from sentry.grouping.enhancer import (
+    BASE64_CONFIG_CACHE_SIZE,
     DEFAULT_ENHANCEMENTS_BASE,
+    Base64ConfigCache,
     ENHANCEMENT_BASES,
     EnhancementsConfig,
     _is_valid_profiling_action,
@@ -27,6 +29,18 @@ from sentry.grouping.enhancer.parser import parse_enhancements
 from sentry.grouping.enhancer.rules import EnhancementRule
 from sentry.testutils.cases import TestCase
 from sentry.testutils.pytest.fixtures import InstaSnapshotter
+from sentry.utils.local_cache import ThreadSafeCache
+
+
+@pytest.fixture(autouse=True)
+def clear_base64_config_cache() -> Generator[None]:
+    # `EnhancementsConfig.from_base64_string` caches configs process-wide, so give every test a
+    # fresh cache, lest one test's configs (or mocks) leak into another
+    with patch(
+        "sentry.grouping.enhancer._base64_config_cache",
+        ThreadSafeCache(Base64ConfigCache(maxlen=BASE64_CONFIG_CACHE_SIZE)),
+    ):
+        yield
 
 
 def convert_to_dict(obj: object) -> object | dict[str, Any]:
@@ -141,6 +155,37 @@ def test_basic_parsing(insta_snapshot: InstaSnapshotter, version: int) -> None:
     assert isinstance(enhancements_str, str)
 
 
+@patch("sentry.grouping.enhancer.EnhancementsConfig._from_base64_bytes")
+def test_from_base64_string_caches_parsed_configs(from_base64_bytes_spy: MagicMock) -> None:
+    enhancements = EnhancementsConfig.from_rules_text("function:cachedFetch +app")
+    from_base64_bytes_spy.side_effect = lambda *args, **kwargs: enhancements
+
+    first = EnhancementsConfig.from_base64_string(enhancements.base64_string, grouping_config_id="a")
+    second = EnhancementsConfig.from_base64_string(
+        enhancements.base64_string.encode("ascii"), grouping_config_id="a"
+    )
+    assert first is second
+    assert from_base64_bytes_spy.call_count == 1
+
+    # A different grouping config gets its own entry
+    EnhancementsConfig.from_base64_string(enhancements.base64_string, grouping_config_id="b")
+    assert from_base64_bytes_spy.call_count == 2
+
+
+@patch("sentry.grouping.enhancer.metrics.incr")
+def test_base64_config_cache_counts_evictions(mock_incr: MagicMock) -> None:
+    enhancements = EnhancementsConfig.from_rules_text("function:cachedFetch +app")
+    cache = ThreadSafeCache(Base64ConfigCache(maxlen=1))
+
+    cache[(b"a", None)] = enhancements
+    assert mock_incr.call_count == 0
+    cache[(b"a", None)] = enhancements
+    assert mock_incr.call_count == 0
+    cache[(b"b", None)] = enhancements
+    mock_incr.assert_called_once_with("grouping.enhancements.base64_cache.eviction")
+    assert list(cache.keys()) == [(b"b", None)]
+
+
 def test_parse_empty_with_base() -> None:
     enhancements = EnhancementsConfig.from_rules_text(
         "",
@@ -170,6 +215,49 @@ def test_callee_recursion() -> None:
         )
 
 
+def test_apply_to_stacktraces_matches_each_stacktrace_separately() -> None:
+    enhancements = EnhancementsConfig.from_rules_text(
+        """
+        [ function:main ] | function:helper +app
+        error.type:DogError function:bark -app
+        """
+    )
+
+    # Identical thread stacktraces, plus an exception whose data changes the outcome
+    thread_frames: list[list[dict[str, Any]]] = [
+        [{"function": "main"}, {"function": "helper"}] for _ in range(3)
+    ]
+    exception_frames: list[dict[str, Any]] = [{"function": "bark", "in_app": True}]
+    # A frame with no caller shouldn't be treated as if it were called by the last frame of the
+    # previous stacktrace
+    trailing_main_frames: list[dict[str, Any]] = [{"function": "main"}]
+    lone_helper_frames: list[dict[str, Any]] = [{"function": "helper"}]
+
+    with patch.object(
+        enhancements,
+        "classifier_rust_enhancements",
+        wraps=enhancements.classifier_rust_enhancements,
+    ) as rust_enhancements_spy:
+        enhancements.apply_category_and_updated_in_app_to_stacktraces(
+            [
+                *((frames, None) for frames in thread_frames),
+                (exception_frames, {"type": "DogError"}),
+                (trailing_main_frames, None),
+                (lone_helper_frames, None),
+            ],
+            "native",
+        )
+
+    # The three identical thread stacktraces only get matched once
+    assert rust_enhancements_spy.apply_modifications_to_frames.call_count == 4
+
+    for frames in thread_frames:
+        assert frames[0].get("in_app") is None
+        assert frames[1]["in_app"] is True
+    assert exception_frames[0]["in_app"] is False
+    assert lone_helper_frames[0].get("in_app") is None
+
+
 def test_flipflop_inapp() -> None:
     enhancements = EnhancementsConfig.from_rules_text(
         """
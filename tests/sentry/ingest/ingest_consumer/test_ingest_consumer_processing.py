@@ -14,7 +14,7 @@ import pytest
 from arroyo.backends.kafka.consumer import KafkaPayload
 from arroyo.backends.local.backend import LocalBroker
 from arroyo.backends.local.storages.memory import MemoryMessageStorage
-from arroyo.types import Partition, Topic
+from arroyo.types import Message, Partition, Topic, Value
 from django.conf import settings
 
 from sentry.event_manager import EventManager
@@ -29,6 +29,7 @@ from sentry.ingest.consumer.simple_event import (
     INLINE_SAVE_EVENT_OPTION,
     INLINE_SAVE_EVENT_TRANSACTION_OPTION,
     process_event_from_kafka,
+    save_event_transaction_batch,
 )
 from sentry.ingest.types import ConsumerType
 from sentry.lang.native.utils import STORE_CRASH_REPORTS_ALL
@@ -37,6 +38,8 @@ from sentry.models.eventattachment import EventAttachment
 from sentry.models.userreport import UserReport
 from sentry.objectstore import get_attachments_session
 from sentry.services import eventstore
+from sentry.services.eventstore.processing import transaction_processing_store
+from sentry.tasks.store import _do_save_event_transactions_many
 from sentry.testutils.factories import get_fixture_path
 from sentry.testutils.helpers.features import Feature
 from sentry.testutils.helpers.options import override_options
@@ -341,6 +344,90 @@ def test_transactions_spawn_save_event_transaction(
     )
 
 
+@django_db_all
+def test_transactions_saved_in_batch(
+    default_project,
+    task_runner,
+    preprocess_event,
+    save_event_transaction,
+):
+    project_id = default_project.id
+    now = datetime.datetime.now()
+    deferred_saves = []
+    for release in ("1.0", "1.0", "2.0"):
+        event = {
+            "type": "transaction",
+            "release": release,
+            "timestamp": now.isoformat(),
+            "start_timestamp": now.isoformat(),
+            "spans": [],
+            "contexts": {
+                "trace": {
+                    "parent_span_id": "8988cec7cc0779c1",
+                    "type": "trace",
+                    "op": "foobar",
+                    "trace_id": "a7d67cf796774551a95be6543cacd459",
+                    "span_id": "babaae0d4b7512d9",
+                    "status": "ok",
+                }
+            },
+        }
+        payload = get_normalized_event(event, default_project)
+        deferred_saves.append(
+            process_event(
+                ConsumerType.Transactions,
+                {
+                    "payload": orjson.dumps(payload).decode(),
+                    "start_time": time.time() - 3600,
+                    "event_id": payload["event_id"],
+                    "project_id": project_id,
+                    "remote_addr": "127.0.0.1",
+                },
+                project=default_project,
+                defer_save_event_transaction=True,
+            )
+        )
+
+    assert not len(preprocess_event)
+    assert save_event_transaction.delay.call_count == 0
+    assert all(deferred_save is not None for deferred_save in deferred_saves)
+
+    with patch(
+        "sentry.event_manager.EventManager.save_many", wraps=EventManager.save_many
+    ) as save_many:
+        _do_save_event_transactions_many(project_id, deferred_saves)
+
+    # All transactions of the batch are saved with a single call
+    assert save_many.call_count == 1
+    assert len(save_many.call_args[0][0]) == 3
+    releases = []
+    for deferred_save in deferred_saves:
+        event = eventstore.backend.get_event_by_id(project_id, deferred_save["event_id"])
+        assert event is not None
+        releases.append(event.get_tag("sentry:release"))
+        # The payloads are cleaned up from the processing store
+        assert transaction_processing_store.get(deferred_save["cache_key"]) is None
+    assert releases == ["1.0", "1.0", "2.0"]
+
+
+def test_save_event_transaction_batch_groups_by_project() -> None:
+    deferred_saves = [
+        {"project_id": 1, "event_id": "a"},
+        None,
+        {"project_id": 2, "event_id": "b"},
+        {"project_id": 1, "event_id": "c"},
+    ]
+    message = Message(Value([Value(value, {}) for value in deferred_saves], {}))
+
+    with patch("sentry.ingest.consumer.simple_event.save_event_transactions_many") as task:
+        save_event_transaction_batch(message)
+
+    assert [call.kwargs for call in task.delay.call_args_list] == [
+        {"project_id": 1, "events": [deferred_saves[0], deferred_saves[3]]},
+        {"project_id": 2, "events": [deferred_saves[2]]},
+    ]
+
+
 @django_db_all
 def test_accountant_transaction(default_project) -> None:
     storage: MemoryMessageStorage[KafkaPayload] = MemoryMessageStorage()
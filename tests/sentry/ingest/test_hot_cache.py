@@ -0,0 +1,136 @@
+from collections.abc import Generator
+from unittest import mock
+
+import pytest
+
+from sentry.event_manager import resolve_project
+from sentry.ingest import hot_cache
+from sentry.models.options.project_option import ProjectOption
+from sentry.models.project import Project
+from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
+
+
+class HotCacheTest(TestCase):
+    @pytest.fixture(autouse=True)
+    def clear_hot_cache(self) -> Generator[None]:
+        hot_cache.projects.clear()
+        hot_cache.organizations.clear()
+        hot_cache.project_options.clear()
+        yield
+        hot_cache.projects.clear()
+        hot_cache.organizations.clear()
+        hot_cache.project_options.clear()
+
+    def test_disabled(self) -> None:
+        with mock.patch.object(
+            Project.objects, "get_from_cache", wraps=Project.objects.get_from_cache
+        ) as get_from_cache:
+            hot_cache.get_project(self.project.id)
+            hot_cache.get_project(self.project.id)
+
+        assert get_from_cache.call_count == 2
+
+    @override_options({"store.hot-cache-ttl": 60.0})
+    def test_hit_and_invalidation(self) -> None:
+        with mock.patch.object(
+            Project.objects, "get_from_cache", wraps=Project.objects.get_from_cache
+        ) as get_from_cache:
+            first = resolve_project(self.project.id)
+            second = resolve_project(self.project.id)
+            assert get_from_cache.call_count == 1
+
+            # Every caller gets its own instance
+            assert first is not second
+            assert first == second
+            assert second.organization == self.organization
+
+            self.project.update(name="renamed")
+            assert hot_cache.get_project(self.project.id).name == "renamed"
+            assert get_from_cache.call_count == 2
+
+    @override_options({"store.hot-cache-ttl": 60.0})
+    def test_expiry(self) -> None:
+        with mock.patch("sentry.ingest.hot_cache.time.monotonic", return_value=1000.0):
+            hot_cache.get_organization(self.organization.id)
+
+        with (
+            mock.patch("sentry.ingest.hot_cache.time.monotonic", return_value=1061.0),
+            mock.patch("sentry.ingest.hot_cache.metrics.incr") as mock_incr,
+        ):
+            hot_cache.get_organization(self.organization.id)
+
+        mock_incr.assert_called_once_with(
+            "ingest.hot_cache.get", tags={"model": "organization", "result": "expired"}
+        )
+
+    @override_options({"store.hot-cache-ttl": 60.0})
+    def test_enabled_hit_metrics(self) -> None:
+        with mock.patch("sentry.ingest.hot_cache.time.monotonic", return_value=1000.0):
+            hot_cache.get_project(self.project.id)
+
+        with (
+            mock.patch("sentry.ingest.hot_cache.time.monotonic", return_value=1030.0),
+            mock.patch("sentry.ingest.hot_cache.metrics") as mock_metrics,
+        ):
+            assert hot_cache.get_project(self.project.id).id == self.project.id
+
+        mock_metrics.incr.assert_called_once_with(
+            "ingest.hot_cache.get", tags={"model": "project", "result": "hit"}
+        )
+        mock_metrics.distribution.assert_called_once_with(
+            "ingest.hot_cache.age", 30.0, tags={"model": "project"}, unit="second"
+        )
+
+    @override_options({"store.hot-cache-ttl": 60.0})
+    def test_invalidate_uncached(self) -> None:
+        # Saving a model which was never looked up must not fail
+        self.project.update(name="renamed")
+        self.organization.update(name="renamed")
+        self.project.update_option("sentry:store_crash_reports", 5)
+
+    @override_options({"store.hot-cache-ttl": 60.0})
+    def test_project_options(self) -> None:
+        self.project.update_option("sentry:store_crash_reports", 5)
+        grouping_config = self.project.get_option("sentry:grouping_config")
+
+        with mock.patch.object(
+            ProjectOption.objects, "get_all_values", wraps=ProjectOption.objects.get_all_values
+        ) as get_all_values:
+            assert hot_cache.get_project_option(self.project, "sentry:store_crash_reports") == 5
+            assert hot_cache.get_project_option(self.project, "sentry:store_crash_reports") == 5
+            # Well-known defaults apply to options which are not set
+            assert (
+                hot_cache.get_project_option(self.project, "sentry:grouping_config")
+                == grouping_config
+            )
+            assert hot_cache.get_project_option(self.project, "missing", default=1) == 1
+            assert get_all_values.call_count == 1
+
+            # Saving or deleting an option drops the project's snapshot
+            ProjectOption.objects.filter(
+                project=self.project, key="sentry:store_crash_reports"
+            ).get().save()
+            assert hot_cache.get_project_option(self.project, "sentry:store_crash_reports") == 5
+            assert get_all_values.call_count == 2
+
+            ProjectOption.objects.filter(
+                project=self.project, key="sentry:store_crash_reports"
+            ).delete()
+            assert hot_cache.get_project_option(self.project, "sentry:store_crash_reports") is None
+            assert get_all_values.call_count == 3
+
+    @override_options({"store.hot-cache-ttl": 60.0})
+    def test_changes_from_other_processes(self) -> None:
+        with mock.patch("sentry.ingest.hot_cache.time.monotonic", return_value=1000.0):
+            assert hot_cache.get_project(self.project.id).name == self.project.name
+
+        # Another process renames the project. No signal reaches this process, but the Django
+        # cache is invalidated for everyone.
+        Project.objects.filter(id=self.project.id).update(name="renamed")
+        Project.objects.uncache_object(self.project.id)
+
+        with mock.patch("sentry.ingest.hot_cache.time.monotonic", return_value=1059.0):
+            assert hot_cache.get_project(self.project.id).name != "renamed"
+        with mock.patch("sentry.ingest.hot_cache.time.monotonic", return_value=1061.0):
+            assert hot_cache.get_project(self.project.id).name == "renamed"
@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 
 from sentry.ratelimits.sliding_windows import (
@@ -71,3 +73,36 @@ def test_basic(limiter: RedisSlidingWindowRateLimiter) -> None:
         )
 
         assert resp == [GrantedQuota(prefix="foo", granted=0, reached_quotas=quotas)]
+
+
+def test_exhausted_cache() -> None:
+    limiter = RedisSlidingWindowRateLimiter(exhausted_cache_ttl=60)
+    quotas = [Quota(window_seconds=10, granularity_seconds=5, limit=1)]
+    requests = [
+        RequestedQuota(prefix=f"foo-{i}", requested=1, quotas=quotas) for i in range(1000)
+    ]
+
+    resp = limiter.check_and_use_quotas(requests, timestamp=TIMESTAMP_OFFSET)
+    assert resp == [
+        GrantedQuota(prefix=f"foo-{i}", granted=1, reached_quotas=[]) for i in range(1000)
+    ]
+
+    resp = limiter.check_and_use_quotas(requests[:500], timestamp=TIMESTAMP_OFFSET)
+    assert resp == [
+        GrantedQuota(prefix=f"foo-{i}", granted=0, reached_quotas=quotas) for i in range(500)
+    ]
+
+    # Exhausted quotas are denied without asking Redis for the rest of the granule
+    with mock.patch.object(
+        limiter.impl, "check_within_quotas", wraps=limiter.impl.check_within_quotas
+    ) as check_within_quotas:
+        resp = limiter.check_and_use_quotas(requests, timestamp=TIMESTAMP_OFFSET + 4)
+
+    assert check_within_quotas.call_args.args[0] == requests[500:]
+    assert resp == [
+        GrantedQuota(prefix=f"foo-{i}", granted=0, reached_quotas=quotas) for i in range(1000)
+    ]
+
+    # Once the window moves on, Redis is consulted again
+    resp = limiter.check_and_use_quotas(requests[:1], timestamp=TIMESTAMP_OFFSET + 15)
+    assert resp == [GrantedQuota(prefix="foo-0", granted=1, reached_quotas=[])]
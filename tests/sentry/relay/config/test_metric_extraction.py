@@ -16,6 +16,7 @@ from sentry.models.dashboard_widget import (
 from sentry.models.environment import Environment
 from sentry.models.project import Project
 from sentry.models.transaction_threshold import ProjectTransactionThreshold, TransactionMetric
+from sentry.relay.config import metric_extraction
 from sentry.relay.config.metric_extraction import (
     _set_bulk_cached_query_chunk,
     get_current_widget_specs,
@@ -39,6 +40,7 @@ from sentry.testutils.helpers import Feature
 from sentry.testutils.helpers.on_demand import create_widget
 from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
+from sentry.utils.local_cache import LRUCache
 
 ON_DEMAND_METRICS = "organizations:on-demand-metrics-extraction"
 ON_DEMAND_METRICS_WIDGETS = "organizations:on-demand-metrics-extraction-widgets"
@@ -319,6 +321,30 @@ def test_get_metric_extraction_config_single_widget(
         ]
 
 
+@django_db_all
+@override_options({"on_demand_metrics.spec_memo.enabled": True})
+def test_get_metric_extraction_config_memoized_specs(default_project: Project) -> None:
+    with (
+        Feature({ON_DEMAND_METRICS: True, ON_DEMAND_METRICS_WIDGETS: True}),
+        mock.patch.object(metric_extraction, "_spec_memo", LRUCache(100)) as spec_memo,
+    ):
+        create_widget(["count()"], "transaction.duration:>=1000", default_project)
+        create_alert("apdex(10)", "transaction.duration:>=1000", default_project)
+
+        config = get_metric_extraction_config(default_project)
+        assert config
+        # The apdex specs depend on the project's thresholds and are not memoized.
+        assert len(spec_memo) == 2
+
+        with mock.patch.object(
+            metric_extraction, "OnDemandMetricSpec", wraps=OnDemandMetricSpec
+        ) as spec_mock:
+            assert get_metric_extraction_config(default_project) == config
+
+        assert spec_mock.call_count == 2
+        assert {call.kwargs["field"] for call in spec_mock.call_args_list} == {"apdex(10)"}
+
+
 @django_db_all
 @pytest.mark.parametrize(
     "widget_type", [DashboardWidgetTypes.DISCOVER, DashboardWidgetTypes.TRANSACTION_LIKE]
@@ -1,8 +1,10 @@
 from unittest import mock
 
+from sentry.relay.config import get_project_config
 from sentry.relay.projectconfig_cache import redis
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
-from sentry.utils import metrics
+from sentry.utils import json, metrics
 
 
 def test_delete_count() -> None:
@@ -54,3 +56,64 @@ def test_write_delete() -> None:
     cache.delete_many([dsn])
     assert cache.get(dsn) is None
     assert cache.get_rev(dsn) is None
+
+
+@django_db_all
+def test_write_shared_subdocuments() -> None:
+    cache = redis.RedisProjectConfigCache()
+
+    shared = {"metricExtraction": {"version": 4, "metrics": [{"mri": "c:foo"}]}, "empty": {}}
+    value1 = {"rev": "rev1", "publicKeys": [{"publicKey": "a"}], "config": {**shared, "q": 1}}
+    value2 = {"rev": "rev2", "publicKeys": [{"publicKey": "b"}], "config": dict(shared)}
+    value3: dict[str, object] = {}
+
+    with mock.patch.object(metrics, "incr") as incr_mock:
+        cache.set_many({"a": value1, "b": value2, "c": value3})
+
+    assert mock.call("relay.projectconfig_cache.shared_fragments", amount=2) in (
+        incr_mock.call_args_list
+    )
+    assert cache.get("a") == value1
+    assert cache.get("b") == value2
+    assert cache.get("c") == value3
+
+
+def test_shared_encoder_keeps_memoized_objects_alive() -> None:
+    encoder = redis._SharedEncoder()
+    # Every dict is garbage as soon as it's encoded, so without holding on to it
+    # the next one would likely get the same id and the stale fragment.
+    for i in range(100):
+        assert json.loads(encoder.encode({"value": [i]})) == {"value": [i]}
+    assert encoder.shared == 0
+
+
+@django_db_all
+@override_options({"relay.projectconfig-cache.skip-unchanged-writes": True})
+def test_skip_unchanged_writes() -> None:
+    cache = redis.RedisProjectConfigCache()
+
+    cache.set_many({"a": {"rev": "rev1", "config": {"foo": "bar"}}})
+    cache.set_many({"a": {"rev": "rev2", "config": {"foo": "bar"}}})
+    assert cache.get("a") == {"rev": "rev1", "config": {"foo": "bar"}}
+    assert cache.get_rev("a") == "rev1"
+
+    cache.set_many({"a": {"rev": "rev3", "config": {"foo": "baz"}}})
+    assert cache.get("a") == {"rev": "rev3", "config": {"foo": "baz"}}
+    assert cache.get_rev("a") == "rev3"
+
+
+@django_db_all
+@override_options({"relay.projectconfig-cache.skip-unchanged-writes": True})
+def test_skip_unchanged_project_config_writes(default_project, default_projectkey) -> None:
+    cache = redis.RedisProjectConfigCache()
+    public_key = default_projectkey.public_key
+
+    first = get_project_config(default_project, project_keys=[default_projectkey]).to_dict()
+    cache.set_many({public_key: first})
+
+    second = get_project_config(default_project, project_keys=[default_projectkey]).to_dict()
+    assert second["rev"] != first["rev"]
+    cache.set_many({public_key: second})
+
+    assert cache.get_rev(public_key) == first["rev"]
+    assert cache.get(public_key)["rev"] == first["rev"]
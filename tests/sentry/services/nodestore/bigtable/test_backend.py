@@ -178,7 +178,23 @@ def test_cache(ns: BigtableNodeStorage) -> None:
 def test_compression() -> None:
     ns = BigtableNodeStorage(project="test", compression="zstd")
     assert ns.store.compression == "zstd"
+    assert ns.compresses_payloads
     ns = BigtableNodeStorage(project="test", compression=True)
     assert ns.store.compression == "zlib"
+    assert ns.compresses_payloads
     ns = BigtableNodeStorage(project="test", compression=False)
     assert ns.store.compression is None
+    assert not ns.compresses_payloads
+
+
+@pytest.mark.django_db
+def test_compression_skips_dictionary_compression() -> None:
+    ns = MockedBigtableNodeStorage(project="test", compression="zstd")
+
+    with mock.patch("sentry.services.nodestore.base.compression.compress") as mock_compress:
+        ns.set("node_1", {"platform": "python", "message": "hello"})
+        ns.set_subkeys_multi({"node_2": {None: {"platform": "python", "message": "hello"}}})
+    assert mock_compress.call_count == 0
+
+    assert ns.get("node_1") == {"platform": "python", "message": "hello"}
+    assert ns.get("node_2") == {"platform": "python", "message": "hello"}
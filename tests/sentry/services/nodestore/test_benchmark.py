@@ -0,0 +1,59 @@
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from django.test import override_settings
+
+from sentry.services.nodestore.base import NodeStorage
+from sentry.services.nodestore.django.backend import DjangoNodeStorage
+from sentry.services.nodestore.filesystem.backend import FileSystemNodeStorage
+from sentry.testutils.helpers.options import override_options
+from sentry.testutils.pytest.fixtures import django_db_all
+from sentry.testutils.skips import requires_pytest_benchmark
+
+NUM_NODES = 500
+
+
+@requires_pytest_benchmark
+@pytest.mark.parametrize("concurrency", [1, 8], ids=["sequential", "parallel"])
+def test_benchmark_filesystem_get_bytes_multi(
+    benchmark: ModuleType, tmp_path: Path, concurrency: int
+) -> None:
+    # FileSystemNodeStorage is thread-local and re-checks DEBUG in every worker thread
+    with override_settings(DEBUG=True):
+        ns = FileSystemNodeStorage(path=str(tmp_path))
+
+        ids = [f"node_{i}" for i in range(NUM_NODES)]
+        for id in ids:
+            ns.set(id, {"message": "hello world" * 100, "id": id})
+
+        with override_options({"nodestore.get-bytes-multi.concurrency": concurrency}):
+            result = benchmark(ns._get_bytes_multi, ids)
+
+    assert len(result) == NUM_NODES
+    assert all(result.values())
+
+
+@requires_pytest_benchmark
+@django_db_all
+@pytest.mark.parametrize("native", [False, True], ids=["sequential", "multi_get"])
+def test_benchmark_django_get_bytes_multi(benchmark: ModuleType, native: bool) -> None:
+    """
+    The Django backend doesn't declare `concurrent_get_bytes` (its queries
+    would run on pool threads with connections of their own), so the base
+    class fetches its nodes one query at a time. Compare that with the
+    backend's single-query multi-get.
+    """
+    ns = DjangoNodeStorage()
+
+    ids = [f"node_{i}" for i in range(NUM_NODES)]
+    ns.set_multi({id: {"message": "hello world" * 100, "id": id} for id in ids})
+
+    with override_options({"nodestore.get-bytes-multi.concurrency": 8}):
+        if native:
+            result = benchmark(ns._get_bytes_multi, ids)
+        else:
+            result = benchmark(NodeStorage._get_bytes_multi, ns, ids)
+
+    assert len(result) == NUM_NODES
+    assert all(result.values())
@@ -3,13 +3,19 @@ Testsuite of backend-independent nodestore tests. Add your backend to the
 `ns` fixture to have it tested.
 """
 
+import threading
 from collections.abc import Callable, Generator
 from contextlib import nullcontext
+from pathlib import Path
 from typing import ContextManager
+from unittest import mock
 
 import pytest
+import zstandard
+from django.test import override_settings
 
-from sentry.services.nodestore.base import NodeStorage
+from sentry.services.nodestore import compression
+from sentry.services.nodestore.base import INDEXED_SUBKEYS_MAGIC, NodeStorage
 from sentry.services.nodestore.django.backend import DjangoNodeStorage
 from sentry.testutils.helpers import override_options
 from tests.sentry.services.nodestore.bigtable.test_backend import (
@@ -127,3 +133,194 @@ def test_set_subkeys(ns: NodeStorage) -> None:
     ns.delete("node_1")
     assert ns.get("node_1") is None
     assert ns.get("node_1", subkey="other") is None
+
+
+@override_options(
+    {"nodestore.set-subkeys.enable-set-cache-item": False, "nodestore.cache-ttl": 300}
+)
+def test_set_multi(ns: NodeStorage) -> None:
+    ns.set_subkeys("node_1", {None: {"foo": "old"}, "other": {"foo": "old"}})
+
+    ns.set_subkeys_multi(
+        {
+            "node_1": {None: {"foo": "a"}},
+            "node_2": {None: {"foo": "b"}, "other": {"foo": "c"}},
+        }
+    )
+    assert ns.get_multi(["node_1", "node_2"]) == {"node_1": {"foo": "a"}, "node_2": {"foo": "b"}}
+    assert ns.get("node_1", subkey="other") is None
+    assert ns.get("node_2", subkey="other") == {"foo": "c"}
+
+    ns.set_multi({"node_2": {"foo": "d"}, "node_3": {"foo": "e"}})
+    assert ns.get_multi(["node_2", "node_3"]) == {"node_2": {"foo": "d"}, "node_3": {"foo": "e"}}
+    assert ns.get("node_2", subkey="other") is None
+
+
+@override_options(
+    {"nodestore.set-subkeys.enable-set-cache-item": False, "nodestore.cache-ttl": 300}
+)
+def test_set_subkeys_indexed(ns: NodeStorage) -> None:
+    """
+    Payloads written with the indexed subkey layout can be read alongside
+    payloads written with the legacy newline-separated layout.
+    """
+
+    ns.set_subkeys("node_1", {None: {"foo": "a"}, "other": {"foo": "b"}})
+
+    with override_options({"nodestore.encode-indexed-subkeys": True}):
+        ns.set_subkeys(
+            "node_2", {None: {"foo": "c"}, "other": {"foo": "d"}, "unprocessed": {"foo": "e"}}
+        )
+
+    node_2_bytes = ns.get_bytes("node_2")
+    assert node_2_bytes is not None
+    assert node_2_bytes.startswith(INDEXED_SUBKEYS_MAGIC)
+
+    assert ns.get("node_1") == {"foo": "a"}
+    assert ns.get("node_1", subkey="other") == {"foo": "b"}
+    assert ns.get("node_2") == {"foo": "c"}
+    assert ns.get("node_2", subkey="other") == {"foo": "d"}
+    assert ns.get("node_2", subkey="unprocessed") == {"foo": "e"}
+    assert ns.get("node_2", subkey="missing") is None
+
+    assert ns.get_multi(["node_1", "node_2"], subkey="other") == {
+        "node_1": {"foo": "b"},
+        "node_2": {"foo": "d"},
+    }
+
+
+@override_options(
+    {"nodestore.set-subkeys.enable-set-cache-item": False, "nodestore.cache-ttl": 300}
+)
+def test_set_subkeys_zstd_compressed(ns: NodeStorage, tmp_path: Path) -> None:
+    samples = [
+        ns._encode({None: {"platform": "python", "message": f"hello {i}"}}) for i in range(1000)
+    ]
+    dictionary = zstandard.train_dictionary(1024, samples)
+    (tmp_path / compression.dictionary_filename("python", dictionary)).write_bytes(
+        dictionary.as_bytes()
+    )
+
+    compression.load_dictionaries.cache_clear()
+    compression.get_codec.cache_clear()
+    try:
+        with override_settings(SENTRY_NODESTORE_ZSTD_DICTIONARY_DIR=str(tmp_path)):
+            ns.set("node_1", {"platform": "python", "message": "uncompressed"})
+
+            with override_options(
+                {
+                    "nodestore.zstd-compression.enabled": True,
+                    "nodestore.zstd-compression.dictionaries": {"python": dictionary.dict_id()},
+                }
+            ):
+                ns.set_subkeys(
+                    "node_2",
+                    {
+                        None: {"platform": "python", "message": "hello"},
+                        "other": {"foo": "b"},
+                    },
+                )
+                ns.set("node_3", {"platform": "javascript", "message": "hello"})
+
+            node_2_bytes = ns.get_bytes("node_2")
+            assert node_2_bytes is not None
+            if ns.compresses_payloads:
+                assert not node_2_bytes.startswith(compression.ZSTD_MAGIC)
+            else:
+                assert zstandard.get_frame_parameters(node_2_bytes).dict_id == dictionary.dict_id()
+            # Platforms without a dictionary are written uncompressed
+            node_3_bytes = ns.get_bytes("node_3")
+            assert node_3_bytes is not None
+            assert not node_3_bytes.startswith(compression.ZSTD_MAGIC)
+
+            assert ns.get("node_1") == {"platform": "python", "message": "uncompressed"}
+            assert ns.get("node_2") == {"platform": "python", "message": "hello"}
+            assert ns.get("node_2", subkey="other") == {"foo": "b"}
+            assert ns.get("node_3") == {"platform": "javascript", "message": "hello"}
+    finally:
+        compression.load_dictionaries.cache_clear()
+        compression.get_codec.cache_clear()
+
+
+@override_options(
+    {
+        "nodestore.set-subkeys.enable-set-cache-item": False,
+        "nodestore.cache-ttl": 300,
+        "nodestore.zstd-compression.enabled": True,
+        "nodestore.zstd-compression.dictionaries": {"python": 1},
+    }
+)
+def test_reads_uncompressed_payloads_with_compression_enabled(ns: NodeStorage) -> None:
+    # Rows written before compression was enabled
+    ns.set_bytes("node_1", b'{"platform":"python","message":"legacy"}\nunprocessed\n{"foo":"b"}')
+
+    assert ns.get("node_1") == {"platform": "python", "message": "legacy"}
+    assert ns.get("node_1", subkey="unprocessed") == {"foo": "b"}
+    assert ns.get_multi(["node_1"]) == {"node_1": {"platform": "python", "message": "legacy"}}
+
+
+class BlockingNodeStorage(NodeStorage):
+    """
+    A backend without a native multi-get, where fetching `blocked` ids waits
+    until `release` is set.
+    """
+
+    concurrent_get_bytes = True
+
+    # NodeStorage is thread-local, so worker threads re-run __init__ with the
+    # same arguments and share `release` with the caller.
+    def __init__(
+        self, nodes: dict[str, bytes], blocked: set[str], release: threading.Event
+    ) -> None:
+        self.nodes = nodes
+        self.blocked = blocked
+        self.release = release
+
+    def _get_bytes(self, id: str) -> bytes | None:
+        if id in self.blocked:
+            self.release.wait(5)
+        return self.nodes.get(id)
+
+
+@override_options(
+    {"nodestore.get-bytes-multi.concurrency": 4, "nodestore.get-bytes-multi.timeout": 0.5}
+)
+def test_get_bytes_multi_concurrent_partial_results() -> None:
+    nodes = {f"node_{i}": f'{{"i":{i}}}'.encode() for i in range(20)}
+    ns = BlockingNodeStorage(nodes, blocked={"node_3"}, release=threading.Event())
+
+    try:
+        assert ns._get_bytes_multi([*nodes, "missing"]) == {
+            **nodes,
+            "node_3": None,
+            "missing": None,
+        }
+    finally:
+        ns.release.set()
+
+    assert ns._get_bytes_multi(list(nodes)) == nodes
+
+
+@override_options({"nodestore.get-bytes-multi.concurrency": 4})
+def test_get_bytes_multi_concurrent_closes_connections() -> None:
+    nodes = {f"node_{i}": f'{{"i":{i}}}'.encode() for i in range(5)}
+    ns = BlockingNodeStorage(nodes, blocked=set(), release=threading.Event())
+
+    with mock.patch("sentry.services.nodestore.base.close_old_connections") as close:
+        assert ns._get_bytes_multi(list(nodes)) == nodes
+
+    assert close.call_count == len(nodes)
+
+
+@override_options({"nodestore.get-bytes-multi.concurrency": 4})
+def test_get_bytes_multi_sequential_unless_declared_concurrent() -> None:
+    nodes = {f"node_{i}": f'{{"i":{i}}}'.encode() for i in range(5)}
+    ns = BlockingNodeStorage(nodes, blocked=set(), release=threading.Event())
+
+    with (
+        mock.patch.object(BlockingNodeStorage, "concurrent_get_bytes", False),
+        mock.patch("sentry.services.nodestore.base._get_get_bytes_executor") as get_executor,
+    ):
+        assert ns._get_bytes_multi(list(nodes)) == nodes
+
+    assert get_executor.call_count == 0
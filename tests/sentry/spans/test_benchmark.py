@@ -0,0 +1,51 @@
+from types import ModuleType
+
+import orjson
+import zstandard
+
+from sentry.spans.buffer import SpansBuffer
+from sentry.spans.buffer_types import FlushCandidate, LoadedSegment
+from sentry.testutils.helpers.options import override_options
+from sentry.testutils.skips import requires_pytest_benchmark
+
+NUM_SPANS = 10_000
+SEGMENT_SPAN_ID = "a" * 16
+SEGMENT_KEY = f"span-buf:s:{{1:{'b' * 32}}}:{SEGMENT_SPAN_ID}".encode("ascii")
+
+
+def _large_segment_payload() -> bytes:
+    spans = [
+        orjson.dumps(
+            {
+                "span_id": SEGMENT_SPAN_ID if i == 0 else f"{i:016x}",
+                "trace_id": "b" * 32,
+                "description": f"SELECT * FROM table_{i % 50} WHERE id = %s",
+                "attributes": {"db.system": {"type": "string", "value": "postgresql"}},
+            }
+        )
+        for i in range(NUM_SPANS)
+    ]
+    return zstandard.ZstdCompressor().compress(b"\x00".join(spans))
+
+
+def _flush(buffer: SpansBuffer, compressed_payload: bytes) -> list[tuple[bytes, int]]:
+    loaded_segment = LoadedSegment(
+        FlushCandidate(shard=0, queue_key=b"span-buf:q:0", segment_key=SEGMENT_KEY, score=0),
+        buffer._decompress_batch(compressed_payload),
+        [],
+    )
+    flushed_segments, _, _ = buffer._build_flushed_segments([loaded_segment], 500, 0)
+    return flushed_segments[SEGMENT_KEY].to_encoded_messages()
+
+
+@requires_pytest_benchmark
+def test_benchmark_flush_large_segment(benchmark: ModuleType) -> None:
+    buffer = SpansBuffer(assigned_shards=[0])
+    compressed_payload = _large_segment_payload()
+
+    with override_options(
+        {"spans.buffer.max-segment-bytes": 10 * 1024 * 1024, "spans.buffer.debug-traces": []}
+    ):
+        messages = benchmark(_flush, buffer, compressed_payload)
+
+    assert sum(num_spans for _, num_spans in messages) == NUM_SPANS
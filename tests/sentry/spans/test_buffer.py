@@ -49,6 +49,8 @@ DEFAULT_OPTIONS = {
     "spans.buffer.flusher.log-flushed-segments": False,
     "spans.buffer.compression.level": 0,
     "spans.buffer.pipeline-batch-size": 0,
+    "spans.buffer.pipeline-batch-max-bytes": 0,
+    "spans.buffer.combined-insert-pipeline": False,
     "spans.buffer.max-spans-per-evalsha": 0,
     "spans.buffer.evalsha-latency-threshold": 100,
     "spans.buffer.evalsha-cumulative-logger-enabled": True,
@@ -260,6 +262,43 @@ def test_batch_subsegments_groups_by_pipeline_batch_size() -> None:
     assert buffer._batch_subsegments(subsegments, pipeline_batch_size=0) == [subsegments]
 
 
+def test_batch_subsegments_groups_by_pipeline_batch_max_bytes() -> None:
+    buffer = SpansBuffer(assigned_shards=[0])
+    trace_id = "a" * 32
+    parent_span_id = "f" * 16
+    subsegments = [
+        Subsegment(
+            project_and_trace=f"1:{trace_id}",
+            parent_span_id=parent_span_id,
+            salt=f"salt-{i}",
+            spans=[_span(f"{i}" * 16, parent_span_id)],
+        )
+        for i in range(4)
+    ]
+    byte_count = subsegments[0].byte_count
+
+    assert [
+        [subsegment.salt for subsegment in batch]
+        for batch in buffer._batch_subsegments(
+            subsegments, pipeline_batch_size=0, pipeline_batch_max_bytes=2 * byte_count
+        )
+    ] == [["salt-0", "salt-1"], ["salt-2", "salt-3"]]
+    # Both limits apply, whichever is hit first
+    assert [
+        [subsegment.salt for subsegment in batch]
+        for batch in buffer._batch_subsegments(
+            subsegments, pipeline_batch_size=3, pipeline_batch_max_bytes=10 * byte_count
+        )
+    ] == [["salt-0", "salt-1", "salt-2"], ["salt-3"]]
+    # Subsegments over the limit still get written, in their own batch
+    assert [
+        [subsegment.salt for subsegment in batch]
+        for batch in buffer._batch_subsegments(
+            subsegments, pipeline_batch_size=0, pipeline_batch_max_bytes=1
+        )
+    ] == [["salt-0"], ["salt-1"], ["salt-2"], ["salt-3"]]
+
+
 def test_push_payloads_writes_payloads() -> None:
     buffer = SpansBuffer(assigned_shards=[0])
     client = mock.MagicMock()
@@ -687,6 +726,48 @@ def test_duplicate_batch_is_idempotent(buffer: SpansBuffer) -> None:
     assert_clean(buffer.client)
 
 
+def test_combined_insert_pipeline(buffer: SpansBuffer) -> None:
+    spans = [
+        _span("a" * 16, "b" * 16),
+        _span("c" * 16, "a" * 16),
+        _span("b" * 16, None, is_segment_span=True),
+        _span("d" * 16, "e" * 16, trace_id="b" * 32),
+    ]
+
+    with override_options(
+        {
+            "spans.buffer.combined-insert-pipeline": True,
+            "spans.buffer.pipeline-batch-size": 2,
+        }
+    ):
+        buffer.process_spans(spans, now=0)
+
+    assert_ttls(buffer.client)
+
+    rv = buffer.flush_segments(now=61)
+    _normalize_output(rv)
+    assert rv == {
+        _segment_id(1, "a" * 32, "b" * 16): FlushedSegment(
+            queue_key=mock.ANY,
+            payload_keys=mock.ANY,
+            project_id=1,
+            spans=[
+                _output_segment(b"a" * 16, b"b" * 16, False),
+                _output_segment(b"b" * 16, b"b" * 16, True),
+                _output_segment(b"c" * 16, b"b" * 16, False),
+            ],
+        ),
+        _segment_id(1, "b" * 32, "e" * 16): FlushedSegment(
+            queue_key=mock.ANY,
+            payload_keys=mock.ANY,
+            project_id=1,
+            spans=[_output_segment(b"d" * 16, b"e" * 16, False)],
+        ),
+    }
+    buffer.done_flush_segments(rv)
+    assert_clean(buffer.client)
+
+
 def test_flush_segments_with_null_attributes(buffer: SpansBuffer) -> None:
     spans = [
         Span(
@@ -1444,6 +1525,39 @@ def test_to_messages_unique_flush_ids_across_calls(buffer: SpansBuffer) -> None:
     assert messages1[0]["flush_id"] != messages2[0]["flush_id"]
 
 
+@pytest.mark.parametrize("max_segment_bytes", [10, 500, 10000])
+def test_to_encoded_messages_matches_to_messages(max_segment_bytes: int) -> None:
+    spans = [
+        {
+            "span_id": span_id * 16,
+            "is_segment": span_id == "a",
+            "attributes": {"sentry.segment.id": {"type": "string", "value": "a" * 16}},
+        }
+        for span_id in "abcde"
+    ]
+    segment = FlushedSegment(
+        queue_key=b"test",
+        spans=[OutputSpan(payload=s) for s in spans],
+        project_id=1,
+    )
+    with override_options(
+        {
+            **DEFAULT_OPTIONS,
+            "spans.buffer.max-segment-bytes": max_segment_bytes,
+        }
+    ):
+        messages = segment.to_messages()
+        encoded_messages = segment.to_encoded_messages()
+
+    assert len(encoded_messages) == len(messages)
+    for (encoded, num_spans), message in zip(encoded_messages, messages):
+        decoded = orjson.loads(encoded)
+        assert len(decoded.pop("flush_id")) == 32
+        message.pop("flush_id")
+        assert decoded == message
+        assert num_spans == len(message["spans"])
+
+
 def test_kafka_slice_id(buffer: SpansBuffer) -> None:
     with override_options(DEFAULT_OPTIONS):
         buffer = SpansBuffer(assigned_shards=list(range(1)), slice_id=2)
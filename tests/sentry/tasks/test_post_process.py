@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import abc
+import threading
 import time
 import uuid
+from collections.abc import Generator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from hashlib import md5
 from typing import Any
@@ -44,6 +47,7 @@ from sentry.models.groupowner import (
 )
 from sentry.models.groupsnooze import GroupSnooze
 from sentry.models.organization import Organization
+from sentry.models.project import Project
 from sentry.models.projectownership import ProjectOwnership
 from sentry.models.projectteam import ProjectTeam
 from sentry.models.userreport import UserReport
@@ -67,6 +71,7 @@ from sentry.tasks.post_process import (
     post_process_group,
     process_siem_security_logging,
     run_post_process_job,
+    set_pipeline_step_hook,
     set_siem_security_log_hook,
 )
 from sentry.testutils.cases import BaseTestCase, PerformanceIssueTestCase, SnubaTestCase, TestCase
@@ -85,6 +90,7 @@ from sentry.uptime.utils import get_cluster
 from sentry.users.services.user.service import user_service
 from sentry.utils import json
 from sentry.utils.cache import cache
+from sentry.utils.concurrent import ContextPropagatingThreadPoolExecutor
 from sentry.utils.sdk_crashes.sdk_crash_detection_config import SdkName
 from tests.sentry.issues.test_utils import OccurrenceTestMixin
 
@@ -181,6 +187,227 @@ class SiemSecurityLoggingTest(TestCase):
         assert calls == [{}]
 
 
+class PipelineLevelsTest(TestCase):
+    def test_error_pipeline_levels(self) -> None:
+        pipeline = tuple(GROUP_CATEGORY_POST_PROCESS_PIPELINE[GroupCategory.ERROR])
+        levels = [
+            [step.__name__ for step in level]
+            for level in post_process_module._get_pipeline_levels(pipeline)
+        ]
+        step_levels = {name: index for index, level in enumerate(levels) for name in level}
+
+        # Every step runs exactly once
+        assert sorted(step_levels) == sorted(step.__name__ for step in pipeline)
+        # Steps that update group state stay sequential and run first
+        assert levels[:5] == [
+            ["_capture_group_stats"],
+            ["process_snoozes"],
+            ["process_inbox_adds"],
+            ["process_malicious_issue_detection"],
+            ["detect_new_escalation"],
+        ]
+        assert levels[5] == ["process_commits", "handle_owner_assignment"]
+        assert levels[6] == ["handle_auto_assignment"]
+        # Listed steps never jump ahead of an unlisted step which precedes them in the pipeline,
+        # and unlisted steps run after everything which precedes them
+        for index, step in enumerate(pipeline):
+            for earlier_step in pipeline[:index]:
+                if (
+                    step.__name__ not in post_process_module.POST_PROCESS_STAGE_DEPENDENCIES
+                    or earlier_step.__name__
+                    not in post_process_module.POST_PROCESS_STAGE_DEPENDENCIES
+                ):
+                    assert step_levels[step.__name__] > step_levels[earlier_step.__name__]
+        assert step_levels["process_similarity"] > step_levels["process_plugins"]
+        assert (
+            step_levels["process_code_mappings"]
+            == step_levels["process_similarity"]
+            == step_levels["process_processing_issue_detection"]
+        )
+
+    def test_run_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+        calls = []
+
+        def first(job: Any) -> None:
+            calls.append("first")
+
+        def left(job: Any) -> None:
+            # Blocks until `right` runs in parallel
+            barrier.wait()
+            calls.append("left")
+
+        def right(job: Any) -> None:
+            barrier.wait()
+            calls.append("right")
+
+        def halt(job: Any) -> None:
+            job["halt_post_process"] = True
+
+        def last(job: Any) -> None:
+            calls.append("last")
+
+        with (
+            patch.object(
+                post_process_module,
+                "GENERIC_POST_PROCESS_PIPELINE",
+                [first, left, right, halt, last],
+            ),
+            patch.dict(
+                post_process_module.POST_PROCESS_STAGE_DEPENDENCIES,
+                {"left": frozenset(["first"]), "right": frozenset(["first"])},
+            ),
+            override_options({"post_process.pipeline.max-workers": 2}),
+        ):
+            post_process_module._get_pipeline_levels.cache_clear()
+            try:
+                run_post_process_job({"event": MagicMock(group=None), "is_reprocessed": False})
+            finally:
+                post_process_module._get_pipeline_levels.cache_clear()
+
+        assert calls[0] == "first"
+        assert sorted(calls[1:]) == ["left", "right"]
+
+    def test_closes_old_connections_around_concurrent_steps(self) -> None:
+        def left(job: Any) -> None:
+            pass
+
+        def right(job: Any) -> None:
+            pass
+
+        with (
+            patch.object(post_process_module, "GENERIC_POST_PROCESS_PIPELINE", [left, right]),
+            patch.dict(
+                post_process_module.POST_PROCESS_STAGE_DEPENDENCIES,
+                {"left": frozenset(), "right": frozenset()},
+            ),
+            override_options({"post_process.pipeline.max-workers": 2}),
+            patch("sentry.tasks.post_process.close_old_connections") as mock_close,
+        ):
+            post_process_module._get_pipeline_levels.cache_clear()
+            try:
+                run_post_process_job({"event": MagicMock(group=None), "is_reprocessed": False})
+            finally:
+                post_process_module._get_pipeline_levels.cache_clear()
+
+        # Once before and once after each step run on the executor
+        assert mock_close.call_count == 4
+
+    def test_halt_in_concurrent_level(self) -> None:
+        calls = []
+
+        def reappear(job: Any) -> None:
+            job["has_reappeared"] = True
+
+        def halt(job: Any) -> None:
+            job["halt_post_process"] = True
+
+        def last(job: Any) -> None:
+            calls.append("last")
+
+        job: Any = {"event": MagicMock(group=None), "is_reprocessed": False}
+        with (
+            patch.object(
+                post_process_module, "GENERIC_POST_PROCESS_PIPELINE", [reappear, halt, last]
+            ),
+            patch.dict(
+                post_process_module.POST_PROCESS_STAGE_DEPENDENCIES,
+                {"reappear": frozenset(), "halt": frozenset()},
+            ),
+            override_options({"post_process.pipeline.max-workers": 2}),
+            patch("sentry.tasks.post_process.metrics.incr") as mock_incr,
+        ):
+            post_process_module._get_pipeline_levels.cache_clear()
+            try:
+                run_post_process_job(job)
+            finally:
+                post_process_module._get_pipeline_levels.cache_clear()
+
+        assert calls == []
+        # Keys set by the steps of the level are merged back into the job
+        assert job["has_reappeared"] is True
+        assert job["halt_post_process"] is True
+        mock_incr.assert_any_call(
+            "sentry.tasks.post_process.post_process_group.halted",
+            tags={"issue_category": None, "pipeline": "halt"},
+        )
+
+    def test_halt_skips_steps_that_have_not_started(self) -> None:
+        calls = []
+
+        def halt(job: Any) -> None:
+            job["halt_post_process"] = True
+
+        def skipped(job: Any) -> None:
+            calls.append("skipped")
+
+        with (
+            patch.object(post_process_module, "GENERIC_POST_PROCESS_PIPELINE", [halt, skipped]),
+            patch.dict(
+                post_process_module.POST_PROCESS_STAGE_DEPENDENCIES,
+                {"halt": frozenset(), "skipped": frozenset()},
+            ),
+            # A single worker runs the level's steps one after another
+            patch.object(
+                post_process_module,
+                "_get_pipeline_executor",
+                lambda max_workers: ContextPropagatingThreadPoolExecutor(max_workers=1),
+            ),
+            override_options({"post_process.pipeline.max-workers": 2}),
+        ):
+            post_process_module._get_pipeline_levels.cache_clear()
+            try:
+                run_post_process_job({"event": MagicMock(group=None), "is_reprocessed": False})
+            finally:
+                post_process_module._get_pipeline_levels.cache_clear()
+
+        assert calls == []
+
+
+class PipelineStepInstrumentationTest(TestCase):
+    def test_step_hook_and_metrics(self) -> None:
+        wrapped = []
+
+        @contextmanager
+        def hook(step_name: str, job: Any) -> Generator[None]:
+            wrapped.append(step_name)
+            yield
+
+        def query_step(job: Any) -> None:
+            assert Project.objects.filter(id=self.project.id).exists()
+            cache.set("post-process-test:hit", 1)
+            assert cache.get("post-process-test:hit") == 1
+            assert cache.get("post-process-test:miss") is None
+            assert cache.get_many(["post-process-test:hit", "post-process-test:miss"]) == {
+                "post-process-test:hit": 1
+            }
+
+        set_pipeline_step_hook(hook)
+        try:
+            with (
+                patch.object(post_process_module, "GENERIC_POST_PROCESS_PIPELINE", [query_step]),
+                override_options({"post_process.pipeline.step-metrics.sample-rate": 1.0}),
+                patch("sentry.tasks.post_process.metrics.distribution") as mock_distribution,
+                patch("sentry.tasks.post_process.metrics.incr") as mock_incr,
+            ):
+                run_post_process_job({"event": MagicMock(group=None), "is_reprocessed": False})
+        finally:
+            set_pipeline_step_hook(post_process_module._noop_pipeline_step_hook)
+
+        assert wrapped == ["query_step"]
+        distributions = {call.args[0]: call for call in mock_distribution.call_args_list}
+        cpu_time = distributions["tasks.post_process.run_post_process_job.pipeline.cpu_time"]
+        assert cpu_time.kwargs["tags"]["pipeline"] == "query_step"
+        db_queries = distributions["tasks.post_process.run_post_process_job.pipeline.db_queries"]
+        assert db_queries.args[1] == 1
+        cache_lookups = {
+            call.kwargs["tags"]["result"]: call.kwargs["amount"]
+            for call in mock_incr.call_args_list
+            if call.args[0] == "tasks.post_process.run_post_process_job.pipeline.cache"
+        }
+        assert cache_lookups == {"hit": 2, "miss": 2}
+
+
 class BasePostProcessGroupMixin(BaseTestCase, metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def create_event(self, data, project_id, assert_no_errors=True):
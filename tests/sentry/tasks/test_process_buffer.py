@@ -3,8 +3,9 @@ from unittest import mock
 import pytest
 
 from sentry.models.group import Group
-from sentry.tasks.process_buffer import process_incr, process_pending
+from sentry.tasks.process_buffer import process_incr, process_pending, process_pending_partition
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 
 
 class ProcessIncrTest(TestCase):
@@ -30,3 +31,20 @@ class ProcessPendingTest(TestCase):
         process_pending()
         assert len(mock_process_pending.mock_calls) == 1
         mock_process_pending.assert_any_call()
+
+    @override_options({"buffer.process-pending.num-partitions": 3})
+    @mock.patch("sentry.tasks.process_buffer.process_pending_partition.apply_async")
+    def test_fans_out_to_partitions(self, mock_apply_async: mock.MagicMock) -> None:
+        process_pending()
+        assert mock_apply_async.call_args_list == [
+            mock.call(
+                kwargs={"partition": partition, "num_partitions": 3},
+                headers={"sentry-propagate-traces": False},
+            )
+            for partition in range(3)
+        ]
+
+    @mock.patch("sentry.buffer.backend.process_pending")
+    def test_partition(self, mock_process_pending: mock.MagicMock) -> None:
+        process_pending_partition(partition=1, num_partitions=3)
+        mock_process_pending.assert_called_once_with(partition=1, num_partitions=3)
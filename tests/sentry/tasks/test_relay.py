@@ -4,8 +4,11 @@ from unittest import mock
 import pytest
 from django.db import connections, router, transaction
 from django.db.transaction import TransactionManagementError
+from django.test.utils import CaptureQueriesContext
 
+from sentry import quotas
 from sentry.db.postgres.transactions import in_test_hide_transaction_boundary
+from sentry.models.options.organization_option import OrganizationOption
 from sentry.models.options.project_option import ProjectOption
 from sentry.models.projectkey import ProjectKey, ProjectKeyStatus
 from sentry.relay.projectconfig_cache.redis import RedisProjectConfigCache
@@ -13,6 +16,7 @@ from sentry.relay.projectconfig_debounce_cache.redis import RedisProjectConfigDe
 from sentry.tasks.relay import (
     _schedule_invalidate_project_config,
     build_project_config,
+    compute_organization_configs,
     invalidate_project_config,
     schedule_build_project_config,
     schedule_invalidate_project_config,
@@ -86,6 +90,7 @@ def redis_cache():
         mock.patch("sentry.relay.projectconfig_cache.set_many", cache.set_many),
         mock.patch("sentry.relay.projectconfig_cache.delete_many", cache.delete_many),
         mock.patch("sentry.relay.projectconfig_cache.get", cache.get),
+        mock.patch("sentry.relay.projectconfig_cache.backend.exists_many", cache.exists_many),
     ):
         yield cache
 
@@ -459,6 +464,91 @@ class TestInvalidationTask:
             assert new_cfg is not None
             assert new_cfg != cfg
 
+    def test_invalidate_org_multiple_keys(
+        self,
+        default_project,
+        default_organization,
+        default_projectkey,
+        factories,
+        redis_cache,
+        task_runner,
+        django_cache,
+    ):
+        other_project = factories.create_project(organization=default_organization)
+        other_key = ProjectKey.objects.create(project=other_project)
+        second_key = ProjectKey.objects.create(project=default_project)
+        inactive_key = ProjectKey.objects.create(
+            project=default_project, status=ProjectKeyStatus.INACTIVE
+        )
+        uncached_key = ProjectKey.objects.create(project=default_project)
+
+        cfg = {"dummy-key": "val"}
+        redis_cache.set_many(
+            {
+                key.public_key: cfg
+                for key in (default_projectkey, second_key, inactive_key, other_key)
+            }
+        )
+
+        with task_runner():
+            schedule_invalidate_project_config(
+                organization_id=default_organization.id, trigger="test"
+            )
+
+        assert redis_cache.get(uncached_key.public_key) is None
+        assert redis_cache.get(inactive_key.public_key) == {"disabled": True}
+
+        revs = set()
+        for key in (default_projectkey, second_key, other_key):
+            new_cfg = redis_cache.get(key.public_key)
+            assert new_cfg["disabled"] is False
+            assert new_cfg["projectId"] == key.project_id
+            assert [pk["publicKey"] for pk in new_cfg["publicKeys"]] == [key.public_key]
+            revs.add(new_cfg["rev"])
+        assert len(revs) == 3
+
+    def test_compute_organization_configs_loads_organization_inputs_once(
+        self,
+        default_organization,
+        factories,
+        redis_cache,
+        django_cache,
+    ):
+        def compute(project_count):
+            keys = [
+                ProjectKey.objects.create(
+                    project=factories.create_project(organization=default_organization)
+                )
+                for _ in range(project_count)
+            ]
+            redis_cache.set_many({key.public_key: {"dummy-key": "val"} for key in keys})
+
+            connection = connections[router.db_for_read(OrganizationOption)]
+            with (
+                CaptureQueriesContext(connection) as ctx,
+                mock.patch.object(
+                    quotas.backend,
+                    "get_event_retention",
+                    wraps=quotas.backend.get_event_retention,
+                ) as get_event_retention,
+            ):
+                configs = compute_organization_configs(default_organization)
+
+            assert all(configs[key.public_key]["disabled"] is False for key in keys)
+            organization_queries = [
+                query
+                for query in ctx.captured_queries
+                if "sentry_organizationoptions" in query["sql"]
+                or '"sentry_organization"' in query["sql"]
+            ]
+            return len(organization_queries), get_event_retention.call_count
+
+        # The second run recomputes the configs of six projects instead of one
+        single_project = compute(1)
+        many_projects = compute(5)
+        assert single_project == many_projects
+        assert many_projects[1] == 1
+
     @mock.patch(
         "sentry.tasks.relay._schedule_invalidate_project_config",
         wraps=_schedule_invalidate_project_config,
@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+from types import ModuleType
+
+import pytest
+
+from sentry.testutils.helpers.options import override_options
+from sentry.testutils.skips import requires_pytest_benchmark
+from sentry.tsdb.base import ONE_DAY, ONE_HOUR, TSDBModel
+from sentry.tsdb.redis import RedisTSDB
+
+NUM_SOURCES = 150
+MODEL = TSDBModel.frequent_issues_by_project
+
+
+@pytest.fixture
+def tsdb():
+    with override_options(
+        {"redis.clusters": {"tsdb": {"hosts": {i - 6: {"db": i} for i in range(6, 9)}}}}
+    ):
+        db = RedisTSDB(
+            rollups=((ONE_HOUR, 24), (ONE_DAY, 30)),
+            enable_frequency_sketches=True,
+            cluster="tsdb",
+        )
+    yield db
+    with db.cluster.all() as client:
+        client.flushdb()
+
+
+def _record_sources(db: RedisTSDB, now: datetime) -> list[str]:
+    sources = [f"organization:{i}" for i in range(1, NUM_SOURCES + 1)]
+    db.record_frequency_multi(
+        [
+            (MODEL, {source: {f"project:{j}": j + 1 for j in range(i % 20, i % 20 + 60)}})
+            for i, source in enumerate(sources)
+        ],
+        now,
+    )
+    return sources
+
+
+@requires_pytest_benchmark
+def test_benchmark_merge_frequencies(benchmark: ModuleType, tsdb: RedisTSDB) -> None:
+    now = datetime.now(timezone.utc)
+
+    def setup():
+        return (MODEL, "organization:0", _record_sources(tsdb, now), now), {}
+
+    benchmark.pedantic(tsdb.merge_frequencies, setup=setup, rounds=5)
+
+    results = tsdb.get_frequency_series(
+        MODEL, {"organization:0": ["project:0"]}, now, now, rollup=ONE_HOUR
+    )
+    assert results["organization:0"][0][1]["project:0"] > 0
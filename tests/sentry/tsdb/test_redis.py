@@ -191,6 +191,33 @@ class RedisTSDBTest(TestCase):
         )
         assert sum_results == {1: 0, 2: 0}
 
+    def test_get_range_counts(self) -> None:
+        now = datetime.now(timezone.utc) - timedelta(hours=4)
+        dts = [now + timedelta(hours=i) for i in range(4)]
+        keys = list(range(1, 200)) + ["foo"]
+
+        for i, key in enumerate(keys):
+            self.db.incr(TSDBModel.group, key, dts[i % 4], count=i + 1)
+
+        counts = self.db.get_range_counts(TSDBModel.group, keys + [1], dts[0], dts[-1])
+        assert counts.keys == keys
+        assert len(counts.values) == len(keys) * 4
+        assert counts.to_dict() == {
+            key: [
+                (int(dt.timestamp()) - int(dt.timestamp()) % 3600, i + 1 if i % 4 == j else 0)
+                for j, dt in enumerate(dts)
+            ]
+            for i, key in enumerate(keys)
+        }
+        assert counts.to_dict() == self.db.get_range(TSDBModel.group, keys, dts[0], dts[-1])
+        assert counts.totals() == {key: i + 1 for i, key in enumerate(keys)}
+
+        self.db.incr(TSDBModel.group, 1, dts[3], count=5, environment_id=1)
+        counts = self.db.get_range_counts(
+            TSDBModel.group, [1, 2], dts[0], dts[-1], environment_id=1
+        )
+        assert counts.totals() == {1: 5, 2: 0}
+
     def test_count_distinct(self) -> None:
         now = datetime.now(timezone.utc) - timedelta(hours=4)
         dts = [now + timedelta(hours=i) for i in range(4)]
@@ -422,6 +449,52 @@ class RedisTSDBTest(TestCase):
             environment_ids=[0, 1],
         )
 
+    def test_merge_frequencies_many_sources(self) -> None:
+        self._test_merge_frequencies_many_sources()
+
+    def test_merge_frequencies_many_sources_in_batches(self) -> None:
+        with override_options({"tsdb.redis.frequency-merge-batch-size": 4}):
+            self._test_merge_frequencies_many_sources()
+
+    def _test_merge_frequencies_many_sources(self) -> None:
+        now = datetime.now(timezone.utc)
+        model = TSDBModel.frequent_issues_by_project
+        sources = [f"organization:{i}" for i in range(2, 32)]
+
+        self.db.record_frequency_multi(
+            ((model, {"organization:1": {"project:0": 1}}),), now - timedelta(hours=1)
+        )
+        for i, source in enumerate(sources):
+            self.db.record_frequency_multi(
+                ((model, {source: {"project:0": 1, f"project:{i + 1}": i + 1}}),), now
+            )
+
+        router = self.db.cluster.get_router()
+        source_hosts = {router.get_host_for_key(source) for source in sources}
+        # Make sure both the server-side merge and the export/import paths are exercised.
+        assert router.get_host_for_key("organization:1") in source_hosts
+        assert len(source_hosts) > 1
+
+        self.db.merge_frequencies(model, "organization:1", sources, now)
+
+        members = ["project:0", "project:1", "project:30"]
+        results = self.db.get_frequency_series(
+            model,
+            {"organization:1": members, sources[0]: members},
+            now - timedelta(hours=1),
+            now,
+            rollup=3600,
+        )
+        timestamp = int(now.timestamp()) // 3600 * 3600
+        assert results["organization:1"] == [
+            (timestamp - 3600, {"project:0": 1.0, "project:1": 0.0, "project:30": 0.0}),
+            (timestamp, {"project:0": 30.0, "project:1": 1.0, "project:30": 30.0}),
+        ]
+        assert results[sources[0]] == [
+            (timestamp - 3600, {"project:0": 0.0, "project:1": 0.0, "project:30": 0.0}),
+            (timestamp, {"project:0": 0.0, "project:1": 0.0, "project:30": 0.0}),
+        ]
+
     def test_frequency_table_import_export_no_estimators(self) -> None:
         client = self.db.cluster.get_local_client_for_key("key")
 
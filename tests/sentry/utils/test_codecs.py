@@ -1,8 +1,18 @@
+import threading
+from collections.abc import Mapping
 from typing import Any
 
 import pytest
+import zstandard
 
-from sentry.utils.codecs import BytesCodec, Codec, JSONCodec, ZlibCodec, ZstdCodec
+from sentry.utils.codecs import (
+    BytesCodec,
+    Codec,
+    ColumnarResultCodec,
+    JSONCodec,
+    ZlibCodec,
+    ZstdCodec,
+)
 
 
 @pytest.mark.parametrize(
@@ -24,3 +34,87 @@ def test_codec_chaining() -> None:
 
     assert codec.encode([1, 2, 3]) == b"[1,2,3]"
     assert codec.decode(b"[1,2,3]") == [1, 2, 3]
+
+
+def test_zstd_codec_dictionary() -> None:
+    samples = [b'{"platform":"python","message":"hello %d"}' % i for i in range(1000)]
+    dictionary = zstandard.train_dictionary(1024, samples)
+    codec = ZstdCodec(dictionary)
+
+    encoded = codec.encode(samples[0])
+    assert zstandard.get_frame_parameters(encoded).dict_id == dictionary.dict_id()
+    assert len(encoded) < len(ZstdCodec().encode(samples[0]))
+    assert codec.decode(encoded) == samples[0]
+
+    with pytest.raises(zstandard.ZstdError):
+        ZstdCodec().decode(encoded)
+
+
+@pytest.mark.parametrize(
+    "codec", [ZlibCodec(), ZlibCodec(level=9), ZstdCodec(), ZstdCodec(level=19)]
+)
+def test_codec_streaming(codec: ZlibCodec | ZstdCodec) -> None:
+    chunks = [b"hello world %d " % i * 100 for i in range(100)]
+
+    encoded = b"".join(codec.encode_iter(iter(chunks)))
+    encoded_chunks = [encoded[i : i + 1000] for i in range(0, len(encoded), 1000)]
+    assert b"".join(codec.decode_iter(encoded_chunks)) == b"".join(chunks)
+
+    # Values encoded in one go can be decoded in a streaming fashion too
+    assert b"".join(codec.decode_iter([codec.encode(b"".join(chunks))])) == b"".join(chunks)
+
+
+def test_zstd_codec_reuses_contexts() -> None:
+    codec = ZstdCodec()
+    assert codec.compressor is codec.compressor
+    assert codec.decompressor is codec.decompressor
+
+    compressors = []
+    thread = threading.Thread(target=lambda: compressors.append(codec.compressor))
+    thread.start()
+    thread.join()
+    assert compressors[0] is not codec.compressor
+
+    for value in (b"hello", b"world" * 1000, b""):
+        assert codec.decode(codec.encode(value)) == value
+
+
+def test_zstd_codec_streaming_interleaved_with_one_shot() -> None:
+    codec = ZstdCodec()
+    # Large enough that the encoder yields before it has consumed all chunks.
+    chunks = [b"hello world %d " % i * 100 for i in range(1000)]
+
+    encoder = codec.encode_iter(iter(chunks))
+    encoded = [next(encoder)]
+    assert codec.decode(codec.encode(b"interleaved")) == b"interleaved"
+    encoded.extend(encoder)
+
+    decoder = codec.decode_iter(encoded)
+    decoded = [next(decoder)]
+    assert codec.decode(codec.encode(b"interleaved")) == b"interleaved"
+    decoded.extend(decoder)
+
+    assert b"".join(decoded) == b"".join(chunks)
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        {
+            "data": [
+                {"time": 1700000000, "count": 3, "p95": 12.5, "transaction": "/api/0/", "n": None},
+                {"time": 1700000060, "count": 0, "p95": 0.0, "transaction": "/api/1/", "n": 1.5},
+            ],
+            "meta": [{"name": "time", "type": "UInt32"}],
+            "totals": {"count": 3},
+        },
+        {"data": [{"big": 2**70, "flag": True}, {"big": 1, "flag": False}]},
+        {"data": [{"a": 1}, {"b": 2}]},
+        {"data": [{}, {}]},
+        {"data": [], "meta": []},
+        {"meta": []},
+    ],
+)
+def test_columnar_result_codec(result: Mapping[str, Any]) -> None:
+    codec = ColumnarResultCodec()
+    assert codec.decode(codec.encode(result)) == result
@@ -0,0 +1,58 @@
+from collections.abc import Callable
+from types import ModuleType
+
+import pytest
+import zstandard
+
+from sentry.testutils.skips import requires_pytest_benchmark
+from sentry.utils import json
+from sentry.utils.codecs import ZlibCodec, ZstdCodec
+
+pytestmark = requires_pytest_benchmark
+
+SMALL_PAYLOAD = json.dumps({"project_id": 1, "event_id": "a" * 32}).encode()
+LARGE_PAYLOAD = json.dumps(
+    {"frames": [{"filename": f"app/module_{i}.py", "lineno": i} for i in range(20_000)]}
+).encode()
+
+CODECS: dict[str, Callable[[], ZlibCodec | ZstdCodec]] = {
+    "zlib": ZlibCodec,
+    "zstd": ZstdCodec,
+}
+
+
+@pytest.mark.parametrize("payload", [SMALL_PAYLOAD, LARGE_PAYLOAD], ids=["small", "large"])
+@pytest.mark.parametrize("codec_name", list(CODECS))
+def test_benchmark_codec_encode(benchmark: ModuleType, codec_name: str, payload: bytes) -> None:
+    codec = CODECS[codec_name]()
+    encoded = benchmark(codec.encode, payload)
+    assert codec.decode(encoded) == payload
+
+
+@pytest.mark.parametrize("payload", [SMALL_PAYLOAD, LARGE_PAYLOAD], ids=["small", "large"])
+@pytest.mark.parametrize("codec_name", list(CODECS))
+def test_benchmark_codec_decode(benchmark: ModuleType, codec_name: str, payload: bytes) -> None:
+    codec = CODECS[codec_name]()
+    encoded = codec.encode(payload)
+    assert benchmark(codec.decode, encoded) == payload
+
+
+@pytest.mark.parametrize("payload", [SMALL_PAYLOAD, LARGE_PAYLOAD], ids=["small", "large"])
+def test_benchmark_zstd_encode_fresh_context(benchmark: ModuleType, payload: bytes) -> None:
+    """
+    Baseline for `test_benchmark_codec_encode[zstd]`: the per-call overhead of
+    setting up a new compression context for each value.
+    """
+    encoded = benchmark(lambda: zstandard.ZstdCompressor().compress(payload))
+    assert ZstdCodec().decode(encoded) == payload
+
+
+@pytest.mark.parametrize("codec_name", list(CODECS))
+def test_benchmark_codec_streaming_roundtrip(benchmark: ModuleType, codec_name: str) -> None:
+    codec = CODECS[codec_name]()
+    chunks = [LARGE_PAYLOAD[i : i + 65536] for i in range(0, len(LARGE_PAYLOAD), 65536)]
+
+    def roundtrip() -> bytes:
+        return b"".join(codec.decode_iter(codec.encode_iter(chunks)))
+
+    assert benchmark(roundtrip) == LARGE_PAYLOAD
@@ -59,6 +59,14 @@ class TestLRUCache:
         cache: LRUCache[str, int] = LRUCache(maxlen=2)
         assert cache.pop("missing") is None
 
+    def test_popitem_evicts_least_recently_used(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(maxlen=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["a"]
+        assert cache.popitem() == ("b", 2)
+        assert list(cache.keys()) == ["a"]
+
     def test_eviction_when_over_maxlen(self) -> None:
         cache: LRUCache[str, int] = LRUCache(maxlen=2)
         cache["a"] = 1
@@ -1,8 +1,10 @@
 import unittest
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 from unittest import mock
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 from snuba_sdk import Column, Condition, Entity, Function, Op, Query, Request
 from urllib3 import HTTPConnectionPool
@@ -15,7 +17,8 @@ from sentry.models.project import Project
 from sentry.models.release import Release
 from sentry.snuba.dataset import Dataset
 from sentry.testutils.cases import TestCase
-from sentry.utils import json
+from sentry.testutils.helpers.options import override_options
+from sentry.utils import json, snuba
 from sentry.utils.snuba import (
     ROUND_UP,
     RateLimitExceeded,
@@ -23,8 +26,12 @@ from sentry.utils.snuba import (
     SnubaQueryParams,
     SnubaRequest,
     UnqualifiedQueryError,
+    _apply_cache_and_build_results,
     _bulk_snuba_query,
+    _decode_cached_result,
+    _encode_cached_result,
     _prepare_query_params,
+    get_cache_key,
     get_json_type,
     get_query_params_to_update_for_projects,
     get_snuba_column_name,
@@ -754,3 +761,118 @@ class SnubaQueryRateLimitTest(TestCase):
             _bulk_snuba_query([make_request("ok"), make_request("rate_limited")])
 
         assert mock.call("allocation_policy.is_successful", True) not in mock_set_tag.call_args_list
+
+
+class SnubaQueryCacheSingleFlightTest(TestCase):
+    def setUp(self) -> None:
+        self.snuba_request = SnubaRequest(
+            request=Request(
+                dataset="events",
+                app_id="test",
+                query=Query(
+                    match=Entity("events"),
+                    select=[Function("count", parameters=[], alias="count")],
+                    where=[Condition(Column("project_id"), Op.EQ, self.project.id)],
+                ),
+            ),
+            referrer="test_referrer",
+            forward=lambda x: x,
+            reverse=lambda x: x,
+        )
+        self.cache_key = get_cache_key(self.snuba_request.request)
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_leader_populates_cache(self, mock_bulk_snuba_query: mock.MagicMock) -> None:
+        mock_bulk_snuba_query.return_value = [{"data": [{"count": 1}]}]
+
+        with override_options(
+            {
+                "snuba.query-cache.single-flight.enabled": True,
+                "snuba.query-cache.lease-seconds": 5,
+                "snuba.query-cache.stale-seconds": 60,
+            }
+        ):
+            result = _apply_cache_and_build_results([self.snuba_request], use_cache=True)
+
+        assert result == [{"data": [{"count": 1}]}]
+        assert mock_bulk_snuba_query.call_count == 1
+        assert json.loads(cache.get(self.cache_key)) == {"data": [{"count": 1}]}
+        assert json.loads(cache.get(f"{self.cache_key}:stale")) == {"data": [{"count": 1}]}
+        assert cache.get(f"{self.cache_key}:lease") is None
+        assert self.cache_key not in snuba._inflight_queries
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_follows_inflight_query(self, mock_bulk_snuba_query: mock.MagicMock) -> None:
+        future: Future[str | bytes] = Future()
+        future.set_result(json.dumps({"data": [{"count": 2}]}))
+
+        with (
+            override_options({"snuba.query-cache.single-flight.enabled": True}),
+            mock.patch.dict(snuba._inflight_queries, {self.cache_key: future}),
+        ):
+            result = _apply_cache_and_build_results(
+                [self.snuba_request, self.snuba_request], use_cache=True
+            )
+
+        assert result == [{"data": [{"count": 2}]}, {"data": [{"count": 2}]}]
+        assert result[0] is not result[1]
+        assert mock_bulk_snuba_query.call_count == 0
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_serves_stale_result_while_leased(self, mock_bulk_snuba_query: mock.MagicMock) -> None:
+        cache.set(f"{self.cache_key}:lease", 1, 5)
+        cache.set(f"{self.cache_key}:stale", json.dumps({"data": [{"count": 3}]}), 60)
+
+        with override_options(
+            {
+                "snuba.query-cache.single-flight.enabled": True,
+                "snuba.query-cache.lease-seconds": 5,
+                "snuba.query-cache.stale-seconds": 60,
+            }
+        ):
+            result = _apply_cache_and_build_results([self.snuba_request], use_cache=True)
+
+        assert result == [{"data": [{"count": 3}]}]
+        assert mock_bulk_snuba_query.call_count == 0
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_queries_after_lease_timeout(self, mock_bulk_snuba_query: mock.MagicMock) -> None:
+        mock_bulk_snuba_query.return_value = [{"data": [{"count": 4}]}]
+        cache.set(f"{self.cache_key}:lease", 1, 5)
+
+        with override_options(
+            {"snuba.query-cache.single-flight.enabled": True, "snuba.query-cache.lease-seconds": 1}
+        ):
+            result = _apply_cache_and_build_results([self.snuba_request], use_cache=True)
+
+        assert result == [{"data": [{"count": 4}]}]
+        assert mock_bulk_snuba_query.call_count == 1
+
+
+def test_cached_result_encoding() -> None:
+    result = {"data": [{"count": 1, "p95": 2.5}], "meta": []}
+
+    encoded = _encode_cached_result(result)
+    assert isinstance(encoded, str)
+    assert _decode_cached_result(encoded) == result
+
+    with override_options({"snuba.query-cache.columnar-encoding": True}):
+        encoded = _encode_cached_result(result)
+    assert isinstance(encoded, bytes)
+    assert _decode_cached_result(encoded) == result
+
+
+@override_options({"snuba.query-cache.columnar-encoding": True})
+def test_columnar_cached_result_is_smaller() -> None:
+    result = {
+        "data": [
+            {"time": 1700000000 + i * 60, "count": i % 97, "release": None if i % 3 else "1.0"}
+            for i in range(1_000)
+        ],
+        "meta": [
+            {"name": "time", "type": "UInt32"},
+            {"name": "count", "type": "UInt64"},
+            {"name": "release", "type": "Nullable(String)"},
+        ],
+    }
+    assert len(_encode_cached_result(result)) < len(json.dumps(result))
@@ -0,0 +1,73 @@
+from types import ModuleType
+
+import pytest
+
+from sentry.testutils.helpers.options import override_options
+from sentry.testutils.skips import requires_pytest_benchmark
+from sentry.utils.snuba import _decode_cached_result, _encode_cached_result
+
+pytestmark = requires_pytest_benchmark
+
+# Shaped like the responses of the Discover events-stats (timeseries) and
+# top-N table endpoints.
+TIMESERIES_RESULT = {
+    "data": [
+        {
+            "time": 1700000000 + i * 60,
+            "count": i % 97,
+            "p95_transaction_duration": 120.5 + (i % 13) * 3.25,
+            "failure_rate": (i % 7) / 100,
+        }
+        for i in range(10_000)
+    ],
+    "meta": [
+        {"name": "time", "type": "UInt32"},
+        {"name": "count", "type": "UInt64"},
+        {"name": "p95_transaction_duration", "type": "Float64"},
+        {"name": "failure_rate", "type": "Float64"},
+    ],
+}
+TOP_N_RESULT = {
+    "data": [
+        {
+            "transaction": f"/api/0/organizations/{{organization_id_or_slug}}/endpoint-{i}/",
+            "project_id": i % 20,
+            "count": 1000 - i,
+            "p50_transaction_duration": 50.0 + i,
+            "release": None if i % 3 else f"backend@{i}",
+        }
+        for i in range(1_000)
+    ],
+    "meta": [
+        {"name": "transaction", "type": "String"},
+        {"name": "project_id", "type": "UInt64"},
+        {"name": "count", "type": "UInt64"},
+        {"name": "p50_transaction_duration", "type": "Float64"},
+        {"name": "release", "type": "Nullable(String)"},
+    ],
+}
+RESULTS = {"timeseries": TIMESERIES_RESULT, "top_n": TOP_N_RESULT}
+
+
+@pytest.mark.parametrize("result_name", list(RESULTS))
+@pytest.mark.parametrize("columnar", [False, True], ids=["json", "columnar"])
+def test_benchmark_cached_result_encode(
+    benchmark: ModuleType, result_name: str, columnar: bool
+) -> None:
+    result = RESULTS[result_name]
+    with override_options({"snuba.query-cache.columnar-encoding": columnar}):
+        encoded = benchmark(_encode_cached_result, result)
+    assert _decode_cached_result(encoded) == result
+    benchmark.extra_info["size"] = len(encoded)
+
+
+@pytest.mark.parametrize("result_name", list(RESULTS))
+@pytest.mark.parametrize("columnar", [False, True], ids=["json", "columnar"])
+def test_benchmark_cached_result_decode(
+    benchmark: ModuleType, result_name: str, columnar: bool
+) -> None:
+    result = RESULTS[result_name]
+    with override_options({"snuba.query-cache.columnar-encoding": columnar}):
+        encoded = _encode_cached_result(result)
+    assert benchmark(_decode_cached_result, encoded) == result
+